@@ -4,7 +4,7 @@
 import typer
 from rich.console import Console
 
-from company_os.domains.rules_service.adapters.cli.commands import rules, validate
+from company_os.domains.rules_service.adapters.cli.commands import daemon, rules, validate
 
 app = typer.Typer(help="Company OS Rules Service CLI")
 console = Console()
@@ -15,6 +15,9 @@ app.add_typer(rules.app, name="rules")
 # Add the validate command group
 app.add_typer(validate.app, name="validate")
 
+# Add the daemon command group
+app.add_typer(daemon.app, name="daemon")
+
 
 @app.command()
 def version():
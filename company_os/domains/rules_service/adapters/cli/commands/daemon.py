@@ -0,0 +1,134 @@
+"""Daemon command group for the Rules Service CLI."""
+
+import os
+import subprocess
+import sys
+import time
+import typer
+from rich.console import Console
+from rich.table import Table
+from pathlib import Path
+from typing import Optional
+
+from company_os.domains.rules_service.src.daemon_client import (
+    DaemonClient, DaemonError, DaemonUnavailable, DEFAULT_SOCKET_PATH
+)
+
+app = typer.Typer(help="Validation daemon commands")
+console = Console()
+
+# daemon.py -> commands -> cli -> adapters -> rules_service -> domains -> company_os -> the-company-os
+PROJECT_ROOT = Path(__file__).resolve().parents[6]
+
+# Seconds to wait for a detached daemon to start answering
+STARTUP_TIMEOUT = 30.0
+
+
+def _socket_option() -> Optional[Path]:
+    return typer.Option(
+        None,
+        "--socket",
+        "-s",
+        help="Unix socket of the daemon (default: .cache/rules-service.sock)"
+    )
+
+
+def _client(socket_path: Optional[Path]) -> DaemonClient:
+    return DaemonClient(socket_path or PROJECT_ROOT / DEFAULT_SOCKET_PATH)
+
+
+@app.command()
+def start(
+    socket_path: Optional[Path] = _socket_option(),
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Run in this process instead of detaching"
+    )
+):
+    """Start the validation daemon."""
+    client = _client(socket_path)
+    if client.is_running():
+        console.print(f"[yellow]Daemon already running on {client.socket_path}[/yellow]")
+        return
+
+    if foreground:
+        # Imported here so that client-only commands stay lightweight
+        from company_os.domains.rules_service.src.daemon import RulesDaemon
+
+        daemon = RulesDaemon(PROJECT_ROOT, socket_path=client.socket_path)
+        console.print(f"[blue]Daemon listening on {client.socket_path}. Press Ctrl+C to stop.[/blue]")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            console.print(f"[red]✗[/red] Daemon failed: {e}")
+            raise typer.Exit(1)
+        console.print("[blue]Daemon stopped.[/blue]")
+        return
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    subprocess.Popen(
+        [sys.executable, "-m", "company_os.domains.rules_service.adapters.cli",
+         "daemon", "start", "--foreground", "--socket", str(client.socket_path)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    with console.status("[bold green]Starting daemon..."):
+        while time.monotonic() < deadline:
+            if client.is_running():
+                console.print(f"[green]✓[/green] Daemon started on {client.socket_path}")
+                return
+            time.sleep(0.1)
+
+    console.print("[red]✗[/red] Daemon did not start; run 'daemon start --foreground' to see why")
+    raise typer.Exit(1)
+
+
+@app.command()
+def stop(socket_path: Optional[Path] = _socket_option()):
+    """Stop the validation daemon."""
+    client = _client(socket_path)
+    try:
+        client.shutdown()
+    except (DaemonUnavailable, DaemonError):
+        console.print("[yellow]No daemon running.[/yellow]")
+        return
+    console.print("[green]✓[/green] Daemon stopped")
+
+
+@app.command()
+def status(socket_path: Optional[Path] = _socket_option()):
+    """Show whether the daemon is running and what it holds."""
+    client = _client(socket_path)
+    try:
+        info = client.status()
+    except (DaemonUnavailable, DaemonError):
+        console.print("[yellow]No daemon running.[/yellow]")
+        raise typer.Exit(1)
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Property", style="cyan")
+    table.add_column("Value")
+
+    table.add_row("Socket", str(client.socket_path))
+    table.add_row("PID", str(info["pid"]))
+    table.add_row("Repository", info["root"])
+    table.add_row("Rules loaded", str(info["rules"]))
+    table.add_row("Rules by document type", ", ".join(
+        f"{doc_type}: {count}" for doc_type, count in info.get("rules_by_document_type", {}).items()
+    ))
+    table.add_row("Rule watcher", str(info["watcher"]))
+    table.add_row("Cached results", str(info["cached_results"]))
+    table.add_row("Cache hits", str(info["cache_hits"]))
+    table.add_row("Requests served", str(info["requests"]))
+
+    console.print(table)
@@ -133,9 +133,17 @@ def sync(
         if dry_run:
             console.print("[yellow]DRY RUN MODE - No files will be modified[/yellow]")
 
-        # Perform synchronization
-        with console.status("[bold green]Synchronizing rules...") as status:
-            result = sync_service.sync_rules(rules, dry_run=dry_run)
+            with console.status("[bold green]Planning synchronization...") as status:
+                plan = sync_service.plan(rules)
+
+            for action in plan.actions:
+                if action.action != "skip":
+                    console.print(f"  would {action.action} {action.target} ({action.reason})")
+            result = plan.to_result()
+        else:
+            # Perform synchronization
+            with console.status("[bold green]Synchronizing rules...") as status:
+                result = sync_service.sync_rules(rules)
 
         # Display results
         if result.added > 0:
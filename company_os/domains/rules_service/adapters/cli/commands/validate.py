@@ -6,11 +6,24 @@ from rich.table import Table
 from rich.progress import Progress, TaskID
 from rich.panel import Panel
 from pathlib import Path
+import fnmatch
 import glob
-from typing import List, Optional
-
-from company_os.domains.rules_service.src.validation import ValidationService, ValidationResult, ValidationIssue
-from company_os.domains.rules_service.src.discovery import RuleDiscoveryService
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
+
+from company_os.domains.rules_service.src.validation import (
+    ValidationService, ValidationResult, ValidationIssue, RuleEngine, DocumentTypeDetector
+)
+from company_os.domains.rules_service.src.config import DEFAULT_CONFIG_PATH
+from company_os.domains.rules_service.src.models import RuleDocument
+from company_os.domains.rules_service.src.watcher import FileWatcher
+from company_os.domains.rules_service.src.daemon_client import (
+    DaemonClient, DaemonError, DaemonUnavailable, DEFAULT_SOCKET_PATH
+)
+from company_os.domains.rules_service.src.discovery import RuleDiscoveryService, DEFAULT_INDEX_PATH
+from company_os.domains.rules_service.src.compiled_rules import load_or_compile, DEFAULT_SNAPSHOT_PATH
 
 app = typer.Typer(help="Document validation commands")
 console = Console()
@@ -53,13 +66,82 @@ def validate(
         True,
         "--exit-on-error/--no-exit-on-error",
         help="Exit with error code if validation issues found"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes (0 = one per CPU)"
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep running and re-validate files as they change"
+    ),
+    poll_interval: float = typer.Option(
+        0.5,
+        "--poll-interval",
+        help="Seconds between checks when file events are unavailable"
+    ),
+    use_daemon: bool = typer.Option(
+        True,
+        "--daemon/--no-daemon",
+        help="Validate in the running daemon, if any (see 'daemon start')"
     )
 ):
     """Validate markdown files against rules."""
 
-    # Expand glob patterns and collect all files
+    all_files = _collect_files(files, exit_on_error)
+
+    if not all_files and not watch:
+        console.print("[yellow]No files found to validate.[/yellow]")
+        return
+
+    try:
+        # A running daemon already holds the rules, so try it before loading
+        # them; it only knows the document types of the default configuration
+        outcomes = None
+        if use_daemon and not watch and config_path is None:
+            outcomes = _validate_with_daemon(all_files, auto_fix)
+
+        if outcomes is None:
+            validation_service, rules = _load_validation_service(config_path)
+            if all_files:
+                outcomes = _validate_files(validation_service, all_files, auto_fix, jobs)
+
+        if outcomes is not None:
+            total_errors, total_warnings = _validate_and_report(
+                all_files, outcomes, verbose, format_output, exit_on_error and not watch
+            )
+        else:
+            console.print("[yellow]No files found to validate.[/yellow]")
+            total_errors = total_warnings = 0
+
+        if watch:
+            _watch(files, validation_service, rules, auto_fix, verbose, format_output, jobs, poll_interval,
+                   config_path)
+            return
+
+        # Exit with appropriate code
+        if exit_on_error and total_errors > 0:
+            raise typer.Exit(2)  # Validation errors found
+        elif exit_on_error and total_warnings > 0:
+            raise typer.Exit(1)  # Warnings found
+
+    except typer.Exit:
+        # Re-raise typer.Exit to let it propagate normally
+        raise
+    except Exception as e:
+        console.print(f"[red]✗[/red] Validation failed: {e}")
+        if exit_on_error:
+            raise typer.Exit(3)  # General error
+
+
+def _collect_files(patterns: List[str], exit_on_error: bool = False) -> List[Path]:
+    """Expand file paths, directories and glob patterns into a sorted file list."""
     all_files = []
-    for pattern in files:
+    for pattern in patterns:
         if "*" in pattern or "?" in pattern:
             # Handle glob patterns - resolve relative to project root
             glob_pattern = str(PROJECT_ROOT / pattern)
@@ -81,113 +163,317 @@ def validate(
                 if exit_on_error:
                     raise typer.Exit(1)
 
-    if not all_files:
-        console.print("[yellow]No files found to validate.[/yellow]")
-        return
-
     # Remove duplicates and sort
-    all_files = sorted(list(set(all_files)))
+    return sorted(set(all_files))
+
+
+def _load_validation_service(
+    config_path: Optional[Path] = None,
+) -> Tuple[ValidationService, List[RuleDocument]]:
+    """
+    Discover the rules and build a validation service from their snapshot.
+
+    Args:
+        config_path: Configuration file with user-defined document types;
+            defaults to the repository's configuration, if it exists
+    """
+    # Initialize services - use project root for proper path resolution
+    discovery_service = RuleDiscoveryService(PROJECT_ROOT, index_path=PROJECT_ROOT / DEFAULT_INDEX_PATH)
+
+    # Discover rules
+    with console.status("[bold green]Loading rules...") as status:
+        rules, errors = discovery_service.discover_rules()
+
+        # Report any discovery errors
+        if errors:
+            for error in errors:
+                console.print(f"[yellow]⚠[/yellow] Rule discovery warning: {error}")
+
+    # Apply user-defined document types from the configuration, if any
+    if config_path is None:
+        config_path = PROJECT_ROOT / DEFAULT_CONFIG_PATH
+        if not config_path.exists():
+            config_path = None
+    elif not config_path.is_absolute():
+        config_path = PROJECT_ROOT / config_path
+
+    if config_path is not None:
+        try:
+            DocumentTypeDetector.load_config(config_path)
+        except ValueError as e:
+            console.print(f"[yellow]⚠[/yellow] Ignoring document types in {config_path}: {e}")
+
+    # Initialize validation service from the compiled rule snapshot
+    validation_service = load_or_compile(rules, PROJECT_ROOT / DEFAULT_SNAPSHOT_PATH)
+
+    # Report rule-load problems (e.g. invalid patterns) once per run
+    for diagnostic in validation_service.rule_diagnostics:
+        console.print(f"[yellow]⚠[/yellow] Rule load warning: {diagnostic}")
+
+    return validation_service, rules
+
+
+def _validate_files(validation_service: ValidationService, all_files: List[Path],
+                    auto_fix: bool, jobs: int) -> Iterable["FileOutcome"]:
+    """Validate files in this process, or across a process pool if jobs > 1."""
+    # Resolve worker count
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(all_files))
+
+    if jobs > 1:
+        return _validate_files_parallel(validation_service.rule_engine, all_files, auto_fix, jobs)
+    return (
+        _validate_file_safely(validation_service, file_path, auto_fix)
+        for file_path in all_files
+    )
+
 
+def _validate_with_daemon(all_files: List[Path], auto_fix: bool) -> Optional[List["FileOutcome"]]:
+    """Validate files in the running daemon, or return None if there is none."""
+    client = DaemonClient(PROJECT_ROOT / DEFAULT_SOCKET_PATH)
+    try:
+        responses = client.validate(all_files, auto_fix)["outcomes"]
+    except DaemonUnavailable:
+        return None
+    except DaemonError as e:
+        console.print(f"[yellow]⚠[/yellow] Daemon failed, validating in-process: {e}")
+        return None
+
+    return [
+        (
+            ValidationResult.from_dict(outcome["result"]) if outcome["result"] is not None else None,
+            outcome["fixes_applied"],
+            outcome["error"],
+        )
+        for outcome in responses
+    ]
+
+
+def _validate_and_report(all_files: List[Path], outcomes: Iterable["FileOutcome"],
+                         verbose: bool, format_output: str,
+                         exit_on_error: bool) -> Tuple[int, int]:
+    """Display validation outcomes and return the error and warning counts."""
     console.print(f"[blue]Validating {len(all_files)} files...[/blue]")
 
+    # Track results
+    all_results = {}
+    total_issues = 0
+    total_errors = 0
+    total_warnings = 0
+    total_fixed = 0
+
+    # Process files with progress bar
+    with Progress() as progress:
+        task = progress.add_task("[green]Validating files...", total=len(all_files))
+
+        # Outcomes arrive in input order, keeping output and exit codes deterministic
+        for file_path, (result, fixes_applied, error) in zip(all_files, outcomes):
+            if error is not None:
+                console.print(f"[red]✗[/red] Error validating {file_path}: {error}")
+                if exit_on_error:
+                    raise typer.Exit(1)
+            else:
+                total_fixed += fixes_applied
+                all_results[file_path] = result
+
+                # Count issues by severity
+                for issue in result.issues:
+                    total_issues += 1
+                    if issue.severity == "error":
+                        total_errors += 1
+                    elif issue.severity == "warning":
+                        total_warnings += 1
+
+            progress.update(task, advance=1)
+
+    # Display results
+    if format_output == "table":
+        _display_table_format(all_results, verbose)
+    elif format_output == "json":
+        _display_json_format(all_results)
+    elif format_output == "summary":
+        _display_summary_format(all_results)
+
+    # Display summary
+    if total_fixed > 0:
+        console.print(f"[green]✓[/green] Applied {total_fixed} automatic fixes")
+
+    if total_issues == 0:
+        console.print("[green]✓[/green] All files passed validation")
+    else:
+        console.print(f"[yellow]Found {total_issues} validation issues:[/yellow]")
+        if total_errors > 0:
+            console.print(f"  [red]✗[/red] {total_errors} errors")
+        if total_warnings > 0:
+            console.print(f"  [yellow]⚠[/yellow] {total_warnings} warnings")
+
+    return total_errors, total_warnings
+
+
+def _watch_roots(patterns: List[str], rules: List[RuleDocument]) -> List[Path]:
+    """Directories to watch: those holding the targets and the rule files."""
+    roots = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+
+        if "*" in pattern or "?" in pattern:
+            # Watch the part of the pattern before the first wildcard
+            parts = []
+            for part in path.parts:
+                if "*" in part or "?" in part:
+                    break
+                parts.append(part)
+            roots.append(Path(*parts))
+        elif path.is_dir():
+            roots.append(path)
+
+    roots.extend(Path(rule.file_path).resolve().parent for rule in rules if rule.file_path)
+    return roots
+
+
+def _watch_files(patterns: List[str]) -> List[Path]:
+    """Single files to watch, without the directory tree around them."""
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+
+        if "*" not in pattern and "?" not in pattern and not path.is_dir():
+            files.append(path)
+    return files
+
+
+def _is_watch_target(path: Path, patterns: List[str]) -> bool:
+    """Check whether a path is selected by the validate arguments."""
+    for pattern in patterns:
+        target = Path(pattern)
+        if not target.is_absolute():
+            target = PROJECT_ROOT / target
+
+        if "*" in pattern or "?" in pattern:
+            if fnmatch.fnmatch(str(path), str(target)):
+                return True
+        elif path == target or (path.suffix == ".md" and target in path.parents):
+            return True
+    return False
+
+
+def _watch(patterns: List[str], validation_service: ValidationService, rules: List[RuleDocument],
+           auto_fix: bool, verbose: bool, format_output: str, jobs: int,
+           poll_interval: float, config_path: Optional[Path] = None) -> None:
+    """
+    Re-validate documents as they change until interrupted.
+
+    The validation service stays in memory between runs. Only changed
+    documents are validated again; a change to a ``.rules.md`` file reloads
+    the rules and re-validates every target. Fixes written back with
+    ``--auto-fix`` do not trigger another validation.
+    """
+    watcher = FileWatcher(
+        _watch_roots(patterns, rules),
+        include=lambda path: path.suffix == ".md",
+        poll_interval=poll_interval,
+        files=_watch_files(patterns),
+    )
+    console.print(f"[blue]Watching for changes ({watcher.backend}). Press Ctrl+C to stop.[/blue]")
+
     try:
-        # Initialize services - use project root for proper path resolution
-        discovery_service = RuleDiscoveryService(PROJECT_ROOT)
-
-        # Discover rules
-        with console.status("[bold green]Loading rules...") as status:
-            rules, errors = discovery_service.discover_rules()
-
-            # Report any discovery errors
-            if errors:
-                for error in errors:
-                    console.print(f"[yellow]⚠[/yellow] Rule discovery warning: {error}")
-
-        # Initialize validation service
-        validation_service = ValidationService(rules)
-
-        # Track results
-        all_results = {}
-        total_issues = 0
-        total_errors = 0
-        total_warnings = 0
-        total_fixed = 0
-
-        # Process files with progress bar
-        with Progress() as progress:
-            task = progress.add_task("[green]Validating files...", total=len(all_files))
-
-            for file_path in all_files:
-                try:
-                    # Read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Use validate_and_fix for complete workflow
-                    validation_result = validation_service.validate_and_fix(
-                        file_path, content, auto_fix=auto_fix, add_comments=False
-                    )
-
-                    # Get the validation result and fixed content
-                    result = validation_result['validation_result']
-                    fixed_content = validation_result['fixed_content']
-                    auto_fix_log = validation_result['auto_fix_log']
-
-                    # Write back the fixed content if it changed
-                    if fixed_content != content:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(fixed_content)
-
-                        total_fixed += len(auto_fix_log)
-
-                    all_results[file_path] = result
-
-                    # Count issues by severity
-                    for issue in result.issues:
-                        total_issues += 1
-                        if issue.severity == "error":
-                            total_errors += 1
-                        elif issue.severity == "warning":
-                            total_warnings += 1
-
-                except Exception as e:
-                    console.print(f"[red]✗[/red] Error validating {file_path}: {e}")
-                    if exit_on_error:
-                        raise typer.Exit(1)
-
-                progress.update(task, advance=1)
-
-        # Display results
-        if format_output == "table":
-            _display_table_format(all_results, verbose)
-        elif format_output == "json":
-            _display_json_format(all_results)
-        elif format_output == "summary":
-            _display_summary_format(all_results)
-
-        # Display summary
-        if total_fixed > 0:
-            console.print(f"[green]✓[/green] Applied {total_fixed} automatic fixes")
-
-        if total_issues == 0:
-            console.print("[green]✓[/green] All files passed validation")
-        else:
-            console.print(f"[yellow]Found {total_issues} validation issues:[/yellow]")
-            if total_errors > 0:
-                console.print(f"  [red]✗[/red] {total_errors} errors")
-            if total_warnings > 0:
-                console.print(f"  [yellow]⚠[/yellow] {total_warnings} warnings")
+        while True:
+            changed = watcher.wait()
 
-        # Exit with appropriate code
-        if exit_on_error and total_errors > 0:
-            raise typer.Exit(2)  # Validation errors found
-        elif exit_on_error and total_warnings > 0:
-            raise typer.Exit(1)  # Warnings found
+            if any(path.name.endswith(".rules.md") for path in changed):
+                console.print("[blue]Rules changed, reloading...[/blue]")
+                validation_service, rules = _load_validation_service(config_path)
+                targets = _collect_files(patterns)
+            else:
+                targets = sorted(
+                    path for path in changed
+                    if path.is_file() and _is_watch_target(path, patterns)
+                )
+
+            if targets:
+                outcomes = list(_validate_files(validation_service, targets, auto_fix, jobs))
+                # Our own fixes are not changes to validate again
+                watcher.accept(
+                    path for path, (_result, fixes_applied, _error) in zip(targets, outcomes)
+                    if fixes_applied
+                )
+                _validate_and_report(targets, outcomes, verbose, format_output, False)
+    except KeyboardInterrupt:
+        console.print("[blue]Stopped watching.[/blue]")
+    finally:
+        watcher.close()
+
+
+FileOutcome = Tuple[Optional[ValidationResult], int, Optional[str]]
+
+# Validation service of a worker process, built once per worker
+_worker_service: Optional[ValidationService] = None
+
+
+def _validate_file(validation_service: ValidationService, file_path: Path, auto_fix: bool) -> Tuple[ValidationResult, int]:
+    """Validate one file, writing back fixes. Returns the result and number of fixes applied."""
+    # Read file content
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Use validate_and_fix for complete workflow
+    validation_result = validation_service.validate_and_fix(
+        file_path, content, auto_fix=auto_fix, add_comments=False
+    )
+
+    # Get the validation result and fixed content
+    result = validation_result['validation_result']
+    fixed_content = validation_result['fixed_content']
+    auto_fix_log = validation_result['auto_fix_log']
+
+    # Write back the fixed content if it changed
+    if fixed_content != content:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(fixed_content)
+        return result, len(auto_fix_log)
+
+    return result, 0
 
+
+def _validate_file_safely(validation_service: ValidationService, file_path: Path, auto_fix: bool) -> FileOutcome:
+    """Validate one file, capturing any error as a message."""
+    try:
+        result, fixes_applied = _validate_file(validation_service, file_path, auto_fix)
+        return result, fixes_applied, None
     except Exception as e:
-        console.print(f"[red]✗[/red] Validation failed: {e}")
-        if exit_on_error:
-            raise typer.Exit(3)  # General error
+        return None, 0, str(e)
+
+
+def _init_worker(rule_engine: RuleEngine, document_types: Tuple[dict, dict]) -> None:
+    """Build the worker's validation service and document types from the parent's."""
+    global _worker_service
+    _worker_service = ValidationService.from_rule_engine(rule_engine)
+    DocumentTypeDetector.configure(*document_types)
+
+
+def _validate_in_worker(file_path: Path, auto_fix: bool) -> FileOutcome:
+    """Validate one file inside a worker process."""
+    assert _worker_service is not None
+    return _validate_file_safely(_worker_service, file_path, auto_fix)
+
+
+def _validate_files_parallel(rule_engine: RuleEngine, files: List[Path], auto_fix: bool, jobs: int):
+    """
+    Validate files across a process pool.
+
+    Each worker receives the pickled rule engine and the user-defined
+    document types once. Outcomes are yielded
+    in the order of ``files`` as soon as they are available.
+    """
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(rule_engine, DocumentTypeDetector.custom_mappings())) as executor:
+        yield from executor.map(partial(_validate_in_worker, auto_fix=auto_fix), files, chunksize=chunksize)
 
 
 def _display_table_format(results: dict, verbose: bool = False):
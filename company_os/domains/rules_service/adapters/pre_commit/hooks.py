@@ -14,9 +14,16 @@ from pathlib import Path
 from typing import List, Optional, Dict, Set
 import hashlib
 
+from company_os.domains.rules_service.src.daemon_client import (
+    DaemonClient, DaemonError, DaemonUnavailable, DEFAULT_SOCKET_PATH
+)
+
 # Add the project root to Python path for imports
 project_root = Path(__file__).resolve().parents[4]
 
+# Socket of the optional validation daemon, relative to the repository root
+daemon_socket = Path(__file__).resolve().parents[5] / DEFAULT_SOCKET_PATH
+
 
 def print_status(message: str, status: str = "info") -> None:
     """Print a formatted status message."""
@@ -43,6 +50,21 @@ def sync_main() -> int:
         print()
         print_status("Running Rules Service Sync...", "info")
 
+        # A running daemon syncs without the cost of starting bazel
+        try:
+            sync_result = DaemonClient(daemon_socket).sync()
+        except (DaemonUnavailable, DaemonError):
+            sync_result = None
+
+        if sync_result is not None:
+            if sync_result["errors"]:
+                print_status(f"Rules sync failed: {'; '.join(sync_result['errors'])}", "error")
+                print()
+                return 1
+            print_status("Rules sync completed successfully!", "success")
+            print()
+            return 0
+
         # Run the sync command via subprocess
         result = subprocess.run([
             "bazel", "run", "//company_os/domains/rules_service/adapters/cli:rules_cli",
@@ -84,6 +106,41 @@ def _add_files_to_git(files: List[str]) -> bool:
         return False
 
 
+def _validate_in_daemon(files: List[str]) -> Optional[int]:
+    """
+    Validate files with auto-fix in the running daemon and print the issues.
+
+    Returns:
+        Exit code as the validate command would return it, or None if no
+        daemon is running
+    """
+    try:
+        response = DaemonClient(daemon_socket).validate([Path(f) for f in files], auto_fix=True)
+    except (DaemonUnavailable, DaemonError):
+        return None
+
+    errors = warnings = failures = 0
+    for outcome in response["outcomes"]:
+        if outcome["error"] is not None:
+            print(f"✗ Error validating {outcome['file']}: {outcome['error']}")
+            failures += 1
+            continue
+
+        for issue in outcome["result"]["issues"]:
+            line = issue["line_number"] or "-"
+            print(f"  {outcome['file']}:{line} [{issue['severity']}] {issue['rule_id']}: {issue['message']}")
+            if issue["severity"] == "error":
+                errors += 1
+            elif issue["severity"] == "warning":
+                warnings += 1
+
+    if failures:
+        return 3
+    if errors:
+        return 2
+    return 1 if warnings else 0
+
+
 def validate_main() -> int:
     """
     Main entry point for the rules-validate pre-commit hook.
@@ -116,19 +173,22 @@ def validate_main() -> int:
         for file_path in markdown_files:
             file_checksums_before[file_path] = _get_file_checksum(file_path)
 
-        # Run the validate command via subprocess
-        cmd = [
-            "bazel", "run", "//company_os/domains/rules_service/adapters/cli:rules_cli",
-            "--", "validate", "validate", "--auto-fix"
-        ] + markdown_files
+        # Validate in the running daemon when there is one, otherwise via bazel
+        returncode = _validate_in_daemon(markdown_files)
+        if returncode is None:
+            cmd = [
+                "bazel", "run", "//company_os/domains/rules_service/adapters/cli:rules_cli",
+                "--", "validate", "validate", "--auto-fix"
+            ] + markdown_files
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
 
-        # Print the output from the validation command
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+            # Print the output from the validation command
+            if result.stdout:
+                print(result.stdout)
+            if result.stderr:
+                print(result.stderr)
+            returncode = result.returncode
 
         # Check which files were modified by auto-fix
         modified_files = []
@@ -153,15 +213,15 @@ def validate_main() -> int:
                 print_status("Failed to add auto-fixed files to git", "error")
                 print_status("You may need to manually add these files to your commit", "warning")
 
-        if result.returncode == 0:
+        if returncode == 0:
             print()
             print_status("All files passed validation!", "success")
             print()
-        elif result.returncode == 1:
+        elif returncode == 1:
             print()
             print_status("Validation completed with warnings.", "warning")
             print()
-        elif result.returncode == 2:
+        elif returncode == 2:
             print()
             print_status("Validation failed with errors.", "error")
             print("Commit aborted. Please fix the errors and try again.")
@@ -171,7 +231,7 @@ def validate_main() -> int:
             print_status("Validation failed.", "error")
             print()
 
-        return result.returncode
+        return returncode
 
     except Exception as e:
         print()
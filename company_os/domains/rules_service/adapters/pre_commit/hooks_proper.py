@@ -11,17 +11,21 @@ This implementation:
 
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 # Add the project root to Python path
 project_root = Path(__file__).resolve().parents[5]
 sys.path.insert(0, str(project_root))
 
 try:
-    from company_os.domains.rules_service.src.validation import ValidationService
+    from company_os.domains.rules_service.src.validation import ValidationResult
+    from company_os.domains.rules_service.src.daemon_client import (
+        DaemonClient, DaemonError, DaemonUnavailable, DEFAULT_SOCKET_PATH
+    )
     from company_os.domains.rules_service.src.sync import SyncService
     from company_os.domains.rules_service.src.config import RulesServiceConfig
-    from company_os.domains.rules_service.src.discovery import RuleDiscoveryService
+    from company_os.domains.rules_service.src.discovery import RuleDiscoveryService, DEFAULT_INDEX_PATH
+    from company_os.domains.rules_service.src.compiled_rules import load_or_compile, DEFAULT_SNAPSHOT_PATH
     from rich.console import Console
     from rich.table import Table
     from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -77,6 +81,31 @@ def load_config() -> Optional[RulesServiceConfig]:
         return None
 
 
+def _validate_in_daemon(files: List[str]) -> Optional[Tuple[int, List[ValidationResult]]]:
+    """
+    Validate files with auto-fix in the running daemon.
+
+    Returns:
+        The number of rules applied and one result per file, or None if no
+        daemon is running
+
+    Raises:
+        RuntimeError: If the daemon could not validate one of the files
+    """
+    client = DaemonClient(project_root / DEFAULT_SOCKET_PATH)
+    try:
+        response = client.validate([Path(f) for f in files], auto_fix=True)
+    except (DaemonUnavailable, DaemonError):
+        return None
+
+    results = []
+    for outcome in response["outcomes"]:
+        if outcome["error"] is not None:
+            raise RuntimeError(f"{outcome['file']}: {outcome['error']}")
+        results.append(ValidationResult.from_dict(outcome["result"]))
+    return response["rules"], results
+
+
 def validate_main() -> int:
     """
     Proper validation implementation using shared service components.
@@ -107,65 +136,73 @@ def validate_main() -> int:
         console.print(f"[bold blue]RULES SERVICE VALIDATION - {len(markdown_files)} file(s)[/bold blue]".center(80))
         console.print("[bold blue]" + "=" * 80 + "[/bold blue]\n")
 
-        # Use discovery service to find rules
-        discovery_service = RuleDiscoveryService(".")
+        # Validate in the running daemon when there is one; it already holds the rules
+        daemon_results = _validate_in_daemon(markdown_files)
+        if daemon_results is not None:
+            rule_count, all_results = daemon_results
+            console.print(f"[green]✓[/green] Validated in daemon against {rule_count} rule(s)\n")
+        else:
+            # Use discovery service to find rules
+            discovery_service = RuleDiscoveryService(".", index_path=DEFAULT_INDEX_PATH)
 
-        with console.status("[bold green]Discovering rules...") as status:
-            rules, errors = discovery_service.discover_rules()
-            if errors:
-                console.print("[yellow]Discovery errors:[/yellow]")
-                for error in errors:
-                    console.print(f"  [yellow]• {error}[/yellow]")
+            with console.status("[bold green]Discovering rules...") as status:
+                rules, errors = discovery_service.discover_rules()
+                if errors:
+                    console.print("[yellow]Discovery errors:[/yellow]")
+                    for error in errors:
+                        console.print(f"  [yellow]• {error}[/yellow]")
 
-        if not rules:
-            console.print("[yellow]No rules found. Validation will check basic formatting only.[/yellow]\n")
-        else:
-            console.print(f"[green]✓[/green] Found {len(rules)} rule(s) to validate against\n")
+            if not rules:
+                console.print("[yellow]No rules found. Validation will check basic formatting only.[/yellow]\n")
+            else:
+                console.print(f"[green]✓[/green] Found {len(rules)} rule(s) to validate against\n")
 
-        # Initialize validation service
-        rule_contents = {}
-        for rule in rules:
-            if hasattr(rule, 'file_path') and rule.file_path:
-                try:
-                    with open(rule.file_path, 'r', encoding='utf-8') as f:
-                        rule_contents[rule.file_path] = f.read()
-                except Exception:
-                    pass
+            # Initialize validation service
+            rule_contents = {}
+            for rule in rules:
+                if hasattr(rule, 'file_path') and rule.file_path:
+                    try:
+                        with open(rule.file_path, 'r', encoding='utf-8') as f:
+                            rule_contents[rule.file_path] = f.read()
+                    except Exception:
+                        pass
 
-        validation_service = ValidationService(rules, rule_contents)
+            validation_service = load_or_compile(rules, DEFAULT_SNAPSHOT_PATH, rule_contents)
+            for diagnostic in validation_service.rule_diagnostics:
+                console.print(f"[yellow]⚠️  {diagnostic}[/yellow]")
 
-        # Validate files
-        total_warnings = 0
-        total_errors = 0
-        all_results = []
+            # Validate files
+            all_results = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Validating files...", total=len(markdown_files))
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Validating files...", total=len(markdown_files))
+
+                for file_path in markdown_files:
+                    progress.update(task, description=f"Validating {Path(file_path).name}...")
 
-            for file_path in markdown_files:
-                progress.update(task, description=f"Validating {Path(file_path).name}...")
+                    path_obj = Path(file_path)
+                    content = path_obj.read_text(encoding='utf-8')
 
-                path_obj = Path(file_path)
-                content = path_obj.read_text(encoding='utf-8')
+                    result = validation_service.validate_and_fix(
+                        path_obj, content, auto_fix=True, add_comments=False
+                    )
 
-                result = validation_service.validate_and_fix(
-                    path_obj, content, auto_fix=True, add_comments=False
-                )
+                    validation_result = result['validation_result']
+                    all_results.append(validation_result)
 
-                validation_result = result['validation_result']
-                all_results.append(validation_result)
+                    if result['auto_fix_log']:
+                        path_obj.write_text(result['fixed_content'], encoding='utf-8')
 
-                if result['auto_fix_log']:
-                    path_obj.write_text(result['fixed_content'], encoding='utf-8')
+                    progress.advance(task)
 
-                total_errors += validation_result.error_count
-                total_warnings += validation_result.warning_count
+            rule_count = len(rules)
 
-                progress.advance(task)
+        total_errors = sum(result.error_count for result in all_results)
+        total_warnings = sum(result.warning_count for result in all_results)
 
         # Display summary
         console.print("\n[bold blue]" + "=" * 80 + "[/bold blue]")
@@ -177,7 +214,7 @@ def validate_main() -> int:
         table.add_column("Count", justify="right")
 
         table.add_row("Files Processed", str(len(markdown_files)))
-        table.add_row("Rules Applied", str(len(rules)))
+        table.add_row("Rules Applied", str(rule_count))
         if total_warnings > 0:
             table.add_row("[yellow]⚠️  Warnings[/yellow]", str(total_warnings))
         if total_errors > 0:
@@ -226,7 +263,7 @@ def sync_main() -> int:
         console.print("[bold blue]" + "=" * 80 + "[/bold blue]\n")
 
         # Use discovery service
-        discovery_service = RuleDiscoveryService(".")
+        discovery_service = RuleDiscoveryService(".", index_path=DEFAULT_INDEX_PATH)
 
         with console.status("[bold green]Discovering rules...") as status:
             rules, errors = discovery_service.discover_rules()
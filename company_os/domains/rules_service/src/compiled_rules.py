@@ -0,0 +1,228 @@
+"""Compiled rule-set snapshots for fast ValidationService start-up."""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+
+from .models import RuleDocument
+from .validation import (
+    ExtractedRule, RuleExtractor, RuleEngine, ValidationService, load_rule_content
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever RuleExtractor or ExtractedRule change in a way that affects
+# the extracted rules, so that existing snapshots are recompiled.
+SNAPSHOT_VERSION = 1
+
+# Default location of the snapshot, relative to the repository root
+DEFAULT_SNAPSHOT_PATH = Path(".cache") / "compiled-rules.json"
+
+# ExtractedRule fields that cannot be serialized or are derived on construction
+_TRANSIENT_FIELDS = {"validation_func", "compiled_pattern", "pattern_error"}
+
+
+def compute_fingerprint(rules: List[RuleDocument], rule_contents: Dict[str, str]) -> str:
+    """
+    Compute a fingerprint over all source rule documents.
+
+    The fingerprint covers the metadata used during extraction and a hash of
+    each rule file's content, so any edit to a source rule invalidates it.
+
+    Args:
+        rules: Rule documents the snapshot is built from
+        rule_contents: Mapping of rule file paths to their content
+
+    Returns:
+        Hex digest identifying this exact rule set
+    """
+    entries = []
+    for rule_doc in rules:
+        content = rule_contents.get(rule_doc.file_path) if rule_doc.file_path else None
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest() if content else None
+        entries.append([rule_doc.file_path, rule_doc.title, list(rule_doc.applies_to), content_hash])
+
+    entries.sort(key=lambda e: (e[0] or "", e[1]))
+    payload = json.dumps([SNAPSHOT_VERSION, entries], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CompiledRuleSet:
+    """Serializable snapshot of extracted rules and the RuleEngine indexes."""
+    fingerprint: str
+    rules: List[ExtractedRule] = field(default_factory=list)
+    rules_by_type: Dict[str, List[int]] = field(default_factory=dict)
+    rules_by_document_type: Dict[str, List[int]] = field(default_factory=dict)
+    version: int = SNAPSHOT_VERSION
+
+    @classmethod
+    def compile(cls, rules: List[RuleDocument],
+                rule_contents: Optional[Dict[str, str]] = None) -> "CompiledRuleSet":
+        """
+        Extract rules from rule documents and capture the resulting engine.
+
+        Args:
+            rules: Rule documents to compile
+            rule_contents: Optional pre-loaded content dict
+
+        Returns:
+            CompiledRuleSet for the given rules
+        """
+        contents = _collect_contents(rules, rule_contents)
+        extractor = RuleExtractor()
+        engine = RuleEngine()
+
+        for rule_doc in rules:
+            content = contents.get(rule_doc.file_path) if rule_doc.file_path else None
+            if content:
+                engine.add_rules(extractor.extract_rules_from_document(rule_doc, content))
+
+        return cls.from_engine(engine, compute_fingerprint(rules, contents))
+
+    @classmethod
+    def from_engine(cls, engine: RuleEngine, fingerprint: str) -> "CompiledRuleSet":
+        """Capture the rules and indexes of a populated engine."""
+        all_rules: List[ExtractedRule] = []
+        positions: Dict[int, int] = {}
+
+        def position_of(rule: ExtractedRule) -> int:
+            if id(rule) not in positions:
+                positions[id(rule)] = len(all_rules)
+                all_rules.append(rule)
+            return positions[id(rule)]
+
+        rules_by_type = {
+            rule_type: [position_of(rule) for rule in rule_list]
+            for rule_type, rule_list in engine.rules_by_type.items()
+        }
+        rules_by_document_type = {
+            doc_type: [position_of(rule) for rule in rule_list]
+            for doc_type, rule_list in engine.rules_by_document_type.items()
+        }
+
+        return cls(
+            fingerprint=fingerprint,
+            rules=all_rules,
+            rules_by_type=rules_by_type,
+            rules_by_document_type=rules_by_document_type,
+        )
+
+    def to_engine(self) -> RuleEngine:
+        """Rebuild a RuleEngine with the stored indexes, without re-extracting."""
+        engine = RuleEngine()
+        engine.rules_by_type = {
+            rule_type: [self.rules[i] for i in indexes]
+            for rule_type, indexes in self.rules_by_type.items()
+        }
+        engine.rules_by_document_type = {
+            doc_type: [self.rules[i] for i in indexes]
+            for doc_type, indexes in self.rules_by_document_type.items()
+        }
+        return engine
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'version': self.version,
+            'fingerprint': self.fingerprint,
+            'rules': [
+                {f.name: getattr(rule, f.name) for f in fields(ExtractedRule)
+                 if f.name not in _TRANSIENT_FIELDS}
+                for rule in self.rules
+            ],
+            'rules_by_type': self.rules_by_type,
+            'rules_by_document_type': self.rules_by_document_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompiledRuleSet":
+        """Create a snapshot from its serialized form."""
+        return cls(
+            fingerprint=data['fingerprint'],
+            rules=[ExtractedRule(**rule) for rule in data['rules']],
+            rules_by_type=data['rules_by_type'],
+            rules_by_document_type=data['rules_by_document_type'],
+            version=data['version'],
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f)
+            temp_path.replace(path)
+        except Exception:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["CompiledRuleSet"]:
+        """
+        Load a snapshot from disk.
+
+        Returns:
+            The snapshot, or None if it is missing, unreadable or was written
+            by an incompatible version
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != SNAPSHOT_VERSION:
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable rule snapshot {path}: {e}")
+            return None
+
+
+def _collect_contents(rules: List[RuleDocument],
+                      rule_contents: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Load the content of every rule document that has a file path."""
+    contents: Dict[str, str] = {}
+    for rule_doc in rules:
+        if not rule_doc.file_path:
+            continue
+        content = load_rule_content(rule_doc, rule_contents)
+        if content is not None:
+            contents[rule_doc.file_path] = content
+    return contents
+
+
+def load_or_compile(rules: List[RuleDocument], snapshot_path: Path,
+                    rule_contents: Optional[Dict[str, str]] = None) -> ValidationService:
+    """
+    Build a ValidationService from a compiled snapshot, recompiling if stale.
+
+    The snapshot is reused only when its fingerprint matches the current rule
+    documents; otherwise the rules are extracted again and the snapshot is
+    rewritten.
+
+    Args:
+        rules: Discovered rule documents
+        snapshot_path: Where the compiled snapshot is stored
+        rule_contents: Optional pre-loaded content dict
+
+    Returns:
+        ValidationService ready to validate documents
+    """
+    contents = _collect_contents(rules, rule_contents)
+    fingerprint = compute_fingerprint(rules, contents)
+
+    snapshot = CompiledRuleSet.load(snapshot_path)
+    if snapshot is None or snapshot.fingerprint != fingerprint:
+        snapshot = CompiledRuleSet.compile(rules, contents)
+        try:
+            snapshot.save(snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write rule snapshot {snapshot_path}: {e}")
+
+    return ValidationService.from_rule_engine(snapshot.to_engine())
@@ -8,6 +8,10 @@ import yaml
 from yaml import YAMLError
 
 
+# Default configuration file, relative to the repository root
+DEFAULT_CONFIG_PATH = Path(".rules-service.yaml")
+
+
 class ConflictStrategy(str, Enum):
     """Strategies for handling file conflicts during sync."""
     OVERWRITE = "overwrite"
@@ -15,6 +19,14 @@ class ConflictStrategy(str, Enum):
     ASK = "ask"
 
 
+class LinkMode(str, Enum):
+    """How synced files are placed in agent folders."""
+    COPY = "copy"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    SYMLINK = "symlink"
+
+
 class AgentFolder(BaseModel):
     """Configuration for an agent-specific folder."""
     path: str
@@ -37,6 +49,7 @@ class SyncConfig(BaseModel):
     exclude_patterns: List[str] = Field(default_factory=list)
     create_directories: bool = True
     clean_orphaned: bool = True
+    link_mode: LinkMode = LinkMode.COPY
 
 
 class PerformanceConfig(BaseModel):
@@ -49,18 +62,27 @@ class PerformanceConfig(BaseModel):
     @classmethod
     def validate_algorithm(cls, v: str) -> str:
         """Validate checksum algorithm."""
-        allowed = {"md5", "sha256", "sha512"}
+        allowed = {"md5", "sha256", "sha512", "blake2b", "blake2s"}
         if v not in allowed:
             raise ValueError(f"Algorithm must be one of {allowed}")
         return v
 
 
+class DocumentTypesConfig(BaseModel):
+    """User-defined document type mappings, checked before the built-in ones."""
+    # File suffix to document type, e.g. {".adr.md": "decision"}
+    suffixes: Dict[str, str] = Field(default_factory=dict)
+    # Document type to path fragments, e.g. {"decision": ["/adr/"]}
+    path_patterns: Dict[str, List[str]] = Field(default_factory=dict)
+
+
 class RulesServiceConfig(BaseModel):
     """Main configuration for the Rules Service."""
     version: str
     agent_folders: List[AgentFolder]
     sync: SyncConfig = Field(default_factory=SyncConfig)
     performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    document_types: DocumentTypesConfig = Field(default_factory=DocumentTypesConfig)
 
     @classmethod
     def from_file(cls, config_path: Path) -> "RulesServiceConfig":
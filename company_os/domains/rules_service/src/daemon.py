@@ -0,0 +1,298 @@
+"""
+Local Rules Service daemon.
+
+The daemon keeps the discovered rules, the compiled rule engine, the sync
+service's hash cache and the latest validation result of every file in
+memory, and answers requests from ``DaemonClient`` over a Unix socket.
+Each request is one line of JSON and is answered with one line of JSON.
+"""
+
+import hashlib
+import logging
+import os
+import socketserver
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .compiled_rules import load_or_compile, DEFAULT_SNAPSHOT_PATH
+from .config import RulesServiceConfig, DEFAULT_CONFIG_PATH
+from .daemon_client import (
+    DaemonClient, DEFAULT_SOCKET_PATH, PROTOCOL_VERSION, receive_message, send_message
+)
+from .discovery import RuleDiscoveryService, DEFAULT_INDEX_PATH
+from .models import RuleDocument
+from .sync import SyncService
+from .validation import DocumentTypeDetector, ValidationService
+from .watcher import FileWatcher
+
+
+logger = logging.getLogger(__name__)
+
+# Conventional home of the rule files, watched even before it holds any rule
+RULES_DATA_PATH = Path("company_os") / "domains" / "rules" / "data"
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Answers a single request on a client connection."""
+
+    def handle(self) -> None:
+        daemon: "RulesDaemon" = self.server.daemon  # type: ignore[attr-defined]
+        try:
+            request = receive_message(self.request)
+        except (OSError, ValueError) as e:
+            request = {"malformed": str(e)}
+        if request is None:
+            return
+
+        response = daemon.handle(request)
+        try:
+            send_message(self.request, response)
+        except OSError as e:
+            logger.debug(f"Client went away before the response was sent: {e}")
+
+        if daemon.stopping:
+            # shutdown() blocks until serve_forever() returns, so it cannot
+            # run on the thread serving this request
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    """Serves requests one at a time, so the daemon state needs no locking."""
+
+    def __init__(self, socket_path: str, daemon: "RulesDaemon"):
+        self.daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class RulesDaemon:
+    """Long-running process holding warm Rules Service state."""
+
+    def __init__(self, root_path: Path, socket_path: Optional[Path] = None,
+                 config_path: Optional[Path] = None):
+        """
+        Args:
+            root_path: Repository root to discover rules in
+            socket_path: Unix socket to listen on (default: .cache/rules-service.sock)
+            config_path: Configuration used for sync (default: .rules-service.yaml)
+        """
+        self.root_path = Path(root_path).resolve()
+        self.socket_path = Path(socket_path) if socket_path else self.root_path / DEFAULT_SOCKET_PATH
+        self.config_path = Path(config_path) if config_path else self.root_path / DEFAULT_CONFIG_PATH
+
+        self.discovery_service = RuleDiscoveryService(
+            self.root_path, index_path=self.root_path / DEFAULT_INDEX_PATH
+        )
+        self.rules: List[RuleDocument] = []
+        self.rule_errors: List[str] = []
+        self.validation_service: Optional[ValidationService] = None
+        self._rule_watcher: Optional[FileWatcher] = None
+
+        self._sync_service: Optional[SyncService] = None
+        self._config_signature: Optional[Tuple[int, int]] = None
+
+        # Latest outcome per file, keyed by path: (content hash, auto_fix, outcome)
+        self._results: Dict[str, Tuple[str, bool, Dict[str, Any]]] = {}
+        self.cache_hits = 0
+        self.requests_served = 0
+
+        self.stopping = False
+        self._server: Optional[_UnixServer] = None
+
+        self._commands: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "status": self._status,
+            "validate": self._validate,
+            "sync": self._sync,
+            "reload": self._reload,
+            "shutdown": self._shutdown,
+        }
+
+    def serve_forever(self) -> None:
+        """
+        Load the rules, then serve requests until asked to shut down.
+
+        Raises:
+            RuntimeError: If another daemon already listens on the socket
+        """
+        self._server = self._bind()
+        try:
+            # Clients connecting while the rules load wait in the listen backlog
+            self._ensure_rules()
+            logger.info(f"Rules Service daemon listening on {self.socket_path}")
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            self.close()
+
+    def close(self) -> None:
+        """Release the rule watcher."""
+        if self._rule_watcher is not None:
+            self._rule_watcher.close()
+            self._rule_watcher = None
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process one request.
+
+        Returns:
+            Response carrying ``ok`` and either the command's fields or ``error``
+        """
+        self.requests_served += 1
+        response: Dict[str, Any] = {"version": PROTOCOL_VERSION}
+
+        if "malformed" in request:
+            response.update(ok=False, error=f"Malformed request: {request['malformed']}")
+            return response
+
+        if request.get("version") != PROTOCOL_VERSION:
+            response.update(
+                ok=False,
+                error=f"Unsupported protocol version {request.get('version')}, expected {PROTOCOL_VERSION}"
+            )
+            return response
+
+        command = self._commands.get(request.get("command", ""))
+        if command is None:
+            response.update(ok=False, error=f"Unknown command: {request.get('command')}")
+            return response
+
+        try:
+            response.update(command(request))
+            response["ok"] = True
+        except Exception as e:
+            logger.exception(f"Request {request.get('command')} failed")
+            response.update(ok=False, error=str(e))
+        return response
+
+    def _bind(self) -> _UnixServer:
+        """Create the listening socket, replacing a stale one."""
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path, timeout=1.0).is_running():
+                raise RuntimeError(f"A daemon is already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = _UnixServer(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+        return server
+
+    def _ensure_rules(self) -> None:
+        """Load the rules on first use and reload them after rule files or the configuration changed."""
+        if self.validation_service is None:
+            self._load_rules()
+        elif self._rule_watcher is not None and self._rule_watcher.wait(timeout=0):
+            logger.info("Rule files or configuration changed, reloading rules")
+            self._load_rules()
+
+    def _load_rules(self) -> None:
+        """Discover the rules and rebuild the validation service."""
+        self.rules, self.rule_errors = self.discovery_service.discover_rules(refresh_cache=True)
+        if self.config_path.exists():
+            try:
+                DocumentTypeDetector.load_config(self.config_path)
+            except ValueError as e:
+                self.rule_errors.append(f"Ignoring document types in {self.config_path}: {e}")
+        else:
+            DocumentTypeDetector.configure()
+        self.validation_service = load_or_compile(self.rules, self.root_path / DEFAULT_SNAPSHOT_PATH)
+        self._results.clear()
+
+        roots = {Path(rule.file_path).resolve().parent for rule in self.rules if rule.file_path}
+        roots.add(self.root_path / RULES_DATA_PATH)
+        self.close()
+        self._rule_watcher = FileWatcher(
+            roots, include=lambda path: path.name.endswith(".rules.md"), poll_interval=0,
+            # The document types in the configuration decide which rules apply
+            files=[self.config_path],
+        )
+
+    def _status(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "root": str(self.root_path),
+            "rules": len(self.rules),
+            "rules_by_document_type": (
+                self.validation_service.rule_engine.rule_counts_by_document_type()
+                if self.validation_service else {}
+            ),
+            "rule_errors": self.rule_errors,
+            "watcher": self._rule_watcher.backend if self._rule_watcher else None,
+            "cached_results": len(self._results),
+            "cache_hits": self.cache_hits,
+            "requests": self.requests_served,
+        }
+
+    def _validate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._ensure_rules()
+        auto_fix = bool(request.get("auto_fix", False))
+        outcomes = [self._validate_path(str(path), auto_fix) for path in request.get("files", [])]
+        return {"rules": len(self.rules), "outcomes": outcomes}
+
+    def _validate_path(self, path: str, auto_fix: bool) -> Dict[str, Any]:
+        """Validate one file, reusing the last outcome while its content is unchanged."""
+        outcome: Dict[str, Any] = {"file": path, "result": None, "fixes_applied": 0, "error": None}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            outcome["error"] = str(e)
+            return outcome
+
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        cached = self._results.get(path)
+        if cached is not None and cached[0] == content_hash and cached[1] == auto_fix:
+            self.cache_hits += 1
+            return cached[2]
+
+        assert self.validation_service is not None
+        try:
+            validation_result = self.validation_service.validate_and_fix(
+                Path(path), content, auto_fix=auto_fix, add_comments=False
+            )
+            fixed_content = validation_result['fixed_content']
+            outcome["result"] = validation_result['validation_result'].to_dict()
+
+            if fixed_content != content:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(fixed_content)
+                outcome["fixes_applied"] = len(validation_result['auto_fix_log'])
+            else:
+                # Only outcomes that did not rewrite the file describe its content
+                self._results[path] = (content_hash, auto_fix, outcome)
+        except Exception as e:
+            outcome["error"] = str(e)
+        return outcome
+
+    def _sync(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._ensure_rules()
+        sync_service = self._get_sync_service()
+        result = sync_service.sync_rules(self.rules, dry_run=bool(request.get("dry_run", False)))
+        return {"result": asdict(result)}
+
+    def _get_sync_service(self) -> SyncService:
+        """Get the sync service, recreating it when the configuration changed."""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._sync_service is None or signature != self._config_signature:
+            config = RulesServiceConfig.from_file(self.config_path)
+            self._sync_service = SyncService(config, self.root_path)
+            self._config_signature = signature
+        return self._sync_service
+
+    def _reload(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._load_rules()
+        return {"rules": len(self.rules), "rule_errors": self.rule_errors}
+
+    def _shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.stopping = True
+        return {}
@@ -0,0 +1,141 @@
+"""
+Thin client for the local Rules Service daemon.
+
+Only the standard library is imported here, so pre-commit hooks and the CLI
+can talk to a running daemon without paying for rule discovery or the
+validation engine. Every call raises ``DaemonUnavailable`` when no daemon
+answers, letting callers fall back to validating in-process.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+# Bump whenever requests or responses change incompatibly
+PROTOCOL_VERSION = 1
+
+# Default location of the daemon socket, relative to the repository root
+DEFAULT_SOCKET_PATH = Path(".cache") / "rules-service.sock"
+
+# Largest message either side accepts, guarding against runaway reads
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+class DaemonUnavailable(ConnectionError):
+    """No compatible daemon is listening on the socket."""
+
+
+class DaemonError(RuntimeError):
+    """The daemon received a request but could not process it."""
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """Send one message as a line of JSON."""
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Receive one line of JSON, or None if the peer closed the connection."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = sock.recv(64 * 1024)
+        if not chunk:
+            if chunks:
+                raise ValueError("Connection closed mid-message")
+            return None
+        chunks.append(chunk)
+        size += len(chunk)
+        if chunk.endswith(b"\n"):
+            break
+        if size > MAX_MESSAGE_BYTES:
+            raise ValueError("Message too large")
+
+    message = json.loads(b"".join(chunks))
+    if not isinstance(message, dict):
+        raise ValueError("Message is not a JSON object")
+    return message
+
+
+class DaemonClient:
+    """Sends requests to the daemon, one connection per request."""
+
+    def __init__(self, socket_path: Path, timeout: Optional[float] = 300.0):
+        """
+        Args:
+            socket_path: Unix socket the daemon listens on
+            timeout: Seconds to wait for a response, None to wait indefinitely
+        """
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    def request(self, command: str, **params: Any) -> Dict[str, Any]:
+        """
+        Send a request and return the daemon's response.
+
+        Raises:
+            DaemonUnavailable: If no compatible daemon is listening
+            DaemonError: If the daemon reported a failure
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise DaemonUnavailable("Unix sockets are not supported on this platform")
+
+        message = {"version": PROTOCOL_VERSION, "command": command, **params}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                send_message(sock, message)
+                response = receive_message(sock)
+        except (OSError, ValueError) as e:
+            raise DaemonUnavailable(f"No daemon at {self.socket_path}: {e}") from e
+
+        if response is None:
+            raise DaemonUnavailable(f"Daemon at {self.socket_path} closed the connection")
+        if response.get("version") != PROTOCOL_VERSION:
+            raise DaemonUnavailable(
+                f"Daemon at {self.socket_path} speaks protocol {response.get('version')}, "
+                f"expected {PROTOCOL_VERSION}"
+            )
+        if not response.get("ok"):
+            raise DaemonError(response.get("error") or "Unknown daemon error")
+        return response
+
+    def is_running(self) -> bool:
+        """Check whether a compatible daemon answers on the socket."""
+        try:
+            self.status()
+        except (DaemonUnavailable, DaemonError):
+            return False
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """Get the daemon's process id, rule count and cache statistics."""
+        return self.request("status")
+
+    def validate(self, files: Iterable[Path], auto_fix: bool = False) -> Dict[str, Any]:
+        """
+        Validate files in the daemon.
+
+        Paths are made absolute first, since the daemon may run from a
+        different working directory.
+
+        Returns:
+            Response with the number of ``rules`` applied and ``outcomes``:
+            one per file, in input order, with ``file``, ``result`` (a
+            ``ValidationResult.to_dict()`` or None), ``fixes_applied`` and
+            ``error`` keys
+        """
+        paths = [os.path.abspath(path) for path in files]
+        return self.request("validate", files=paths, auto_fix=auto_fix)
+
+    def sync(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Synchronize rules to agent folders, returning the result counts."""
+        return self.request("sync", dry_run=dry_run)["result"]
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop once the current request is answered."""
+        self.request("shutdown")
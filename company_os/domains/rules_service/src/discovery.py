@@ -1,10 +1,16 @@
 import os
-from typing import List, Optional, Dict, Tuple
+import json
+import hashlib
+from typing import List, Optional, Dict, Tuple, Any, Set
 from pathlib import Path
 from .models import RuleDocument
 import yaml
 from pydantic import ValidationError
 
+# Default location of the persistent discovery index, relative to the root path
+DEFAULT_INDEX_PATH = Path(".cache") / "rules-index.json"
+
+
 class FrontmatterParser:
     """Parses the YAML frontmatter from a markdown file."""
 
@@ -13,28 +19,149 @@ class FrontmatterParser:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                # Simple check for frontmatter fences
-                if not content.startswith(('---', '+++')):
-                    return None, None
-
-                delimiter = '---' if content.startswith('---') else '+++'
-                parts = content.split(delimiter)
-                if len(parts) < 3:
-                    return None, f"Invalid frontmatter structure in {file_path}"
-
-                frontmatter_str = parts[1]
-                return yaml.safe_load(frontmatter_str), None
-        except (IOError, yaml.YAMLError) as e:
+        except IOError as e:
             return None, f"Error parsing frontmatter for {file_path}: {e}"
 
+        return self.parse_content(content, file_path)
+
+    def parse_content(self, content: str, file_path: Path) -> Tuple[Optional[Dict], Optional[str]]:
+        """Extracts and parses the YAML frontmatter from already-loaded content."""
+        try:
+            # Simple check for frontmatter fences
+            if not content.startswith(('---', '+++')):
+                return None, None
+
+            delimiter = '---' if content.startswith('---') else '+++'
+            parts = content.split(delimiter)
+            if len(parts) < 3:
+                return None, f"Invalid frontmatter structure in {file_path}"
+
+            frontmatter_str = parts[1]
+            return yaml.safe_load(frontmatter_str), None
+        except yaml.YAMLError as e:
+            return None, f"Error parsing frontmatter for {file_path}: {e}"
+
+
+class RuleIndex:
+    """
+    Persistent on-disk index of parsed rule files.
+
+    Entries are keyed by file path and validated against the file's mtime and
+    size. When the stat data moved, the content hash decides whether the
+    stored result can still be reused, so only files that actually changed
+    are re-parsed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """Load the index from disk, discarding it if missing or incompatible."""
+        self._entries = {}
+        self._seen = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            entries = data.get('entries')
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def lookup(self, file_path: Path, stat: os.stat_result,
+               content_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for a file if it is still valid.
+
+        Without a content hash only the stat data (mtime and size) is compared.
+        With a content hash, an entry whose stat data moved but whose content
+        is unchanged is accepted and refreshed.
+        """
+        key = str(file_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+            self._seen.add(key)
+            self.hits += 1
+            return entry
+
+        if content_hash is not None and entry.get('sha256') == content_hash:
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            self._seen.add(key)
+            self._dirty = True
+            self.hits += 1
+            return entry
+
+        return None
+
+    def store(self, file_path: Path, stat: os.stat_result, content_hash: str,
+              document: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        """Record the parse outcome for a file."""
+        key = str(file_path)
+        self._entries[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': content_hash,
+            'document': document,
+            'error': error,
+        }
+        self._seen.add(key)
+        self._dirty = True
+        self.misses += 1
+
+    def save(self) -> None:
+        """Write the index to disk, dropping entries for files no longer present."""
+        stale = set(self._entries) - self._seen
+        for key in stale:
+            del self._entries[key]
+
+        if not self._dirty and not stale:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix(self.index_path.suffix + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'entries': self._entries}, f)
+            temp_path.replace(self.index_path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+        self._dirty = False
+
 
 class RuleDiscoveryService:
     """Service for discovering and parsing rule files"""
 
-    def __init__(self, root_path: Path):
+    def __init__(self, root_path: Path, index_path: Optional[Path] = None):
+        """
+        Args:
+            root_path: Directory to search for rule files.
+            index_path: Optional path of a persistent discovery index. When
+                        given, parsed rule files are remembered between runs
+                        and only changed files are re-parsed.
+        """
         self.root_path = root_path
         self._cache: Dict[Path, RuleDocument] = {}
         self.parser = FrontmatterParser()
+        self.index = RuleIndex(index_path) if index_path is not None else None
 
     def discover_rules(self, refresh_cache: bool = False) -> Tuple[List[RuleDocument], List[str]]:
         """
@@ -56,6 +183,9 @@ class RuleDiscoveryService:
         self._cache.clear()
         errors = []
 
+        if self.index is not None:
+            self.index.load()
+
         for root, dirs, files in os.walk(self.root_path, topdown=True, followlinks=False):
             # Exclude hidden directories (like .git, .venv, etc.)
             dirs[:] = [d for d in dirs if not d.startswith('.')]
@@ -63,33 +193,74 @@ class RuleDiscoveryService:
             for file in files:
                 if file.endswith('.rules.md'):
                     file_path = Path(root) / file
-                    if file_path in self._cache and not refresh_cache:
-                        continue
 
-                    frontmatter, error = self.parser.parse(file_path)
+                    rule_doc, error = self._load_rule_file(file_path)
 
                     if error:
                         errors.append(error)
                         continue
 
-                    if not frontmatter:
-                        # This is not an error, just a file without frontmatter to parse.
-                        continue
-
-                    try:
-                        if not isinstance(frontmatter, dict) or not all(isinstance(k, str) for k in frontmatter):
-                            raise ValueError("Front-matter must be a mapping with string keys")
-                        if 'version' in frontmatter:
-                            frontmatter['version'] = str(frontmatter['version'])
-                        # Add file_path to the frontmatter data
-                        frontmatter['file_path'] = str(file_path)
-                        rule_doc = RuleDocument(**frontmatter)
+                    if rule_doc is not None:
                         self._cache[file_path] = rule_doc
-                    except (ValidationError, TypeError, ValueError) as e:
-                        errors.append(f"Validation error for {file_path.name}: {e}")
+
+        if self.index is not None:
+            try:
+                self.index.save()
+            except OSError as e:
+                errors.append(f"Could not write rule index {self.index.index_path}: {e}")
 
         return list(self._cache.values()), errors
 
+    def _load_rule_file(self, file_path: Path) -> Tuple[Optional[RuleDocument], Optional[str]]:
+        """Parse a single rule file, consulting the persistent index if enabled."""
+        if self.index is None:
+            frontmatter, error = self.parser.parse(file_path)
+            return self._build_rule_document(file_path, frontmatter, error)
+
+        try:
+            stat = file_path.stat()
+            entry = self.index.lookup(file_path, stat)
+            if entry is None:
+                raw = file_path.read_bytes()
+                content_hash = hashlib.sha256(raw).hexdigest()
+                entry = self.index.lookup(file_path, stat, content_hash)
+        except IOError as e:
+            return None, f"Error parsing frontmatter for {file_path}: {e}"
+
+        if entry is not None:
+            if entry.get('error'):
+                return None, entry['error']
+            if entry.get('document') is None:
+                return None, None
+            return RuleDocument.model_validate(entry['document']), None
+
+        frontmatter, error = self.parser.parse_content(raw.decode('utf-8'), file_path)
+        rule_doc, error = self._build_rule_document(file_path, frontmatter, error)
+        document = rule_doc.model_dump(mode='json') if rule_doc is not None else None
+        self.index.store(file_path, stat, content_hash, document, error)
+        return rule_doc, error
+
+    def _build_rule_document(self, file_path: Path, frontmatter: Optional[Dict],
+                             error: Optional[str]) -> Tuple[Optional[RuleDocument], Optional[str]]:
+        """Validate parsed frontmatter into a RuleDocument."""
+        if error:
+            return None, error
+
+        if not frontmatter:
+            # This is not an error, just a file without frontmatter to parse.
+            return None, None
+
+        try:
+            if not isinstance(frontmatter, dict) or not all(isinstance(k, str) for k in frontmatter):
+                raise ValueError("Front-matter must be a mapping with string keys")
+            if 'version' in frontmatter:
+                frontmatter['version'] = str(frontmatter['version'])
+            # Add file_path to the frontmatter data
+            frontmatter['file_path'] = str(file_path)
+            return RuleDocument(**frontmatter), None
+        except (ValidationError, TypeError, ValueError) as e:
+            return None, f"Validation error for {file_path.name}: {e}"
+
     def query_by_tags(self, tags: List[str], match_all: bool = True, sort_by: str = 'title', limit: Optional[int] = None, offset: int = 0) -> List[RuleDocument]:
         """
         Queries the cached rules by a list of tags.
@@ -1,20 +1,49 @@
 """Synchronization service for distributing rules to agent folders."""
 
 import hashlib
+import json
+import os
 import shutil
+import threading
+import time
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import Any, List, Dict, Optional, Set, Tuple
 import logging
 from concurrent.futures import ThreadPoolExecutor
 import fnmatch
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 from .models import RuleDocument
-from .config import RulesServiceConfig, ConflictStrategy, AgentFolder
+from .config import RulesServiceConfig, ConflictStrategy, AgentFolder, LinkMode
 
 
 logger = logging.getLogger(__name__)
 
+# Default location of the per-folder sync manifests, relative to the repository root
+DEFAULT_MANIFEST_DIR = Path(".cache") / "sync-manifests"
+
+# Files modified this close to being recorded may change again without their
+# mtime moving, so their recorded stat data is not trusted on its own
+RACY_WINDOW_NS = 2_000_000_000
+
+# Bytes read from each end of a file for its fingerprint
+FINGERPRINT_BLOCK_SIZE = 4096
+
+# Comparison tiers, from cheapest to most expensive
+TIER_LINK = "link"
+TIER_STAT = "stat"
+TIER_FINGERPRINT = "fingerprint"
+TIER_CHECKSUM = "checksum"
+
+# ioctl cloning a whole file on copy-on-write filesystems (Linux _IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
 
 @dataclass
 class SyncResult:
@@ -24,6 +53,8 @@ class SyncResult:
     deleted: int = 0
     skipped: int = 0
     errors: List[str] = field(default_factory=list)
+    # Number of existing targets whose comparison was settled at each tier
+    comparisons: Dict[str, int] = field(default_factory=dict)
 
     @property
     def total_changes(self) -> int:
@@ -37,14 +68,27 @@ class SyncResult:
         self.deleted += other.deleted
         self.skipped += other.skipped
         self.errors.extend(other.errors)
+        for tier, count in other.comparisons.items():
+            self.comparisons[tier] = self.comparisons.get(tier, 0) + count
+
+    def count_comparison(self, tier: Optional[str]) -> None:
+        """Count a comparison settled at the given tier."""
+        if tier is not None:
+            self.comparisons[tier] = self.comparisons.get(tier, 0) + 1
 
 
 class FileHashCache:
-    """Cache for file hashes to speed up change detection."""
+    """
+    Cache for file hashes to speed up change detection.
+
+    Entries are keyed on the nanosecond mtime and size of a file, and the
+    cache may be shared by the threads of a sync.
+    """
 
     def __init__(self, algorithm: str = "sha256"):
         self.algorithm = algorithm
-        self._cache: Dict[Path, Tuple[float, str]] = {}
+        self._cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
 
     def get_hash(self, file_path: Path) -> str:
         """Get hash of a file, using cache if available."""
@@ -52,13 +96,13 @@ class FileHashCache:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         stat = file_path.stat()
-        mtime = stat.st_mtime
+        signature = (stat.st_mtime_ns, stat.st_size)
 
         # Check cache
-        if file_path in self._cache:
-            cached_mtime, cached_hash = self._cache[file_path]
-            if cached_mtime == mtime:
-                return cached_hash
+        with self._lock:
+            cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
         # Calculate hash
         hash_obj = hashlib.new(self.algorithm)
@@ -67,22 +111,238 @@ class FileHashCache:
                 hash_obj.update(chunk)
 
         file_hash = hash_obj.hexdigest()
-        self._cache[file_path] = (mtime, file_hash)
+        with self._lock:
+            self._cache[file_path] = (signature, file_hash)
         return file_hash
 
     def clear(self) -> None:
         """Clear the cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+
+
+class SyncManifest:
+    """
+    Persistent record of the files synced to one agent folder.
+
+    For every target file the manifest stores the source path and the stat
+    data and content hash of both the source and the target as of the last
+    sync. While the stat data of a file still matches, its recorded hash is
+    reused instead of reading the file again. Hashes are only comparable
+    when computed with the same algorithm, so a manifest written with a
+    different checksum algorithm is discarded.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: Path, checksum_algorithm: str = "sha256"):
+        self.manifest_path = Path(manifest_path)
+        self.checksum_algorithm = checksum_algorithm
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.last_sync: Optional[float] = None
+
+    def load(self) -> None:
+        """Load the manifest from disk, discarding it if missing or incompatible."""
+        self.entries = {}
+        self.last_sync = None
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (isinstance(data, dict) and data.get('version') == self.VERSION
+                and data.get('checksum_algorithm') == self.checksum_algorithm):
+            entries = data.get('entries')
+            if isinstance(entries, dict):
+                self.entries = entries
+            last_sync = data.get('last_sync')
+            if isinstance(last_sync, (int, float)):
+                self.last_sync = last_sync
+
+    def record(self, name: str, source: Path, source_stat: os.stat_result,
+               source_hash: Optional[str], target_stat: os.stat_result,
+               target_hash: Optional[str], link_mode: Optional[str] = None,
+               link: Optional[str] = None, identical: bool = True) -> None:
+        """
+        Record the state of a target file and its source after syncing it.
+
+        ``link_mode`` is the mode the target was last placed with and
+        ``link`` the one that actually took effect, which differ when the
+        placement fell back to a copy. ``identical`` tells whether the
+        target had the source's content, which is false for conflicts left
+        in place.
+        """
+        self.entries[name] = {
+            'source': str(source),
+            'source_hash': source_hash,
+            'source_mtime_ns': source_stat.st_mtime_ns,
+            'source_size': source_stat.st_size,
+            'target_hash': target_hash,
+            'target_mtime_ns': target_stat.st_mtime_ns,
+            'target_size': target_stat.st_size,
+            'link_mode': link_mode,
+            'link': link,
+            'identical': identical,
+            'recorded_ns': time.time_ns(),
+        }
+
+    def retain(self, names: Set[str]) -> None:
+        """Drop the entries of target files that are no longer synced."""
+        for name in set(self.entries) - names:
+            del self.entries[name]
+
+    @staticmethod
+    def known_hash(entry: Optional[Dict[str, Any]], side: str, stat: os.stat_result) -> Optional[str]:
+        """
+        Get the recorded hash of the source or target, if its stat data still matches.
+
+        Args:
+            entry: Manifest entry of the target file
+            side: Either "source" or "target"
+            stat: Current stat data of that file
+
+        Returns:
+            The recorded hash, or None if the file has to be read again
+        """
+        if not SyncManifest._unchanged(entry, side, stat):
+            return None
+        assert entry is not None
+        return entry.get(f'{side}_hash')
+
+    @staticmethod
+    def recorded_state(entry: Optional[Dict[str, Any]], source_stat: os.stat_result,
+                       target_stat: os.stat_result) -> Optional[bool]:
+        """
+        Get whether the target had the source's content when recorded, if neither moved since.
+
+        Returns:
+            True or False from the manifest, or None if the files have to be compared
+        """
+        if not (SyncManifest._unchanged(entry, 'source', source_stat)
+                and SyncManifest._unchanged(entry, 'target', target_stat)):
+            return None
+        assert entry is not None
+        if 'identical' in entry:
+            return bool(entry['identical'])
+        if entry.get('source_hash') is None:
+            return None
+        return entry['source_hash'] == entry.get('target_hash')
+
+    @staticmethod
+    def _unchanged(entry: Optional[Dict[str, Any]], side: str, stat: os.stat_result) -> bool:
+        """Check that a file's stat data matches the entry and is safely older than it."""
+        if entry is None:
+            return False
+        if entry.get(f'{side}_mtime_ns') != stat.st_mtime_ns or entry.get(f'{side}_size') != stat.st_size:
+            return False
+        return stat.st_mtime_ns < entry.get('recorded_ns', 0) - RACY_WINDOW_NS
+
+    def save(self) -> None:
+        """Write the manifest atomically, stamping the time of this sync."""
+        self.last_sync = time.time()
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION,
+                           'checksum_algorithm': self.checksum_algorithm,
+                           'last_sync': self.last_sync, 'entries': self.entries}, f)
+            temp_path.replace(self.manifest_path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+
+@dataclass
+class SyncAction:
+    """One planned operation on a file in an agent folder."""
+    folder: str
+    target: Path
+    action: str  # "add", "update", "skip" or "delete"
+    source: Optional[Path] = None
+    reason: str = ""
+    source_hash: Optional[str] = None
+    target_hash: Optional[str] = None
+    target_stat: Optional[os.stat_result] = field(default=None, repr=False)
+    link_mode: Optional[str] = None  # mode the target is placed with
+    link: Optional[str] = None  # mode that took effect, once placed
+    tier: Optional[str] = None  # comparison tier that settled the action
+
+
+@dataclass
+class FolderPlan:
+    """Planned operations for one agent folder."""
+    folder: AgentFolder
+    target_dir: Path
+    manifest: SyncManifest = field(repr=False)
+    create_directory: bool = False
+    actions: List[SyncAction] = field(default_factory=list)
+
+
+@dataclass
+class SyncPlan:
+    """
+    Everything a sync would do, worked out before any file is written.
+
+    Every source is stat'ed and hashed at most once, however many agent
+    folders it is synced to.
+    """
+    folders: List[FolderPlan] = field(default_factory=list)
+    source_stats: Dict[Path, os.stat_result] = field(default_factory=dict, repr=False)
+    source_hashes: Dict[Path, Optional[str]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def actions(self) -> List[SyncAction]:
+        """All planned actions, folder by folder."""
+        return [action for folder_plan in self.folders for action in folder_plan.actions]
+
+    def actions_of(self, kind: str) -> List[SyncAction]:
+        """Planned actions of one kind: "add", "update", "skip" or "delete"."""
+        return [action for action in self.actions if action.action == kind]
+
+    def to_result(self) -> SyncResult:
+        """Summarize the plan as the result executing it would report."""
+        result = SyncResult(
+            added=len(self.actions_of("add")),
+            updated=len(self.actions_of("update")),
+            deleted=len(self.actions_of("delete")),
+            skipped=len(self.actions_of("skip")),
+            errors=list(self.errors),
+        )
+        for action in self.actions:
+            result.count_comparison(action.tier)
+        return result
 
 
 class SyncService:
     """Service for synchronizing rule files to agent folders."""
 
-    def __init__(self, config: RulesServiceConfig, root_path: Path):
+    def __init__(self, config: RulesServiceConfig, root_path: Path,
+                 manifest_dir: Optional[Path] = None):
+        """
+        Args:
+            config: Rules Service configuration
+            root_path: Repository root the agent folders are relative to
+            manifest_dir: Where per-folder sync manifests are kept
+                          (default: .cache/sync-manifests under the root)
+        """
         self.config = config
         self.root_path = root_path
+        self.manifest_dir = Path(manifest_dir) if manifest_dir else Path(root_path) / DEFAULT_MANIFEST_DIR
         self.hash_cache = FileHashCache(config.performance.checksum_algorithm)
 
+    def _manifest_for(self, folder: AgentFolder) -> SyncManifest:
+        """Load the manifest of an agent folder."""
+        name = folder.path.strip('/').replace('/', '__') or '_root'
+        manifest = SyncManifest(self.manifest_dir / f"{name}.json",
+                                self.config.performance.checksum_algorithm)
+        manifest.load()
+        return manifest
+
     def sync_rules(self, rules: List[RuleDocument], dry_run: bool = False) -> SyncResult:
         """
         Synchronize rules to all configured agent directories.
@@ -94,28 +354,320 @@ class SyncService:
         Returns:
             SyncResult with details of the operation
         """
-        total_result = SyncResult()
+        if not self.config.get_enabled_folders():
+            return SyncResult(errors=["No agent folders enabled in configuration"])
 
-        # Get enabled folders
-        enabled_folders = self.config.get_enabled_folders()
-        if not enabled_folders:
-            total_result.errors.append("No agent folders enabled in configuration")
-            return total_result
+        with self._executor() as executor:
+            plan = self.plan(rules, executor)
+            if dry_run:
+                return plan.to_result()
+            return self.execute(plan, executor)
 
-        # Filter rules based on patterns
-        filtered_rules = self._filter_rules(rules)
+    def _executor(self) -> ThreadPoolExecutor:
+        """Create the bounded pool shared by all folders of a sync."""
+        return ThreadPoolExecutor(max_workers=self.config.performance.max_parallel_operations)
+
+    def plan(self, rules: List[RuleDocument],
+             executor: Optional[ThreadPoolExecutor] = None) -> SyncPlan:
+        """
+        Work out what syncing the rules would do, without writing anything.
+
+        Sources are stat'ed and hashed once up front; the target comparisons
+        of all folders then run through the same pool.
+
+        Args:
+            rules: List of rule documents to sync
+            executor: Pool to run file I/O in (default: a new bounded pool)
+
+        Returns:
+            SyncPlan listing an action per target file
+        """
+        if executor is None:
+            with self._executor() as executor:
+                return self.plan(rules, executor)
+
+        plan = SyncPlan()
+        sources: Dict[str, Path] = {}
+        for rule in self._filter_rules(rules):
+            # Of several sources with the same name, the last one wins
+            source = Path(rule.file_path)
+            sources.pop(source.name, None)
+            sources[source.name] = source
+
+        for folder in self.config.get_enabled_folders():
+            target_dir = self.root_path / folder.path
+            folder_plan = FolderPlan(folder, target_dir, self._manifest_for(folder))
+            if not target_dir.exists():
+                if not self.config.sync.create_directories:
+                    plan.errors.append(f"Target directory does not exist: {target_dir}")
+                    continue
+                folder_plan.create_directory = True
+            plan.folders.append(folder_plan)
+
+        # Stat and hash every source once, whatever the number of folders
+        source_list = list(sources.values())
+        states = executor.map(lambda source: self._source_state(source, plan.folders), source_list)
+        for source, (stat, source_hash, error) in zip(source_list, states):
+            if error is not None:
+                plan.errors.append(f"Error syncing {source}: {error}")
+                continue
+            plan.source_stats[source] = stat
+            plan.source_hashes[source] = source_hash
+
+        # Compare the targets of all folders through the same pool
+        pairs = [
+            (folder_plan, source)
+            for folder_plan in plan.folders
+            for source in source_list
+            if source in plan.source_stats
+        ]
+        actions = executor.map(lambda pair: self._plan_file(plan, *pair), pairs)
+        for (folder_plan, source), action in zip(pairs, actions):
+            if isinstance(action, SyncAction):
+                folder_plan.actions.append(action)
+            else:
+                plan.errors.append(f"Error syncing {source}: {action}")
+
+        if self.config.sync.clean_orphaned:
+            for folder_plan in plan.folders:
+                if folder_plan.create_directory:
+                    continue
+                expected = {folder_plan.target_dir / name for name in sources}
+                for orphan in sorted(set(folder_plan.target_dir.glob("*.rules.md")) - expected):
+                    folder_plan.actions.append(SyncAction(
+                        folder=folder_plan.folder.path, target=orphan, action="delete",
+                        reason="no matching source"
+                    ))
+
+        return plan
+
+    def _source_state(self, source: Path, folder_plans: List[FolderPlan]
+                      ) -> Tuple[Optional[os.stat_result], Optional[str], Optional[Exception]]:
+        """
+        Stat a source and get its hash, preferring one recorded in any folder's manifest.
 
-        # Sync to each folder
-        for folder in enabled_folders:
+        Returns:
+            The stat data, the hash (None without checksums) and any error raised
+        """
+        try:
+            stat = source.stat()
+            if not self.config.performance.use_checksums:
+                return stat, None, None
+
+            for folder_plan in folder_plans:
+                entry = folder_plan.manifest.entries.get(source.name)
+                if entry is not None and entry.get('source') == str(source):
+                    known = SyncManifest.known_hash(entry, 'source', stat)
+                    if known is not None:
+                        return stat, known, None
+            return stat, self.hash_cache.get_hash(source), None
+        except Exception as e:
+            return None, None, e
+
+    def _plan_file(self, plan: SyncPlan, folder_plan: FolderPlan, source: Path) -> Any:
+        """
+        Compare one target with its source, handling conflicts according to strategy.
+
+        Returns:
+            The planned SyncAction, or the exception raised while comparing
+        """
+        target = folder_plan.target_dir / source.name
+        link_mode = self.config.sync.link_mode
+        action = SyncAction(
+            folder=folder_plan.folder.path, target=target, action="add",
+            source=source, source_hash=plan.source_hashes[source], link_mode=link_mode.value
+        )
+        try:
+            if folder_plan.create_directory or not target.exists():
+                action.reason = "target missing"
+                return action
+
+            source_stat = plan.source_stats[source]
+            action.target_stat = target_stat = target.stat()
+            entry = folder_plan.manifest.entries.get(target.name)
+            if entry is not None and entry.get('source') != str(source):
+                # The target was last synced from a different source file
+                entry = None
+
+            # A target linked to its source always has the source's content
+            linked = _linked_as(source, target, source_stat)
+            if linked is not None:
+                action.target_hash, action.tier = action.source_hash, TIER_LINK
+                if linked == link_mode:
+                    action.action, action.reason, action.link = "skip", "linked", linked.value
+                else:
+                    action.action, action.reason = "update", "link mode changed"
+                return action
+
+            # Check if files are different
+            files_identical, action.tier = self._compare(action, source_stat, target_stat, entry)
+            if files_identical and action.target_hash is None:
+                action.target_hash = action.source_hash
+
+            if files_identical and link_mode in (LinkMode.HARDLINK, LinkMode.SYMLINK) and (
+                entry is None or entry.get('link_mode') != link_mode.value
+            ):
+                # Link the copy, unless linking it already fell back to a copy
+                action.action, action.reason = "update", "link mode changed"
+            elif files_identical:
+                action.action, action.reason = "skip", "unchanged"
+                if entry is not None:
+                    action.link_mode, action.link = entry.get('link_mode'), entry.get('link')
+            # Handle conflict
+            elif self.config.sync.conflict_strategy == ConflictStrategy.SKIP:
+                action.action, action.reason = "skip", "conflict"
+            elif self.config.sync.conflict_strategy == ConflictStrategy.OVERWRITE:
+                action.action, action.reason = "update", "content differs"
+            else:  # ASK strategy
+                # ASK strategy is designed for future CLI interactive use.
+                # In automated contexts (pre-commit hooks, programmatic usage),
+                # we fall back to SKIP to prevent blocking automated workflows.
+                # When CLI is implemented in Milestone 5, this will prompt the user.
+                logger.info(f"Conflict for {target}, skipping (ASK strategy in automated mode)")
+                action.action, action.reason = "skip", "conflict"
+            return action
+        except Exception as e:
+            return e
+
+    def _compare(self, action: SyncAction, source_stat: os.stat_result,
+                 target_stat: os.stat_result, entry: Optional[Dict[str, Any]]) -> Tuple[bool, str]:
+        """
+        Tell whether a target has its source's content, reading as little as possible.
+
+        Tiers are tried from cheapest to most expensive: the sizes and the
+        stat data recorded in the manifest, then a fingerprint of both ends
+        of the files, then the full checksum if ``use_checksums`` is on.
+
+        Returns:
+            Whether the files are identical and the tier that settled it
+        """
+        assert action.source is not None
+        use_checksums = self.config.performance.use_checksums
+
+        # Tier 1: stat data
+        if source_stat.st_size != target_stat.st_size:
+            return False, TIER_STAT
+        recorded = SyncManifest.recorded_state(entry, source_stat, target_stat)
+        if recorded is not None:
+            assert entry is not None
+            action.target_hash = entry.get('target_hash')
+            return recorded, TIER_STAT
+        known_target_hash = SyncManifest.known_hash(entry, 'target', target_stat)
+        if use_checksums and action.source_hash is not None and known_target_hash is not None:
+            action.target_hash = known_target_hash
+            return action.source_hash == known_target_hash, TIER_CHECKSUM
+
+        # Tier 2: fingerprint
+        try:
+            source_fingerprint, complete = _fingerprint(action.source, source_stat.st_size)
+            target_fingerprint, _ = _fingerprint(action.target, target_stat.st_size)
+        except OSError as e:
+            logger.warning(f"Error comparing files, falling back to size comparison: {e}")
+            return True, TIER_STAT
+        if source_fingerprint != target_fingerprint:
+            return False, TIER_FINGERPRINT
+        if complete or not use_checksums:
+            return True, TIER_FINGERPRINT
+
+        # Tier 3: full checksum
+        try:
+            action.target_hash = self.hash_cache.get_hash(action.target)
+            return action.source_hash == action.target_hash, TIER_CHECKSUM
+        except Exception as e:
+            logger.warning(f"Error comparing files, falling back to fingerprint comparison: {e}")
+            return True, TIER_FINGERPRINT
+
+    def execute(self, plan: SyncPlan,
+                executor: Optional[ThreadPoolExecutor] = None) -> SyncResult:
+        """
+        Carry out a plan and record the outcome in each folder's manifest.
+
+        Args:
+            plan: Plan returned by ``plan()``
+            executor: Pool to copy files in (default: a new bounded pool)
+
+        Returns:
+            SyncResult with details of the operation
+        """
+        if executor is None:
+            with self._executor() as executor:
+                return self.execute(plan, executor)
+
+        result = SyncResult(errors=list(plan.errors))
+        folder_plans = []
+        for folder_plan in plan.folders:
+            if folder_plan.create_directory:
+                try:
+                    folder_plan.target_dir.mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    error_msg = f"Error syncing to {folder_plan.folder.path}: {str(e)}"
+                    logger.error(error_msg)
+                    result.errors.append(error_msg)
+                    continue
+            folder_plans.append(folder_plan)
+
+        copies = [
+            action
+            for folder_plan in folder_plans
+            for action in folder_plan.actions
+            if action.action in ("add", "update")
+        ]
+        outcomes = dict(zip(map(id, copies), executor.map(self._copy_action, copies)))
+
+        for folder_plan in folder_plans:
+            manifest = folder_plan.manifest
+            for action in folder_plan.actions:
+                if action.action == "delete":
+                    try:
+                        action.target.unlink()
+                        result.deleted += 1
+                    except Exception as e:
+                        logger.error(f"Error deleting orphaned file {action.target}: {e}")
+                    continue
+
+                assert action.source is not None
+                source_stat = plan.source_stats[action.source]
+                result.count_comparison(action.tier)
+                if action.action == "skip":
+                    result.skipped += 1
+                    assert action.target_stat is not None
+                    manifest.record(action.target.name, action.source, source_stat,
+                                    action.source_hash, action.target_stat, action.target_hash,
+                                    action.link_mode, action.link,
+                                    identical=action.reason != "conflict")
+                    continue
+
+                outcome = outcomes[id(action)]
+                if isinstance(outcome, Exception):
+                    result.errors.append(f"Error syncing {action.source}: {str(outcome)}")
+                    continue
+                if action.action == "add":
+                    result.added += 1
+                else:
+                    result.updated += 1
+                # A freshly placed target has the content of its source
+                manifest.record(action.target.name, action.source, source_stat,
+                                action.source_hash, outcome, action.source_hash,
+                                action.link_mode, action.link)
+
+            manifest.retain({
+                action.target.name for action in folder_plan.actions if action.action != "delete"
+            })
             try:
-                folder_result = self._sync_to_folder(filtered_rules, folder, dry_run)
-                total_result.merge(folder_result)
-            except Exception as e:
-                error_msg = f"Error syncing to {folder.path}: {str(e)}"
-                logger.error(error_msg)
-                total_result.errors.append(error_msg)
+                manifest.save()
+            except OSError as e:
+                logger.warning(f"Could not write sync manifest {manifest.manifest_path}: {e}")
+
+        return result
 
-        return total_result
+    def _copy_action(self, action: SyncAction) -> Any:
+        """Place the source of an add or update action, returning the new target's stat data or the error."""
+        assert action.source is not None
+        try:
+            action.link = self._place_file(action.source, action.target).value
+            return action.target.stat()
+        except Exception as e:
+            return e
 
     def _filter_rules(self, rules: List[RuleDocument]) -> List[RuleDocument]:
         """Filter rules based on include/exclude patterns."""
@@ -145,106 +697,6 @@ class SyncService:
 
         return filtered
 
-    def _sync_to_folder(self, rules: List[RuleDocument], folder: AgentFolder,
-                       dry_run: bool) -> SyncResult:
-        """Sync rules to a specific agent folder."""
-        result = SyncResult()
-        target_dir = self.root_path / folder.path
-
-        # Create directory if needed
-        if not dry_run and self.config.sync.create_directories:
-            target_dir.mkdir(parents=True, exist_ok=True)
-        elif not target_dir.exists() and not dry_run:
-            result.errors.append(f"Target directory does not exist: {target_dir}")
-            return result
-
-        # Build source to target mapping
-        source_files: Set[Path] = set()
-        target_to_source: Dict[Path, Path] = {}
-
-        for rule in rules:
-            if not hasattr(rule, 'file_path') or rule.file_path is None:
-                continue
-
-            source_path = Path(rule.file_path)
-            target_path = target_dir / source_path.name
-            source_files.add(source_path)
-            target_to_source[target_path] = source_path
-
-        # Sync files
-        with ThreadPoolExecutor(max_workers=self.config.performance.max_parallel_operations) as executor:
-            futures = []
-
-            for target_path, source_path in target_to_source.items():
-                future = executor.submit(
-                    self._sync_file, source_path, target_path, dry_run
-                )
-                futures.append((future, source_path, target_path))
-
-            for future, source_path, target_path in futures:
-                try:
-                    action = future.result()
-                    if action == "added":
-                        result.added += 1
-                    elif action == "updated":
-                        result.updated += 1
-                    elif action == "skipped":
-                        result.skipped += 1
-                except Exception as e:
-                    result.errors.append(f"Error syncing {source_path}: {str(e)}")
-
-        # Clean orphaned files
-        if self.config.sync.clean_orphaned:
-            orphan_result = self._clean_orphaned_files(
-                target_dir, set(target_to_source.keys()), dry_run
-            )
-            result.deleted += orphan_result
-
-        return result
-
-    def _sync_file(self, source: Path, target: Path, dry_run: bool) -> str:
-        """
-        Sync a single file, handling conflicts according to strategy.
-
-        Returns:
-            Action taken: "added", "updated", "skipped"
-        """
-        # Check if target exists
-        if not target.exists():
-            if not dry_run:
-                self._copy_file_atomic(source, target)
-            return "added"
-
-        # Check if files are different
-        if self.config.performance.use_checksums:
-            try:
-                source_hash = self.hash_cache.get_hash(source)
-                target_hash = self.hash_cache.get_hash(target)
-                files_identical = source_hash == target_hash
-            except Exception as e:
-                logger.warning(f"Error comparing files, falling back to size comparison: {e}")
-                files_identical = source.stat().st_size == target.stat().st_size
-        else:
-            files_identical = source.stat().st_size == target.stat().st_size
-
-        if files_identical:
-            return "skipped"
-
-        # Handle conflict
-        if self.config.sync.conflict_strategy == ConflictStrategy.SKIP:
-            return "skipped"
-        elif self.config.sync.conflict_strategy == ConflictStrategy.OVERWRITE:
-            if not dry_run:
-                self._copy_file_atomic(source, target)
-            return "updated"
-        else:  # ASK strategy
-            # ASK strategy is designed for future CLI interactive use.
-            # In automated contexts (pre-commit hooks, programmatic usage),
-            # we fall back to SKIP to prevent blocking automated workflows.
-            # When CLI is implemented in Milestone 5, this will prompt the user.
-            logger.info(f"Conflict for {target}, skipping (ASK strategy in automated mode)")
-            return "skipped"
-
     def _copy_file_atomic(self, source: Path, target: Path) -> None:
         """Copy file atomically to prevent partial writes."""
         temp_target = target.with_suffix(target.suffix + '.tmp')
@@ -256,28 +708,40 @@ class SyncService:
                 temp_target.unlink()
             raise
 
-    def _clean_orphaned_files(self, target_dir: Path, expected_files: Set[Path],
-                             dry_run: bool) -> int:
-        """Remove files in target directory that are not in expected set."""
-        deleted_count = 0
+    def _place_file(self, source: Path, target: Path) -> LinkMode:
+        """
+        Put a source file at its target according to the configured link mode.
 
-        # Find all .rules.md files in target
-        existing_files = set(target_dir.glob("*.rules.md"))
+        Links and clones are created under a temporary name and moved into
+        place like copies. Where the mode is unavailable, the file is copied.
 
-        # Find orphans
-        orphans = existing_files - expected_files
+        Returns:
+            The link mode that took effect
+        """
+        link_mode = self.config.sync.link_mode
+        if link_mode == LinkMode.COPY:
+            self._copy_file_atomic(source, target)
+            return LinkMode.COPY
 
-        for orphan in orphans:
-            if not dry_run:
-                try:
-                    orphan.unlink()
-                    deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Error deleting orphaned file {orphan}: {e}")
+        temp_target = target.with_suffix(target.suffix + '.tmp')
+        try:
+            if os.path.lexists(temp_target):
+                temp_target.unlink()
+            if link_mode == LinkMode.HARDLINK:
+                os.link(source, temp_target)
+            elif link_mode == LinkMode.SYMLINK:
+                os.symlink(os.path.relpath(source.resolve(), target.parent.resolve()), temp_target)
             else:
-                deleted_count += 1
+                _clone_file(source, temp_target)
+            temp_target.replace(target)
+            return link_mode
+        except OSError as e:
+            if os.path.lexists(temp_target):
+                temp_target.unlink()
+            logger.debug(f"Cannot {link_mode.value} {source} to {target}, copying instead: {e}")
 
-        return deleted_count
+        self._copy_file_atomic(source, target)
+        return LinkMode.COPY
 
     def get_sync_status(self, rules: List[RuleDocument]) -> Dict[str, Dict[str, str]]:
         """
@@ -290,11 +754,12 @@ class SyncService:
         filtered_rules = self._filter_rules(rules)
 
         for folder in self.config.get_enabled_folders():
+            manifest = self._manifest_for(folder)
             folder_status = {
                 "enabled": str(folder.enabled),
                 "exists": str((self.root_path / folder.path).exists()),
                 "rule_count": "0",
-                "last_sync": "never"
+                "last_sync": _format_timestamp(manifest.last_sync) if manifest.last_sync else "never"
             }
 
             target_dir = self.root_path / folder.path
@@ -307,7 +772,9 @@ class SyncService:
                 for rule in filtered_rules:
                     if hasattr(rule, 'file_path') and rule.file_path is not None:
                         target_path = target_dir / Path(rule.file_path).name
-                        if target_path.exists():
+                        if target_path.exists() and not self._changed_since_sync(
+                            manifest, Path(rule.file_path), target_path
+                        ):
                             matches += 1
 
                 if matches == len(filtered_rules) and matches == len(rule_files):
@@ -320,3 +787,81 @@ class SyncService:
             status[folder.path] = folder_status
 
         return status
+
+    @staticmethod
+    def _changed_since_sync(manifest: SyncManifest, source: Path, target: Path) -> bool:
+        """Check whether the manifest shows a source or target changed after the last sync."""
+        if _linked_as(source, target) is not None:
+            return False
+
+        entry = manifest.entries.get(target.name)
+        if entry is None:
+            return False
+        if entry.get('source') != str(source):
+            return True
+
+        for side, path in (('source', source), ('target', target)):
+            stat = path.stat()
+            if entry.get(f'{side}_mtime_ns') != stat.st_mtime_ns or entry.get(f'{side}_size') != stat.st_size:
+                return True
+        return False
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _linked_as(source: Path, target: Path,
+               source_stat: Optional[os.stat_result] = None) -> Optional[LinkMode]:
+    """Tell whether the target is a symbolic or hard link to the source."""
+    if target.is_symlink():
+        return LinkMode.SYMLINK if target.resolve() == source.resolve() else None
+
+    source_stat = source_stat or source.stat()
+    target_stat = target.stat()
+    if (target_stat.st_ino, target_stat.st_dev) == (source_stat.st_ino, source_stat.st_dev):
+        return LinkMode.HARDLINK
+    return None
+
+
+def _fingerprint(path: Path, size: int) -> Tuple[bytes, bool]:
+    """
+    Read the first and last block of a file.
+
+    Returns:
+        The bytes read, and whether they make up the whole file
+    """
+    with open(path, 'rb') as f:
+        if size <= 2 * FINGERPRINT_BLOCK_SIZE:
+            return f.read(), True
+        head = f.read(FINGERPRINT_BLOCK_SIZE)
+        f.seek(-FINGERPRINT_BLOCK_SIZE, os.SEEK_END)
+        return head + f.read(FINGERPRINT_BLOCK_SIZE), False
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """
+    Copy a file without passing its data through user space.
+
+    ``FICLONE`` shares the source's blocks on copy-on-write filesystems;
+    elsewhere ``copy_file_range`` copies inside the kernel.
+
+    Raises:
+        OSError: If neither is supported for these files
+    """
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            if fcntl is None:
+                raise OSError("FICLONE is not supported on this platform")
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            if not hasattr(os, 'copy_file_range'):
+                raise
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    shutil.copystat(source, target)
@@ -1,16 +1,28 @@
 """Document validation engine for the Rules Service."""
 
 import re
+import bisect
 import datetime
-from typing import List, Dict, Optional, Any, Callable, Union, Tuple
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import cached_property, lru_cache
+from typing import List, Dict, Optional, Any, Callable, Deque, Iterable, Iterator, Sequence, Union, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 import yaml
 from yaml import YAMLError
 
+from .config import RulesServiceConfig
 from .models import RuleDocument
 
 
+# Documents a batch keeps in flight on an executor before waiting for the oldest
+BATCH_WINDOW = 256
+
+# Paths whose detected document type is remembered
+DETECTION_CACHE_SIZE = 16384
+
+
 class DocumentType:
     """Constants for document types."""
     DECISION = "decision"
@@ -78,6 +90,11 @@ class ValidationIssue:
             'rule_source': self.rule_source
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationIssue":
+        """Create an issue from its serialized form."""
+        return cls(**data)
+
 
 @dataclass
 class ValidationResult:
@@ -143,6 +160,87 @@ class ValidationResult:
             }
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        """Create a result from its serialized form, ignoring the derived summary."""
+        return cls(
+            file_path=data['file_path'],
+            document_type=data['document_type'],
+            issues=[ValidationIssue.from_dict(issue) for issue in data['issues']],
+            validation_time=data.get('validation_time'),
+            rule_count=data.get('rule_count', 0),
+        )
+
+
+def parse_frontmatter(content: str) -> Dict[str, Any]:
+    """Extract frontmatter from markdown content."""
+    if not content.startswith('---'):
+        return {}
+
+    try:
+        # Find the end of frontmatter
+        end_match = re.search(r'\n---\n', content[3:])
+        if not end_match:
+            return {}
+
+        frontmatter_text = content[3:end_match.start() + 3]
+        return yaml.safe_load(frontmatter_text) or {}
+    except YAMLError:
+        return {}
+
+
+class ParsedDocument:
+    """
+    Lazily parsed view of a document shared by all rule checkers.
+
+    Each derived value (frontmatter, lines, headers, word count) is computed
+    at most once per document, however many rules ask for it.
+    """
+
+    SECTION_PATTERN = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+
+    def __init__(self, content: str):
+        self.content = content
+
+    @classmethod
+    def of(cls, document: Union[str, "ParsedDocument"]) -> "ParsedDocument":
+        """Return the document itself if already parsed, otherwise wrap the content."""
+        if isinstance(document, ParsedDocument):
+            return document
+        return cls(document)
+
+    @cached_property
+    def frontmatter(self) -> Dict[str, Any]:
+        """Parsed YAML frontmatter, or an empty dict."""
+        return parse_frontmatter(self.content)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Document lines (split on newline)."""
+        return self.content.split('\n')
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Character offset at which each line starts."""
+        offsets = [0]
+        for line in self.lines[:-1]:
+            offsets.append(offsets[-1] + len(line) + 1)
+        return offsets
+
+    @cached_property
+    def headers(self) -> List[str]:
+        """Text of all markdown section headers, in document order."""
+        return [match.group(1).strip() for match in self.SECTION_PATTERN.finditer(self.content)]
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words."""
+        return len(self.content.split())
+
+    def line_number_at(self, offset: int) -> int:
+        """1-based line number containing a character offset."""
+        return bisect.bisect_right(self.line_offsets, offset)
+
 
 @dataclass
 class ExtractedRule:
@@ -158,6 +256,75 @@ class ExtractedRule:
     applies_to: List[str] = field(default_factory=list)
     source_file: Optional[str] = None
     line_number: Optional[int] = None
+    compiled_pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    pattern_error: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.rule_type == 'pattern':
+            self.compile_pattern()
+
+    def compile_pattern(self) -> Optional[re.Pattern]:
+        """Compile the rule's pattern once, recording any regex error."""
+        self.compiled_pattern = None
+        self.pattern_error = None
+        if self.pattern:
+            try:
+                self.compiled_pattern = re.compile(self.pattern)
+            except re.error as e:
+                self.pattern_error = str(e)
+        return self.compiled_pattern
+
+    @property
+    def is_forbidden_pattern(self) -> bool:
+        """Whether the pattern must NOT appear (checked line by line)."""
+        description = self.description.lower()
+        return 'must not' in description or 'should not' in description
+
+
+class LinePatternScanner:
+    """
+    Scans document lines for several "must not" pattern rules at once.
+
+    All patterns without capture groups are combined into a single
+    alternation used as a per-line prefilter; only lines it matches are
+    checked against the individual rules. Patterns with groups (which could
+    carry backreferences) are always checked individually.
+    """
+
+    def __init__(self, rules: List[ExtractedRule]):
+        self.rules = [rule for rule in rules if rule.compiled_pattern is not None]
+        combinable = [rule for rule in self.rules if rule.compiled_pattern.groups == 0]
+
+        self.prefilter: Optional[re.Pattern] = None
+        if combinable:
+            try:
+                self.prefilter = re.compile('|'.join(f'(?:{rule.pattern})' for rule in combinable))
+            except re.error:
+                combinable = []
+
+        self.candidate_rules = combinable
+        self.unconditional_rules = [rule for rule in self.rules if rule not in combinable]
+
+    def scan(self, lines: List[str]) -> Dict[int, List[int]]:
+        """
+        Find violating lines.
+
+        Returns:
+            Mapping of id(rule) to the 1-based line numbers where it matches
+        """
+        hits: Dict[int, List[int]] = {id(rule): [] for rule in self.rules}
+        prefilter = self.prefilter
+
+        for i, line in enumerate(lines, 1):
+            if prefilter is not None and prefilter.search(line):
+                for rule in self.candidate_rules:
+                    if rule.compiled_pattern.search(line):
+                        hits[id(rule)].append(i)
+            for rule in self.unconditional_rules:
+                if rule.compiled_pattern.search(line):
+                    hits[id(rule)].append(i)
+
+        return hits
 
 
 class RuleExtractor:
@@ -357,9 +524,12 @@ class RuleEngine:
             'content': []
         }
         self.rules_by_document_type: Dict[str, List[ExtractedRule]] = {}
+        # Resolved rules per document type, rebuilt after rules are added
+        self._resolved: Dict[str, Tuple[ExtractedRule, ...]] = {}
 
     def add_rules(self, rules: List[ExtractedRule]):
         """Add extracted rules to the engine."""
+        self._resolved = {}
         for rule in rules:
             # Organize by rule type
             if rule.rule_type in self.rules_by_type:
@@ -371,8 +541,50 @@ class RuleEngine:
                     self.rules_by_document_type[doc_type] = []
                 self.rules_by_document_type[doc_type].append(rule)
 
+    @property
+    def diagnostics(self) -> List[str]:
+        """Problems found while loading rules, such as invalid regex patterns."""
+        seen = set()
+        messages = []
+        for rule_list in self.rules_by_type.values():
+            for rule in rule_list:
+                if rule.pattern_error and id(rule) not in seen:
+                    seen.add(id(rule))
+                    source = f" ({rule.source_file})" if rule.source_file else ""
+                    messages.append(
+                        f"Invalid pattern in rule {rule.rule_id}{source}: {rule.pattern_error}"
+                    )
+        return messages
+
     def get_rules_for_document(self, document_type: str) -> List[ExtractedRule]:
         """Get all rules that apply to a specific document type."""
+        return list(self.rules_for_document(document_type))
+
+    def rules_for_document(self, document_type: str) -> Tuple[ExtractedRule, ...]:
+        """
+        Get the rules that apply to a document type, resolved once per type.
+
+        Returns:
+            Type-specific rules followed by universal ones, unique by rule id
+        """
+        resolved = self._resolved.get(document_type)
+        if resolved is None:
+            resolved = self._resolve(document_type)
+            self._resolved[document_type] = resolved
+        return resolved
+
+    def rule_counts_by_document_type(self) -> Dict[str, int]:
+        """
+        Number of rules applying to each document type.
+
+        Covers every type with type-specific rules, plus
+        ``DocumentType.UNKNOWN`` for documents only universal rules apply to.
+        """
+        document_types = sorted(set(self.rules_by_document_type) | {DocumentType.UNKNOWN})
+        return {doc_type: len(self.rules_for_document(doc_type)) for doc_type in document_types}
+
+    def _resolve(self, document_type: str) -> Tuple[ExtractedRule, ...]:
+        """Collect the rules for a document type by scanning the whole rule set."""
         rules = []
 
         # Get type-specific rules
@@ -393,11 +605,16 @@ class RuleEngine:
                 seen.add(rule.rule_id)
                 unique_rules.append(rule)
 
-        return unique_rules
+        return tuple(unique_rules)
 
 
 class DocumentTypeDetector:
-    """Detects document type from file path and name."""
+    """
+    Detects document type from file path and name.
+
+    The mappings are compiled into tries of reversed suffixes and a single
+    regex alternation of path patterns, and detections are cached per path.
+    """
 
     # Mapping of file suffixes to document types
     SUFFIX_MAPPING = {
@@ -429,6 +646,95 @@ class DocumentTypeDetector:
         DocumentType.REGISTRY: ['/registries/', '/registry/'],
     }
 
+    # User-defined mappings, checked before the built-in ones
+    _custom_suffixes: Dict[str, str] = {}
+    _custom_path_patterns: Dict[str, List[str]] = {}
+
+    # Lookup structures built from the mappings above by _compile()
+    _custom_suffix_trie: Dict[str, Any] = {}
+    _suffix_trie: Dict[str, Any] = {}
+    _path_regex: Optional[re.Pattern] = None
+    _all_path_regex: Optional[re.Pattern] = None
+    _path_types: Dict[str, Tuple[int, str]] = {}  # pattern -> (priority, document type)
+
+    @classmethod
+    def configure(cls, suffixes: Optional[Dict[str, str]] = None,
+                  path_patterns: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Set user-defined type mappings, replacing any set before.
+
+        Args:
+            suffixes: File suffix to document type, e.g. {".adr.md": "decision"}
+            path_patterns: Document type to path fragments, e.g. {"decision": ["/adr/"]}
+        """
+        cls._custom_suffixes = {suffix.lower(): doc_type for suffix, doc_type in (suffixes or {}).items()}
+        cls._custom_path_patterns = {
+            doc_type: list(patterns) for doc_type, patterns in (path_patterns or {}).items()
+        }
+        cls._compile()
+
+    @classmethod
+    def load_config(cls, config_path: Path) -> None:
+        """
+        Apply the document types of a Rules Service configuration file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the configuration is invalid
+        """
+        document_types = RulesServiceConfig.from_file(config_path).document_types
+        cls.configure(document_types.suffixes, document_types.path_patterns)
+
+    @classmethod
+    def custom_mappings(cls) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """The user-defined suffixes and path patterns, as passed to ``configure``."""
+        return dict(cls._custom_suffixes), {k: list(v) for k, v in cls._custom_path_patterns.items()}
+
+    @classmethod
+    def _compile(cls) -> None:
+        """Build the reversed-suffix tries and the path alternation, and drop cached detections."""
+
+        # The first type listing a pattern owns it; user patterns come first
+        path_types: Dict[str, Tuple[int, str]] = {}
+        for mapping in (cls._custom_path_patterns, cls.PATH_PATTERNS):
+            for doc_type, patterns in mapping.items():
+                for pattern in patterns:
+                    path_types.setdefault(pattern, (len(path_types), doc_type))
+
+        cls._custom_suffix_trie = cls._build_suffix_trie(cls._custom_suffixes)
+        cls._suffix_trie = cls._build_suffix_trie(cls.SUFFIX_MAPPING)
+        cls._path_types = path_types
+        # A plain search tells quickly whether any pattern matches; a
+        # lookahead then finds overlapping matches, preferring at each
+        # position the pattern listed first
+        alternation = "|".join(re.escape(pattern) for pattern in path_types)
+        cls._path_regex = re.compile(alternation) if path_types else None
+        cls._all_path_regex = re.compile(f"(?=({alternation}))") if path_types else None
+        cls._detect_cached.cache_clear()
+
+    @staticmethod
+    def _build_suffix_trie(mapping: Dict[str, str]) -> Dict[str, Any]:
+        """Build a trie of the reversed suffixes of a suffix-to-type mapping."""
+        trie: Dict[str, Any] = {}
+        for suffix, doc_type in mapping.items():
+            node = trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[""] = doc_type  # Suffix ends here
+        return trie
+
+    @staticmethod
+    def _match_suffix(trie: Dict[str, Any], filename: str) -> Optional[str]:
+        """Walk the filename backwards through the trie; the longest matching suffix wins."""
+        doc_type = None
+        node = trie
+        for char in reversed(filename):
+            node = node.get(char)
+            if node is None:
+                break
+            doc_type = node.get("", doc_type)
+        return doc_type
+
     @classmethod
     def detect_type(cls, file_path: Union[str, Path]) -> str:
         """
@@ -440,20 +746,25 @@ class DocumentTypeDetector:
         Returns:
             Document type constant from DocumentType class
         """
-        path = Path(file_path)
-        path_str = str(path).replace('\\', '/')  # Normalize path separators
-        filename = path.name.lower()
-
-        # First, check file suffix
-        for suffix, doc_type in cls.SUFFIX_MAPPING.items():
-            if filename.endswith(suffix):
-                return doc_type
+        return cls._detect_cached(str(file_path))
 
-        # Then check path patterns
-        for doc_type, patterns in cls.PATH_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in path_str:
-                    return doc_type
+    @classmethod
+    @lru_cache(maxsize=DETECTION_CACHE_SIZE)
+    def _detect_cached(cls, file_path: str) -> str:
+        path_str = file_path.replace('\\', '/')  # Normalize path separators
+        filename = path_str.rsplit('/', 1)[-1].lower()
+
+        # First, check file suffix, user-defined ones before the built-in ones
+        doc_type = (cls._match_suffix(cls._custom_suffix_trie, filename)
+                    or cls._match_suffix(cls._suffix_trie, filename))
+        if doc_type is not None:
+            return doc_type
+
+        # Then check path patterns, preferring the pattern listed first
+        if cls._path_regex is not None and cls._path_regex.search(path_str):
+            assert cls._all_path_regex is not None
+            matches = [cls._path_types[match.group(1)] for match in cls._all_path_regex.finditer(path_str)]
+            return min(matches)[1]
 
         # Check for generic markdown files in specific directories
         if filename.endswith('.md'):
@@ -568,6 +879,9 @@ class DocumentTypeDetector:
         return type_info.get(document_type, type_info[DocumentType.UNKNOWN])
 
 
+DocumentTypeDetector._compile()
+
+
 class HumanInputCommentGenerator:
     """Generates human input comments for validation issues."""
 
@@ -773,6 +1087,34 @@ Priority: {priority}
         return -1
 
 
+def load_rule_content(rule_doc: RuleDocument, rule_contents: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Get content for a rule document.
+
+    Args:
+        rule_doc: The rule document metadata
+        rule_contents: Optional pre-loaded content dict
+
+    Returns:
+        Content string or None if not found
+    """
+    # First try the provided content dict
+    if rule_contents and rule_doc.file_path in rule_contents:
+        return rule_contents[rule_doc.file_path]
+
+    # Then try to read from file system if file_path is available
+    if rule_doc.file_path:
+        try:
+            file_path = Path(rule_doc.file_path)
+            if file_path.exists():
+                return file_path.read_text(encoding='utf-8')
+        except (OSError, IOError) as e:
+            # Log error but don't fail initialization
+            print(f"Warning: Could not read rule file {rule_doc.file_path}: {e}")
+
+    return None
+
+
 class ValidationService:
     """Service for validating documents against rules."""
 
@@ -789,6 +1131,8 @@ class ValidationService:
         self.rule_extractor = RuleExtractor()
         self.auto_fixer = AutoFixer()
         self.comment_generator = HumanInputCommentGenerator()
+        self._line_scanners: Dict[Tuple[int, ...], LinePatternScanner] = {}
+        self._rule_groups: Dict[str, Tuple[Sequence[ExtractedRule], Optional[LinePatternScanner]]] = {}
 
         # Extract rules from all rule documents
         for rule_doc in rules:
@@ -797,6 +1141,29 @@ class ValidationService:
                 extracted_rules = self.rule_extractor.extract_rules_from_document(rule_doc, content)
                 self.rule_engine.add_rules(extracted_rules)
 
+    @classmethod
+    def from_rule_engine(cls, rule_engine: RuleEngine) -> "ValidationService":
+        """
+        Create a service around an already populated rule engine.
+
+        This skips rule extraction entirely, e.g. when loading a compiled
+        rule-set snapshot.
+
+        Args:
+            rule_engine: Engine holding the extracted rules
+
+        Returns:
+            ValidationService using the given engine
+        """
+        service = cls([])
+        service.rule_engine = rule_engine
+        return service
+
+    @property
+    def rule_diagnostics(self) -> List[str]:
+        """Rule-load diagnostics (e.g. invalid patterns), to be reported once."""
+        return self.rule_engine.diagnostics
+
     def _get_rule_content(self, rule_doc: RuleDocument, rule_contents: Optional[Dict[str, str]]) -> Optional[str]:
         """
         Get content for a rule document.
@@ -808,21 +1175,7 @@ class ValidationService:
         Returns:
             Content string or None if not found
         """
-        # First try the provided content dict
-        if rule_contents and rule_doc.file_path in rule_contents:
-            return rule_contents[rule_doc.file_path]
-
-        # Then try to read from file system if file_path is available
-        if rule_doc.file_path:
-            try:
-                file_path = Path(rule_doc.file_path)
-                if file_path.exists():
-                    return file_path.read_text(encoding='utf-8')
-            except (OSError, IOError) as e:
-                # Log error but don't fail initialization
-                print(f"Warning: Could not read rule file {rule_doc.file_path}: {e}")
-
-        return None
+        return load_rule_content(rule_doc, rule_contents)
 
     def validate_document(self, file_path: Path, content: str) -> ValidationResult:
         """
@@ -835,14 +1188,81 @@ class ValidationService:
         Returns:
             ValidationResult with all found issues
         """
-        import time
-        start_time = time.time()
-
         # Detect document type
         doc_type = DocumentTypeDetector.detect_type(file_path)
 
         # Get applicable rules
-        rules = self.rule_engine.get_rules_for_document(doc_type)
+        rules, scanner = self._resolve_rules(doc_type)
+
+        return self._validate_with_rules(file_path, content, doc_type, rules, scanner)
+
+    def validate_batch(
+        self, documents: Iterable[Tuple[Union[str, Path], str]], executor: Optional[Executor] = None
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate many documents, yielding their results in input order.
+
+        Documents are grouped by type as they arrive, and each type's rules
+        are resolved once for the whole batch instead of once per document.
+        The documents are consumed lazily, so batches may span any number of
+        repositories without being held in memory.
+
+        Args:
+            documents: (file path, content) pairs
+            executor: Optional executor to validate documents concurrently;
+                      at most BATCH_WINDOW of them are in flight at a time
+
+        Yields:
+            ValidationResult for each document
+        """
+        groups: Dict[str, Tuple[Sequence[ExtractedRule], Optional[LinePatternScanner]]] = {}
+
+        def prepare(document: Tuple[Union[str, Path], str]) -> Tuple[Any, ...]:
+            file_path, content = document
+            doc_type = DocumentTypeDetector.detect_type(file_path)
+            if doc_type not in groups:
+                groups[doc_type] = self._resolve_rules(doc_type)
+            return (Path(file_path), content, doc_type) + groups[doc_type]
+
+        if executor is None:
+            for document in documents:
+                yield self._validate_with_rules(*prepare(document))
+            return
+
+        pending: Deque[Future] = deque()
+        try:
+            for document in documents:
+                pending.append(executor.submit(self._validate_with_rules, *prepare(document)))
+                if len(pending) >= BATCH_WINDOW:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The caller stopped early: drop the documents not yet started
+            for future in pending:
+                future.cancel()
+
+    def _resolve_rules(self, doc_type: str) -> Tuple[Sequence[ExtractedRule], Optional[LinePatternScanner]]:
+        """Get the rules for a document type and the scanner for its "must not" patterns."""
+        rules = self.rule_engine.rules_for_document(doc_type)
+        group = self._rule_groups.get(doc_type)
+        if group is not None and group[0] is rules:
+            return group
+
+        forbidden_rules = [
+            rule for rule in rules
+            if rule.rule_type == 'pattern' and rule.is_forbidden_pattern and rule.compiled_pattern is not None
+        ]
+        group = (rules, self._get_line_scanner(forbidden_rules) if forbidden_rules else None)
+        self._rule_groups[doc_type] = group
+        return group
+
+    def _validate_with_rules(self, file_path: Path, content: str, doc_type: str,
+                             rules: Sequence[ExtractedRule],
+                             scanner: Optional[LinePatternScanner]) -> ValidationResult:
+        """Validate a document against rules already resolved for its type."""
+        import time
+        start_time = time.time()
 
         # Create result
         result = ValidationResult(
@@ -851,35 +1271,69 @@ class ValidationService:
             rule_count=len(rules)
         )
 
+        # Parse the document once for all rules
+        document = ParsedDocument(content)
+
+        # Scan all "must not" line patterns in a single pass
+        forbidden_hits = scanner.scan(document.lines) if scanner is not None else {}
+
         # Apply each rule
         for rule in rules:
-            issues = self._apply_rule(rule, content, file_path)
+            if id(rule) in forbidden_hits:
+                issues = [
+                    self._forbidden_line_issue(rule, line_number, file_path)
+                    for line_number in forbidden_hits[id(rule)]
+                ]
+            else:
+                issues = self._apply_rule(rule, document, file_path)
             result.issues.extend(issues)
 
         result.validation_time = time.time() - start_time
         return result
 
-    def _apply_rule(self, rule: ExtractedRule, content: str, file_path: Path) -> List[ValidationIssue]:
+    def _get_line_scanner(self, rules: List[ExtractedRule]) -> LinePatternScanner:
+        """Get the combined scanner for a set of "must not" rules, building it once."""
+        key = tuple(id(rule) for rule in rules)
+        scanner = self._line_scanners.get(key)
+        if scanner is None:
+            scanner = LinePatternScanner(rules)
+            self._line_scanners[key] = scanner
+        return scanner
+
+    def _forbidden_line_issue(self, rule: ExtractedRule, line_number: int, file_path: Path) -> ValidationIssue:
+        """Issue for a line that matches a "must not" pattern."""
+        return ValidationIssue(
+            rule_id=rule.rule_id,
+            severity=rule.severity,
+            category=IssueCategory.INVALID_FORMAT,
+            message=f"Line violates pattern rule: {rule.description}",
+            line_number=line_number,
+            file_path=str(file_path),
+            rule_source=rule.source_file
+        )
+
+    def _apply_rule(self, rule: ExtractedRule, content: Union[str, ParsedDocument], file_path: Path) -> List[ValidationIssue]:
         """Apply a single rule to document content."""
         issues: List[ValidationIssue] = []
+        document = ParsedDocument.of(content)
 
         if rule.rule_type == 'frontmatter':
-            issues.extend(self._validate_frontmatter(rule, content, file_path))
+            issues.extend(self._validate_frontmatter(rule, document, file_path))
         elif rule.rule_type == 'pattern':
-            issues.extend(self._validate_pattern(rule, content, file_path))
+            issues.extend(self._validate_pattern(rule, document, file_path))
         elif rule.rule_type == 'content':
-            issues.extend(self._validate_content(rule, content, file_path))
+            issues.extend(self._validate_content(rule, document, file_path))
         elif rule.rule_type == 'section':
-            issues.extend(self._validate_sections(rule, content, file_path))
+            issues.extend(self._validate_sections(rule, document, file_path))
 
         return issues
 
-    def _validate_frontmatter(self, rule: ExtractedRule, content: str, file_path: Path) -> List[ValidationIssue]:
+    def _validate_frontmatter(self, rule: ExtractedRule, content: Union[str, ParsedDocument], file_path: Path) -> List[ValidationIssue]:
         """Validate frontmatter fields."""
         issues: List[ValidationIssue] = []
 
         # Extract frontmatter
-        frontmatter = self._extract_frontmatter(content)
+        frontmatter = ParsedDocument.of(content).frontmatter
 
         if not frontmatter and rule.required_fields:
             issues.append(ValidationIssue(
@@ -910,48 +1364,45 @@ class ValidationService:
 
         return issues
 
-    def _validate_pattern(self, rule: ExtractedRule, content: str, file_path: Path) -> List[ValidationIssue]:
+    def _validate_pattern(self, rule: ExtractedRule, content: Union[str, ParsedDocument], file_path: Path) -> List[ValidationIssue]:
         """Validate content against regex pattern."""
         issues: List[ValidationIssue] = []
 
         if not rule.pattern:
             return issues
 
-        try:
-            pattern = re.compile(rule.pattern)
-
-            # Check if pattern should match or not match
-            if 'must not' in rule.description.lower() or 'should not' in rule.description.lower():
-                # Pattern should NOT match
-                for i, line in enumerate(content.split('\n'), 1):
-                    if pattern.search(line):
-                        issues.append(ValidationIssue(
-                            rule_id=rule.rule_id,
-                            severity=rule.severity,
-                            category=IssueCategory.INVALID_FORMAT,
-                            message=f"Line violates pattern rule: {rule.description}",
-                            line_number=i,
-                            file_path=str(file_path),
-                            rule_source=rule.source_file
-                        ))
-            else:
-                # Pattern should match
-                if not pattern.search(content):
-                    issues.append(ValidationIssue(
-                        rule_id=rule.rule_id,
-                        severity=rule.severity,
-                        category=IssueCategory.INVALID_FORMAT,
-                        message=f"Document does not match required pattern: {rule.description}",
-                        file_path=str(file_path),
-                        rule_source=rule.source_file
-                    ))
-        except re.error:
-            # Invalid regex pattern
-            pass
+        document = ParsedDocument.of(content)
+
+        pattern = rule.compiled_pattern
+        if pattern is None:
+            # Invalid patterns are reported once as rule-load diagnostics
+            if rule.pattern_error is not None:
+                return issues
+            pattern = rule.compile_pattern()
+            if pattern is None:
+                return issues
+
+        # Check if pattern should match or not match
+        if rule.is_forbidden_pattern:
+            # Pattern should NOT match
+            for i, line in enumerate(document.lines, 1):
+                if pattern.search(line):
+                    issues.append(self._forbidden_line_issue(rule, i, file_path))
+        else:
+            # Pattern should match
+            if not pattern.search(document.content):
+                issues.append(ValidationIssue(
+                    rule_id=rule.rule_id,
+                    severity=rule.severity,
+                    category=IssueCategory.INVALID_FORMAT,
+                    message=f"Document does not match required pattern: {rule.description}",
+                    file_path=str(file_path),
+                    rule_source=rule.source_file
+                ))
 
         return issues
 
-    def _validate_content(self, rule: ExtractedRule, content: str, file_path: Path) -> List[ValidationIssue]:
+    def _validate_content(self, rule: ExtractedRule, content: Union[str, ParsedDocument], file_path: Path) -> List[ValidationIssue]:
         """Validate content-based rules."""
         issues: List[ValidationIssue] = []
 
@@ -961,7 +1412,7 @@ class ValidationService:
             match = re.search(r'(\d+)\s*words?', rule.description.lower())
             if match:
                 min_words = int(match.group(1))
-                word_count = len(content.split())
+                word_count = ParsedDocument.of(content).word_count
                 if word_count < min_words:
                     issues.append(ValidationIssue(
                         rule_id=rule.rule_id,
@@ -975,18 +1426,15 @@ class ValidationService:
 
         return issues
 
-    def _validate_sections(self, rule: ExtractedRule, content: str, file_path: Path) -> List[ValidationIssue]:
+    def _validate_sections(self, rule: ExtractedRule, content: Union[str, ParsedDocument], file_path: Path) -> List[ValidationIssue]:
         """Validate required sections."""
         issues: List[ValidationIssue] = []
 
         if not rule.required_fields:  # required_fields used for section names
             return issues
 
-        # Extract section headers from content
-        section_pattern = r'^#+\s+(.+)$'
-        found_sections = []
-        for match in re.finditer(section_pattern, content, re.MULTILINE):
-            found_sections.append(match.group(1).strip())
+        # Section headers from the parsed document
+        found_sections = ParsedDocument.of(content).headers
 
         # Check for required sections
         for required_section in rule.required_fields:
@@ -1005,19 +1453,7 @@ class ValidationService:
 
     def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
         """Extract frontmatter from markdown content."""
-        if not content.startswith('---'):
-            return {}
-
-        try:
-            # Find the end of frontmatter
-            end_match = re.search(r'\n---\n', content[3:])
-            if not end_match:
-                return {}
-
-            frontmatter_text = content[3:end_match.start() + 3]
-            return yaml.safe_load(frontmatter_text) or {}
-        except YAMLError:
-            return {}
+        return parse_frontmatter(content)
 
     def auto_fix_document(self, content: str, issues: List[ValidationIssue]) -> Tuple[str, List[Dict[str, Any]]]:
         """
@@ -1095,7 +1531,7 @@ class ValidationService:
             result['auto_fix_log'] = fix_log
 
             # Re-validate after fixes to get remaining issues
-            if fix_log:
+            if fix_log and fixed_content != content:
                 revalidation = self.validate_document(file_path, fixed_content)
                 remaining_issues = revalidation.issues
             else:
@@ -0,0 +1,314 @@
+"""File system watching for long-running validation sessions."""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# inotify event flags (see inotify(7))
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+
+# struct inotify_event: wd, mask, cookie, len, followed by the name
+_EVENT_HEADER = struct.Struct("iIII")
+
+# (mtime_ns, size) of a file, used to tell real changes from touched files
+Signature = Tuple[int, int]
+
+
+def _signature(path: Path) -> Optional[Signature]:
+    """Get the stat signature of a file, or None if it no longer exists."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Inotify:
+    """Minimal ctypes binding to the Linux inotify API."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, directory: Path) -> int:
+        """Watch a directory, returning its watch descriptor."""
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Read all pending events as (wd, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    Watches directory trees and reports files whose content changed.
+
+    Uses inotify where the platform provides it and falls back to polling
+    the stat data of every watched file otherwise. In both modes a file is
+    only reported when its (mtime, size) signature changed, it appeared or
+    it was deleted, so saving a file without modifying it reports nothing.
+    Hidden directories are not watched, mirroring rule discovery.
+
+    Single files can be watched without the tree around them; only their
+    directory is watched, and events for its other entries are dropped.
+    """
+
+    def __init__(self, roots: Iterable[Path],
+                 include: Optional[Callable[[Path], bool]] = None,
+                 poll_interval: float = 0.5, debounce: float = 0.05,
+                 use_inotify: bool = True, files: Iterable[Path] = ()):
+        """
+        Args:
+            roots: Directories to watch recursively
+            include: Predicate selecting the files of interest, defaults to all
+            poll_interval: Seconds between scans when polling
+            debounce: Seconds to wait for related events to arrive together
+            use_inotify: Set to False to force the polling fallback
+            files: Individual files to watch, whether or not ``include``
+                selects them; they need not exist yet
+        """
+        self.roots = self._outermost(Path(root) for root in roots)
+        self.include = include or (lambda path: True)
+        self.watched_files = {
+            path for path in (Path(os.path.abspath(f)) for f in files)
+            if not self._under_root(path)
+        }
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+
+        self._inotify: Optional[_Inotify] = None
+        self._directories: Dict[int, Path] = {}
+
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError, TypeError) as e:
+                logger.debug(f"inotify unavailable, polling instead: {e}")
+
+        self._signatures: Dict[Path, Signature] = self._scan(watch=self._inotify is not None)
+
+    @property
+    def backend(self) -> str:
+        """Name of the mechanism used to detect changes."""
+        return "inotify" if self._inotify is not None else "polling"
+
+    @property
+    def files(self) -> List[Path]:
+        """All watched files of interest, sorted."""
+        return sorted(self._signatures)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until watched files change.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Changed, created and deleted files; empty if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+            if self._inotify is not None:
+                changed = self._wait_inotify(remaining)
+            else:
+                changed = self._wait_polling(remaining)
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def accept(self, paths: Iterable[Path]) -> None:
+        """
+        Take the current state of files as known, so that their changes so far are not reported.
+
+        Used to skip changes the caller made itself, such as fixes written back.
+        """
+        for path in paths:
+            path = Path(os.path.abspath(path))
+            signature = _signature(path)
+            if signature is None:
+                self._signatures.pop(path, None)
+            else:
+                self._signatures[path] = signature
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._directories.clear()
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _wait_polling(self, timeout: Optional[float]) -> Set[Path]:
+        """Sleep one interval, then compare a fresh scan with the last one."""
+        interval = self.poll_interval if timeout is None else min(self.poll_interval, timeout)
+        time.sleep(interval)
+        return self._diff(self._scan(watch=False))
+
+    def _wait_inotify(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait for inotify events and check the files they name."""
+        assert self._inotify is not None
+        readable, _, _ = select.select([self._inotify.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        # Editors often write a file in several steps; collect them together
+        time.sleep(self.debounce)
+
+        candidates: Set[Path] = set()
+        for wd, mask, name in self._inotify.read_events():
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost, fall back to a full comparison
+                return self._diff(self._scan(watch=True))
+
+            directory = self._directories.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._directories[wd]
+                continue
+
+            path = directory / name if name else directory
+            if path in self.watched_files:
+                candidates.add(path)
+            elif not self._under_root(path):
+                # Another entry of a directory watched only for single files
+                continue
+            elif mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and not name.startswith("."):
+                    # Files may have landed before the new directory was watched
+                    candidates.update(self._scan_tree(path, watch=True))
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    candidates.update(p for p in self._signatures if path in p.parents)
+            elif name and self.include(path):
+                candidates.add(path)
+
+        changed = set()
+        for path in candidates:
+            signature = _signature(path)
+            if signature != self._signatures.get(path):
+                changed.add(path)
+                if signature is None:
+                    self._signatures.pop(path, None)
+                else:
+                    self._signatures[path] = signature
+        return changed
+
+    def _diff(self, signatures: Dict[Path, Signature]) -> Set[Path]:
+        """Replace the known signatures, returning the files that differ."""
+        changed = {
+            path for path in signatures.keys() | self._signatures.keys()
+            if signatures.get(path) != self._signatures.get(path)
+        }
+        self._signatures = signatures
+        return changed
+
+    def _scan(self, watch: bool) -> Dict[Path, Signature]:
+        """Record the signatures of all files of interest under the roots."""
+        if watch:
+            self._directories.clear()
+        signatures: Dict[Path, Signature] = {}
+        for root in self.roots:
+            signatures.update(self._scan_tree(root, watch))
+        for path in self.watched_files:
+            if watch:
+                self._watch_directory(path.parent)
+            signature = _signature(path)
+            if signature is not None:
+                signatures[path] = signature
+        return signatures
+
+    def _scan_tree(self, root: Path, watch: bool) -> Dict[Path, Signature]:
+        """Record the signatures under one directory, optionally watching it."""
+        signatures: Dict[Path, Signature] = {}
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            directory = Path(dirpath)
+
+            if watch:
+                self._watch_directory(directory)
+
+            for filename in filenames:
+                path = directory / filename
+                if self.include(path):
+                    signature = _signature(path)
+                    if signature is not None:
+                        signatures[path] = signature
+        return signatures
+
+    def _watch_directory(self, directory: Path) -> None:
+        """Add an inotify watch for the entries of one directory."""
+        if self._inotify is None:
+            return
+        try:
+            self._directories[self._inotify.add_watch(directory)] = directory
+        except OSError as e:
+            logger.warning(f"Cannot watch {directory}: {e}")
+
+    def _under_root(self, path: Path) -> bool:
+        """Check whether a path lies in one of the watched directory trees."""
+        return any(path == root or root in path.parents for root in self.roots)
+
+    @staticmethod
+    def _outermost(roots: Iterable[Path]) -> List[Path]:
+        """Drop roots nested inside other roots so each tree is watched once."""
+        result: List[Path] = []
+        for root in sorted({Path(os.path.abspath(r)) for r in roots}):
+            if not any(parent == root or parent in root.parents for parent in result):
+                result.append(root)
+        return result
@@ -15,6 +15,23 @@ from company_os.domains.rules_service.src.validation import ValidationResult, Va
 runner = CliRunner()
 
 
+@pytest.fixture
+def service():
+    """Validation service with a single 'must not' pattern rule."""
+    from company_os.domains.rules_service.src.validation import ValidationService, ExtractedRule
+    service = ValidationService([])
+    service.rule_engine.add_rules([
+        ExtractedRule(
+            rule_id="no_todo",
+            rule_type="pattern",
+            description="Must not contain TODO",
+            pattern="TODO",
+            severity="error"
+        )
+    ])
+    return service
+
+
 class TestMainCLI:
     """Test main CLI application."""
 
@@ -569,3 +586,237 @@ class TestValidateCommands:
 
             assert result.exit_code == 0  # Should not exit on error
             assert "Found 1 validation issues" in result.stdout
+
+
+class TestValidateParallel:
+    """Test the multi-process validation mode."""
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_jobs_output_matches_serial(self, mock_load, mock_discovery_service, service):
+        """Parallel validation reports the same results, in the same order, as serial."""
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = service
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for i in range(6):
+                test_file = Path(tmp_dir) / f"doc{i}.md"
+                test_file.write_text("# Doc\n\nTODO\n" * (i % 3))
+                files.append(str(test_file))
+
+            serial = runner.invoke(app, ["validate", "validate", *files, "--format", "json"])
+            parallel = runner.invoke(app, ["validate", "validate", *files, "--format", "json", "--jobs", "3"])
+
+        assert serial.exit_code == 2
+        assert parallel.exit_code == serial.exit_code
+        assert parallel.stdout.split("\n", 1)[1] == serial.stdout.split("\n", 1)[1]
+        assert "Found 6 validation issues" in parallel.stdout
+
+
+class TestValidateWatch:
+    """Test the long-running watch mode."""
+
+    @staticmethod
+    def _scripted_watcher(batches):
+        """FileWatcher stand-in that reports the given change batches, then stops."""
+        watcher = MagicMock()
+        watcher.backend = "polling"
+        watcher.wait.side_effect = [*batches, KeyboardInterrupt()]
+        return watcher
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.FileWatcher')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_watch_revalidates_only_changed_files(self, mock_load, mock_discovery_service,
+                                                  mock_watcher, service):
+        """Only changed target documents are validated again, with the warm service."""
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = service
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = Path(tmp_dir) / "first.md"
+            second = Path(tmp_dir) / "second.md"
+            other = Path(tmp_dir) / "other.md"
+            first.write_text("# First\n")
+            second.write_text("# Second\n")
+            other.write_text("# Other\n")
+
+            second.write_text("# Second\n\nTODO\n")
+            mock_watcher.return_value = self._scripted_watcher([{second, other}])
+
+            result = runner.invoke(app, ["validate", "validate", str(first), str(second), "--watch"])
+
+        assert result.exit_code == 0
+        assert "Validating 2 files" in result.stdout
+        assert "Validating 1 files" in result.stdout
+        assert "Stopped watching" in result.stdout
+        assert mock_load.call_count == 1
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.FileWatcher')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_watch_reloads_rules_on_rule_change(self, mock_load, mock_discovery_service,
+                                                mock_watcher, service):
+        """A changed rule file reloads the rules and re-validates every target."""
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = service
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("a.md", "b.md"):
+                (Path(tmp_dir) / name).write_text("# Doc\n")
+            rule_file = Path(tmp_dir) / "docs.rules.md"
+            mock_watcher.return_value = self._scripted_watcher([{rule_file}])
+
+            result = runner.invoke(app, [
+                "validate", "validate", str(Path(tmp_dir) / "a.md"), str(Path(tmp_dir) / "b.md"), "--watch"
+            ])
+
+        assert result.exit_code == 0
+        assert "Rules changed, reloading" in result.stdout
+        assert result.stdout.count("Validating 2 files") == 2
+        assert mock_load.call_count == 2
+
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.FileWatcher')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_watch_single_files_not_their_directory(self, mock_load, mock_discovery_service,
+                                                    mock_watcher, service):
+        """Plain file targets are watched themselves instead of their parent directory."""
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = service
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            docs = Path(tmp_dir) / "docs"
+            docs.mkdir()
+            (docs / "guide.md").write_text("# Guide\n")
+            top_level = Path(tmp_dir) / "README.md"
+            top_level.write_text("# Readme\n")
+            mock_watcher.return_value = self._scripted_watcher([])
+
+            result = runner.invoke(app, [
+                "validate", "validate", str(top_level), str(docs), "--watch"
+            ])
+
+        assert result.exit_code == 0
+        roots = mock_watcher.call_args.args[0]
+        assert roots == [docs]
+        assert mock_watcher.call_args.kwargs["files"] == [top_level]
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.FileWatcher')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_watch_ignores_own_fixes(self, mock_load, mock_discovery_service, mock_watcher, service):
+        """Files changed by --auto-fix are accepted so they are not validated again."""
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = service
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fixed = Path(tmp_dir) / "fixed.md"
+            clean = Path(tmp_dir) / "clean.md"
+            fixed.write_text("# Fixed\n")
+            clean.write_text("# Clean\n")
+            watcher = self._scripted_watcher([{fixed, clean}])
+            mock_watcher.return_value = watcher
+
+            outcomes = {
+                path: (ValidationResult(file_path=str(path), document_type="general", issues=[]),
+                       fixes, None)
+                for path, fixes in ((fixed, 2), (clean, 0))
+            }
+            with patch('company_os.domains.rules_service.adapters.cli.commands.validate._validate_file_safely',
+                       side_effect=lambda _service, path, _auto_fix: outcomes[path]):
+                result = runner.invoke(app, [
+                    "validate", "validate", str(fixed), str(clean), "--watch", "--auto-fix"
+                ])
+
+        assert result.exit_code == 0
+        accepted = [list(call.args[0]) for call in watcher.accept.call_args_list]
+        assert accepted == [[fixed]]
+
+
+class TestValidateDaemonClient:
+    """Test validating through a running daemon."""
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.DaemonClient')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_validate_uses_running_daemon(self, mock_load, mock_discovery_service, mock_client):
+        """Results come from the daemon and no rules are loaded in-process."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "test.md"
+            test_file.write_text("# Test")
+
+            issue = ValidationIssue(rule_id="test_rule", severity="error",
+                                    category="format", message="Test error")
+            result_dict = ValidationResult(file_path=str(test_file), document_type="general",
+                                           issues=[issue]).to_dict()
+            mock_client.return_value.validate.return_value = {
+                "rules": 3,
+                "outcomes": [{"file": str(test_file), "result": result_dict,
+                              "fixes_applied": 0, "error": None}],
+            }
+
+            result = runner.invoke(app, ["validate", "validate", str(test_file)])
+
+        assert result.exit_code == 2
+        assert "Found 1 validation issues" in result.stdout
+        mock_load.assert_not_called()
+        mock_discovery_service.assert_not_called()
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.DaemonClient')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_validate_falls_back_without_daemon(self, mock_load, mock_discovery_service, mock_client):
+        """Without a daemon the rules are loaded and files validated in-process."""
+        from company_os.domains.rules_service.src.daemon_client import DaemonUnavailable
+        from company_os.domains.rules_service.src.validation import ValidationService
+
+        mock_client.return_value.validate.side_effect = DaemonUnavailable("no daemon")
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = ValidationService([])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "test.md"
+            test_file.write_text("# Test")
+
+            result = runner.invoke(app, ["validate", "validate", str(test_file)])
+
+        assert result.exit_code == 0
+        assert "All files passed validation" in result.stdout
+        mock_load.assert_called_once()
+
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.DaemonClient')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.RuleDiscoveryService')
+    @patch('company_os.domains.rules_service.adapters.cli.commands.validate.load_or_compile')
+    def test_validate_config_option_sets_document_types(self, mock_load, mock_discovery_service,
+                                                        mock_client):
+        """Document types come from --config, in-process rather than in the daemon."""
+        from company_os.domains.rules_service.src.validation import DocumentTypeDetector, ValidationService
+
+        mock_discovery_service.return_value.discover_rules.return_value = ([], [])
+        mock_load.return_value = ValidationService([])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = Path(tmp_dir) / "custom.yaml"
+            config_path.write_text(yaml.dump({
+                "version": "1.0",
+                "agent_folders": [],
+                "document_types": {"suffixes": {".adr.md": "decision"}},
+            }))
+            test_file = Path(tmp_dir) / "0001-choice.adr.md"
+            test_file.write_text("# Choice")
+
+            try:
+                result = runner.invoke(app, ["validate", "validate", str(test_file),
+                                             "--config", str(config_path)])
+                custom_mappings = DocumentTypeDetector.custom_mappings()
+                detected = DocumentTypeDetector.detect_type(test_file)
+            finally:
+                DocumentTypeDetector.configure()
+
+        assert result.exit_code == 0
+        assert custom_mappings == ({".adr.md": "decision"}, {})
+        assert detected == "decision"
+        mock_client.assert_not_called()
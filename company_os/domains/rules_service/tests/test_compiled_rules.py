@@ -0,0 +1,113 @@
+"""Unit tests for compiled rule-set snapshots."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from company_os.domains.rules_service.src.compiled_rules import (
+    CompiledRuleSet, SNAPSHOT_VERSION, load_or_compile
+)
+from company_os.domains.rules_service.src.validation import RuleExtractor, ValidationService
+from company_os.domains.rules_service.src.models import RuleDocument
+
+
+RULE_CONTENT = """---
+title: Decision Rules
+---
+
+# Decision Rules
+
+## Validation Rules
+
+- Must include a rationale section
+- Should reference related signals
+
+```yaml
+title: Example
+status: draft
+owner: someone
+```
+
+```regex
+TODO
+```
+"""
+
+
+@pytest.fixture
+def rule_file(tmp_path):
+    """Write a rule file and return its document metadata."""
+    path = tmp_path / "decision.rules.md"
+    path.write_text(RULE_CONTENT)
+    return RuleDocument(
+        title="Decision Rules",
+        version="1.0",
+        status="active",
+        owner="test",
+        last_updated="2025-01-01T00:00:00Z",
+        parent_charter="test.charter.md",
+        applies_to=["decision"],
+        file_path=str(path),
+    )
+
+
+class TestCompiledRuleSet:
+    """Test compiling, saving and loading rule snapshots."""
+
+    def test_round_trip_matches_extraction(self, rule_file, tmp_path):
+        """A loaded snapshot yields the same rules as direct extraction."""
+        direct = ValidationService([rule_file])
+        snapshot_path = tmp_path / "compiled.json"
+
+        CompiledRuleSet.compile([rule_file]).save(snapshot_path)
+        loaded = CompiledRuleSet.load(snapshot_path)
+        engine = loaded.to_engine()
+
+        expected = direct.rule_engine.get_rules_for_document("decision")
+        actual = engine.get_rules_for_document("decision")
+        assert [r.rule_id for r in actual] == [r.rule_id for r in expected]
+        assert [r.required_fields for r in actual] == [r.required_fields for r in expected]
+        assert engine.rules_by_document_type["decision"][0] is engine.rules_by_type[
+            engine.rules_by_document_type["decision"][0].rule_type
+        ][0]
+
+    def test_load_or_compile_reuses_snapshot(self, rule_file, tmp_path):
+        """A fresh snapshot is loaded without running the extractor."""
+        snapshot_path = tmp_path / "compiled.json"
+        load_or_compile([rule_file], snapshot_path)
+        assert snapshot_path.exists()
+
+        with patch.object(RuleExtractor, 'extract_rules_from_document') as mock_extract:
+            service = load_or_compile([rule_file], snapshot_path)
+            mock_extract.assert_not_called()
+
+        result = service.validate_document(Path("DEC-1.decision.md"), "No frontmatter here")
+        assert not result.is_valid
+
+    def test_snapshot_invalidated_on_rule_change(self, rule_file, tmp_path):
+        """Editing a source rule file triggers recompilation."""
+        snapshot_path = tmp_path / "compiled.json"
+        load_or_compile([rule_file], snapshot_path)
+        old_fingerprint = json.loads(snapshot_path.read_text())['fingerprint']
+
+        Path(rule_file.file_path).write_text(RULE_CONTENT.replace("status: draft", "status: draft\nreviewer: x"))
+        service = load_or_compile([rule_file], snapshot_path)
+
+        assert json.loads(snapshot_path.read_text())['fingerprint'] != old_fingerprint
+        fm_rules = [r for r in service.rule_engine.get_rules_for_document("decision")
+                    if r.rule_type == "frontmatter"]
+        assert "reviewer" in fm_rules[0].required_fields
+
+    def test_incompatible_version_ignored(self, rule_file, tmp_path):
+        """Snapshots written by another version are not loaded."""
+        snapshot_path = tmp_path / "compiled.json"
+        CompiledRuleSet.compile([rule_file]).save(snapshot_path)
+
+        data = json.loads(snapshot_path.read_text())
+        data['version'] = SNAPSHOT_VERSION + 1
+        snapshot_path.write_text(json.dumps(data))
+
+        assert CompiledRuleSet.load(snapshot_path) is None
+        assert CompiledRuleSet.load(tmp_path / "missing.json") is None
@@ -6,7 +6,7 @@ import pytest
 import yaml
 
 from company_os.domains.rules_service.src.config import (
-    RulesServiceConfig, AgentFolder, PerformanceConfig, ConflictStrategy
+    RulesServiceConfig, AgentFolder, PerformanceConfig, ConflictStrategy, LinkMode
 )
 
 
@@ -27,7 +27,7 @@ class TestPerformanceConfig:
 
     def test_valid_checksum_algorithms(self):
         """Test valid checksum algorithms."""
-        for algo in ["md5", "sha256", "sha512"]:
+        for algo in ["md5", "sha256", "sha512", "blake2b", "blake2s"]:
             config = PerformanceConfig(checksum_algorithm=algo)
             assert config.checksum_algorithm == algo
 
@@ -60,7 +60,8 @@ class TestRulesServiceConfig:
             "sync": {
                 "conflict_strategy": "skip",
                 "include_patterns": ["*.rules.md", "*.rule.md"],
-                "create_directories": False
+                "create_directories": False,
+                "link_mode": "hardlink"
             },
             "performance": {
                 "max_parallel_operations": 20,
@@ -76,6 +77,7 @@ class TestRulesServiceConfig:
         assert len(config.agent_folders) == 2
         assert config.agent_folders[0].path == ".clinerules/"
         assert config.sync.conflict_strategy == ConflictStrategy.SKIP
+        assert config.sync.link_mode == LinkMode.HARDLINK
         assert config.performance.max_parallel_operations == 20
 
     def test_from_file(self, sample_config_dict):
@@ -149,5 +151,8 @@ class TestRulesServiceConfig:
         assert config.sync.conflict_strategy == ConflictStrategy.OVERWRITE
         assert config.sync.create_directories is True
         assert config.sync.clean_orphaned is True
+        assert config.sync.link_mode == LinkMode.COPY
+        assert config.document_types.suffixes == {}
+        assert config.document_types.path_patterns == {}
         assert config.performance.use_checksums is True
         assert config.performance.checksum_algorithm == "sha256"
@@ -0,0 +1,222 @@
+"""Tests for the local Rules Service daemon and its client."""
+
+import threading
+import time
+
+import pytest
+import yaml
+
+from company_os.domains.rules_service.src.daemon import RulesDaemon, RULES_DATA_PATH
+from company_os.domains.rules_service.src.daemon_client import (
+    DaemonClient, DaemonError, DaemonUnavailable, DEFAULT_SOCKET_PATH, PROTOCOL_VERSION
+)
+from company_os.domains.rules_service.src.validation import ValidationResult
+
+
+RULE_TEMPLATE = """---
+title: Decision Rules
+version: 1.0
+status: active
+owner: test
+last_updated: 2025-01-01T00:00:00Z
+parent_charter: test.charter.md
+applies_to: [decision]
+tags: [test]
+---
+
+# Decision Rules
+
+```regex
+{pattern}
+```
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with one rule requiring the word 'Rationale' in decisions."""
+    rules_dir = tmp_path / RULES_DATA_PATH
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "decision.rules.md").write_text(RULE_TEMPLATE.format(pattern="Rationale"))
+    return tmp_path
+
+
+@pytest.fixture
+def running_daemon(repo):
+    """Serve a daemon for the repository on a background thread."""
+    daemon = RulesDaemon(repo)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    client = DaemonClient(daemon.socket_path, timeout=10)
+    deadline = time.monotonic() + 10
+    while not client.is_running():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+
+    yield daemon, client
+
+    if client.is_running():
+        client.shutdown()
+    thread.join(timeout=10)
+
+
+def _request(daemon, command, **params):
+    return daemon.handle({"version": PROTOCOL_VERSION, "command": command, **params})
+
+
+class TestDaemonRequests:
+    """Test request handling without a socket."""
+
+    def test_validate_reports_issues(self, repo):
+        doc = repo / "choice.decision.md"
+        doc.write_text("# Choice\n")
+
+        response = _request(RulesDaemon(repo), "validate", files=[str(doc)])
+
+        assert response["ok"]
+        assert response["rules"] == 1
+        outcome = response["outcomes"][0]
+        assert outcome["error"] is None
+        result = ValidationResult.from_dict(outcome["result"])
+        assert result.error_count == 1
+        assert result.issues[0].rule_id == "decision_rules_pattern_0"
+
+    def test_unchanged_file_reuses_result(self, repo):
+        doc = repo / "choice.decision.md"
+        doc.write_text("# Choice\n")
+        daemon = RulesDaemon(repo)
+
+        first = _request(daemon, "validate", files=[str(doc)])
+        second = _request(daemon, "validate", files=[str(doc)])
+        assert daemon.cache_hits == 1
+        assert second["outcomes"] == first["outcomes"]
+
+        doc.write_text("# Choice\n\nRationale\n")
+        third = _request(daemon, "validate", files=[str(doc)])
+        assert daemon.cache_hits == 1
+        assert third["outcomes"][0]["result"]["issues"] == []
+
+    def test_rule_change_reloads_rules(self, repo):
+        doc = repo / "choice.decision.md"
+        doc.write_text("# Choice\n\nRationale\n")
+        daemon = RulesDaemon(repo)
+        assert _request(daemon, "validate", files=[str(doc)])["outcomes"][0]["result"]["issues"] == []
+
+        rule_file = repo / RULES_DATA_PATH / "decision.rules.md"
+        rule_file.write_text(RULE_TEMPLATE.format(pattern="Consequences"))
+
+        deadline = time.monotonic() + 5
+        while True:
+            issues = _request(daemon, "validate", files=[str(doc)])["outcomes"][0]["result"]["issues"]
+            if issues or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        assert len(issues) == 1
+        daemon.close()
+
+    def test_config_change_reloads_document_types(self, repo):
+        doc = repo / "choice.adr.md"
+        doc.write_text("# Choice\n")
+        daemon = RulesDaemon(repo)
+        assert _request(daemon, "validate", files=[str(doc)])["outcomes"][0]["result"]["issues"] == []
+
+        (repo / ".rules-service.yaml").write_text(yaml.dump({
+            "version": "1.0",
+            "agent_folders": [{"path": ".claude/rules", "description": "Claude rules"}],
+            "document_types": {"suffixes": {".adr.md": "decision"}},
+        }))
+
+        deadline = time.monotonic() + 5
+        while True:
+            issues = _request(daemon, "validate", files=[str(doc)])["outcomes"][0]["result"]["issues"]
+            if issues or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        assert len(issues) == 1
+        daemon.close()
+
+        # Without the configuration the default document types apply again
+        (repo / ".rules-service.yaml").unlink()
+        _request(daemon, "reload")
+        assert _request(daemon, "validate", files=[str(doc)])["outcomes"][0]["result"]["issues"] == []
+        daemon.close()
+
+    def test_unreadable_file_is_reported(self, repo):
+        response = _request(RulesDaemon(repo), "validate", files=[str(repo / "missing.md")])
+
+        outcome = response["outcomes"][0]
+        assert outcome["result"] is None
+        assert outcome["error"]
+
+    def test_protocol_errors(self, repo):
+        daemon = RulesDaemon(repo)
+
+        assert not daemon.handle({"version": PROTOCOL_VERSION + 1, "command": "status"})["ok"]
+        assert "Unknown command" in _request(daemon, "explode")["error"]
+
+    def test_sync_requires_configuration(self, repo):
+        response = _request(RulesDaemon(repo), "sync")
+
+        assert not response["ok"]
+        assert "Configuration file not found" in response["error"]
+
+    def test_sync_copies_rules(self, repo):
+        (repo / ".rules-service.yaml").write_text(yaml.dump({
+            "version": "1.0",
+            "agent_folders": [{"path": ".claude/rules", "description": "Claude rules"}],
+        }))
+        daemon = RulesDaemon(repo)
+
+        response = _request(daemon, "sync")
+
+        assert response["ok"]
+        assert response["result"]["added"] == 1
+        assert (repo / ".claude" / "rules" / "decision.rules.md").exists()
+        assert _request(daemon, "sync")["result"]["skipped"] == 1
+
+
+class TestDaemonClient:
+    """Test the client against a daemon serving on a socket."""
+
+    def test_status_and_validate(self, running_daemon, repo):
+        daemon, client = running_daemon
+        doc = repo / "choice.decision.md"
+        doc.write_text("# Choice\n")
+
+        status = client.status()
+        assert status["rules"] == 1
+        assert status["rules_by_document_type"] == {"decision": 1, "unknown": 0}
+        assert status["root"] == str(repo.resolve())
+
+        response = client.validate([doc])
+        assert response["outcomes"][0]["result"]["summary"]["errors"] == 1
+
+    def test_shutdown_removes_socket(self, running_daemon):
+        daemon, client = running_daemon
+
+        client.shutdown()
+
+        deadline = time.monotonic() + 5
+        while daemon.socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not daemon.socket_path.exists()
+        with pytest.raises(DaemonUnavailable):
+            client.status()
+
+    def test_second_daemon_refuses_to_start(self, running_daemon, repo):
+        with pytest.raises(RuntimeError, match="already running"):
+            RulesDaemon(repo).serve_forever()
+
+    def test_daemon_errors_are_raised(self, running_daemon):
+        _, client = running_daemon
+
+        with pytest.raises(DaemonError, match="Configuration file not found"):
+            client.sync()
+
+    def test_missing_daemon_is_unavailable(self, tmp_path):
+        client = DaemonClient(tmp_path / DEFAULT_SOCKET_PATH)
+
+        assert not client.is_running()
+        with pytest.raises(DaemonUnavailable):
+            client.validate([tmp_path / "doc.md"])
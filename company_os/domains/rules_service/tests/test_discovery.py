@@ -0,0 +1,120 @@
+"""Unit tests for rule discovery and the persistent discovery index."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from company_os.domains.rules_service.src.discovery import (
+    RuleDiscoveryService, FrontmatterParser, RuleIndex
+)
+
+
+RULE_TEMPLATE = """---
+title: "{title}"
+version: 1.0
+status: "Active"
+owner: "Test Owner"
+last_updated: "2025-07-15T10:00:00-07:00"
+parent_charter: "test.charter.md"
+applies_to: ["decision"]
+tags: ["test"]
+---
+
+# {title}
+"""
+
+
+class TestRuleIndex:
+    """Test discovery with a persistent index."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a small repository with two rule files."""
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        (rules_dir / "a.rules.md").write_text(RULE_TEMPLATE.format(title="Rule A"))
+        (rules_dir / "b.rules.md").write_text(RULE_TEMPLATE.format(title="Rule B"))
+        (rules_dir / "broken.rules.md").write_text("---\ntitle: Broken\n---\n")
+        return tmp_path
+
+    def test_index_written_and_reused(self, repo):
+        """A warm start returns the same rules without re-parsing any file."""
+        index_path = repo / ".cache" / "rules-index.json"
+
+        cold = RuleDiscoveryService(repo, index_path=index_path)
+        cold_rules, cold_errors = cold.discover_rules()
+        assert index_path.exists()
+        assert cold.index.misses == 3
+
+        warm = RuleDiscoveryService(repo, index_path=index_path)
+        with patch.object(FrontmatterParser, 'parse_content') as mock_parse:
+            warm_rules, warm_errors = warm.discover_rules()
+            mock_parse.assert_not_called()
+
+        assert warm.index.hits == 3
+        assert sorted(r.title for r in warm_rules) == sorted(r.title for r in cold_rules)
+        assert warm_errors == cold_errors
+        assert len(warm_errors) == 1
+        assert warm_rules[0].last_updated == cold_rules[0].last_updated
+
+    def test_only_changed_file_reparsed(self, repo):
+        """Editing one rule file re-parses only that file."""
+        index_path = repo / ".cache" / "rules-index.json"
+        RuleDiscoveryService(repo, index_path=index_path).discover_rules()
+
+        (repo / "rules" / "a.rules.md").write_text(RULE_TEMPLATE.format(title="Rule A2"))
+
+        service = RuleDiscoveryService(repo, index_path=index_path)
+        rules, _ = service.discover_rules()
+
+        assert service.index.misses == 1
+        assert "Rule A2" in {r.title for r in rules}
+
+    def test_touched_file_accepted_by_hash(self, repo):
+        """A file whose mtime moved but whose content is unchanged is not re-parsed."""
+        index_path = repo / ".cache" / "rules-index.json"
+        RuleDiscoveryService(repo, index_path=index_path).discover_rules()
+
+        target = repo / "rules" / "b.rules.md"
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        service = RuleDiscoveryService(repo, index_path=index_path)
+        service.discover_rules()
+        assert service.index.misses == 0
+        assert service.index.hits == 3
+
+    def test_deleted_files_pruned(self, repo):
+        """Entries for deleted rule files are removed from the index."""
+        index_path = repo / ".cache" / "rules-index.json"
+        RuleDiscoveryService(repo, index_path=index_path).discover_rules()
+
+        (repo / "rules" / "b.rules.md").unlink()
+        rules, _ = RuleDiscoveryService(repo, index_path=index_path).discover_rules()
+
+        assert [r.title for r in rules] == ["Rule A"]
+        entries = json.loads(index_path.read_text())['entries']
+        assert not any(key.endswith("b.rules.md") for key in entries)
+
+    def test_incompatible_index_ignored(self, repo):
+        """An index with a different version is rebuilt from scratch."""
+        index_path = repo / ".cache" / "rules-index.json"
+        index_path.parent.mkdir()
+        index_path.write_text(json.dumps({'version': RuleIndex.VERSION + 1, 'entries': {}}))
+
+        service = RuleDiscoveryService(repo, index_path=index_path)
+        rules, _ = service.discover_rules()
+
+        assert len(rules) == 2
+        assert json.loads(index_path.read_text())['version'] == RuleIndex.VERSION
+
+    def test_without_index(self, repo):
+        """Discovery still works without an index and writes nothing."""
+        service = RuleDiscoveryService(repo)
+        rules, errors = service.discover_rules()
+
+        assert len(rules) == 2
+        assert len(errors) == 1
+        assert not (repo / ".cache").exists()
@@ -13,6 +13,7 @@ import time
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from company_os.domains.rules_service.adapters.pre_commit.hooks import sync_main, validate_main
+from company_os.domains.rules_service.src.daemon_client import DaemonError, DaemonUnavailable
 
 
 class TestPreCommitHooks:
@@ -106,6 +107,28 @@ class TestPreCommitHooks:
                 assert exit_code == 3
 
 
+class TestPreCommitDaemonFallback:
+    """Test that hooks fall back to bazel when the daemon cannot serve them."""
+
+    @pytest.mark.parametrize("failure", [
+        DaemonUnavailable("no daemon"),
+        DaemonError("Configuration file not found"),
+    ])
+    def test_sync_main_falls_back_to_bazel(self, failure):
+        """Test sync hook runs the CLI when the daemon is missing or fails."""
+        hooks = 'company_os.domains.rules_service.adapters.pre_commit.hooks'
+        with patch(f'{hooks}.DaemonClient') as mock_client, \
+                patch(f'{hooks}.subprocess.run') as mock_run:
+            mock_client.return_value.sync.side_effect = failure
+            mock_run.return_value = Mock(returncode=0, stderr="")
+
+            exit_code = sync_main()
+
+            assert exit_code == 0
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0][-2:] == ["rules", "sync"]
+
+
 class TestPreCommitPerformance:
     """Test performance requirements for pre-commit hooks."""
 
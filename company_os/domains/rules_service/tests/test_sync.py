@@ -1,16 +1,50 @@
 """Unit tests for the SyncService."""
 
+import errno
+import os
 import tempfile
+import time
 from pathlib import Path
 import pytest
 from unittest.mock import patch
 import hashlib
 
-from company_os.domains.rules_service.src.sync import SyncService, FileHashCache
-from company_os.domains.rules_service.src.config import RulesServiceConfig, AgentFolder, ConflictStrategy
+from company_os.domains.rules_service.src.sync import (
+    SyncService, FileHashCache, SyncManifest, SyncPlan, SyncResult, DEFAULT_MANIFEST_DIR,
+    FINGERPRINT_BLOCK_SIZE, TIER_CHECKSUM, TIER_FINGERPRINT, TIER_STAT
+)
+from company_os.domains.rules_service.src.config import (
+    RulesServiceConfig, AgentFolder, ConflictStrategy, LinkMode
+)
 from company_os.domains.rules_service.src.models import RuleDocument
 
 
+@pytest.fixture
+def config():
+    """Configuration syncing to a single Cursor rules folder."""
+    return RulesServiceConfig(
+        version="1.0",
+        agent_folders=[AgentFolder(path=".cursor/rules/", description="Cursor rules")],
+    )
+
+
+@pytest.fixture
+def rules(tmp_path):
+    """Two freshly written rule files; tests that need settled mtimes move them back."""
+    rules_dir = tmp_path / "rules"
+    rules_dir.mkdir()
+    rules = []
+    for name in ("first", "second"):
+        path = rules_dir / f"{name}.rules.md"
+        path.write_text(f"# {name}")
+        rules.append(RuleDocument(
+            title=name, version="1.0", status="active", owner="test",
+            last_updated="2025-01-01T00:00:00Z", parent_charter="test.charter.md",
+            file_path=str(path),
+        ))
+    return rules
+
+
 class TestFileHashCache:
     """Test the FileHashCache functionality."""
 
@@ -49,6 +83,21 @@ class TestFileHashCache:
         assert hash1 == hash2
         assert hash2 != "different_hash"
 
+    def test_same_size_edit_within_mtime_resolution(self, tmp_path):
+        """Test that a same-size edit is noticed when only the nanosecond mtime moves."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("aaaa")
+        os.utime(test_file, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+        cache = FileHashCache()
+        hash1 = cache.get_hash(test_file)
+
+        test_file.write_text("bbbb")
+        os.utime(test_file, ns=(1_000_000_000_000_000_001, 1_000_000_000_000_000_001))
+        hash2 = cache.get_hash(test_file)
+
+        assert hash1 != hash2
+
     def test_cache_invalidation_on_change(self, tmp_path):
         """Test that cache is invalidated when file changes."""
         test_file = tmp_path / "test.txt"
@@ -322,3 +371,341 @@ class TestSyncService:
         # Check no temp files left
         temp_files = list(temp_workspace.glob("*.tmp"))
         assert len(temp_files) == 0
+
+
+class TestSyncManifest:
+    """Test incremental sync using the persisted manifest."""
+
+    @pytest.fixture
+    def config(self, config):
+        """Sync to a CLI rules folder as well."""
+        config.agent_folders.insert(0, AgentFolder(path=".clinerules/", description="CLI rules"))
+        return config
+
+    @staticmethod
+    def _age_files(root):
+        """Move every file's mtime an hour back, out of the racy window."""
+        past = time.time() - 3600
+        for path in root.rglob("*.rules.md"):
+            os.utime(path, (past, past))
+
+    def test_manifest_written_per_folder(self, config, rules, tmp_path):
+        SyncService(config, tmp_path).sync_rules(rules)
+
+        manifests = sorted(p.name for p in (tmp_path / DEFAULT_MANIFEST_DIR).iterdir())
+        assert manifests == [".clinerules.json", ".cursor__rules.json"]
+
+        manifest = SyncManifest(tmp_path / DEFAULT_MANIFEST_DIR / ".clinerules.json")
+        manifest.load()
+        entry = manifest.entries["first.rules.md"]
+        assert entry["source"] == rules[0].file_path
+        assert entry["source_hash"] == entry["target_hash"]
+        assert manifest.last_sync is not None
+
+    def test_unchanged_resync_reads_no_files(self, config, rules, tmp_path):
+        self._age_files(tmp_path)
+        SyncService(config, tmp_path).sync_rules(rules)
+        self._age_files(tmp_path)
+        SyncService(config, tmp_path).sync_rules(rules)
+
+        # A fresh service starts with a cold in-memory hash cache
+        service = SyncService(config, tmp_path)
+        with patch.object(service.hash_cache, 'get_hash', side_effect=AssertionError("file was read")):
+            result = service.sync_rules(rules)
+
+        assert result.skipped == 4
+        assert result.errors == []
+
+    def test_only_moved_files_are_hashed(self, config, rules, tmp_path):
+        self._age_files(tmp_path)
+        SyncService(config, tmp_path).sync_rules(rules)
+        self._age_files(tmp_path)
+        SyncService(config, tmp_path).sync_rules(rules)
+
+        Path(rules[0].file_path).write_text("# first, edited")
+        service = SyncService(config, tmp_path)
+        hashed = []
+        original = service.hash_cache.get_hash
+        with patch.object(service.hash_cache, 'get_hash', side_effect=lambda p: hashed.append(p) or original(p)):
+            result = service.sync_rules(rules)
+
+        assert result.updated == 2
+        assert result.skipped == 2
+        assert set(hashed) == {Path(rules[0].file_path)}
+
+    def test_manifest_from_other_checksum_algorithm_is_ignored(self, config, rules, tmp_path):
+        self._age_files(tmp_path)
+        SyncService(config, tmp_path).sync_rules(rules)
+        # Move a source's mtime so that it is hashed again, unlike its targets
+        past = time.time() - 1800
+        os.utime(rules[0].file_path, (past, past))
+
+        config.performance.checksum_algorithm = "blake2b"
+        result = SyncService(config, tmp_path).sync_rules(rules)
+
+        assert result.skipped == 4
+        assert result.updated == 0
+        assert result.errors == []
+        manifest = SyncManifest(tmp_path / DEFAULT_MANIFEST_DIR / ".clinerules.json", "blake2b")
+        manifest.load()
+        assert manifest.entries["first.rules.md"]["source_hash"] == hashlib.blake2b(b"# first").hexdigest()
+
+        sha256_manifest = SyncManifest(tmp_path / DEFAULT_MANIFEST_DIR / ".clinerules.json")
+        sha256_manifest.load()
+        assert sha256_manifest.entries == {}
+
+    def test_deleted_target_is_restored(self, config, rules, tmp_path):
+        service = SyncService(config, tmp_path)
+        service.sync_rules(rules)
+
+        (tmp_path / ".clinerules" / "first.rules.md").unlink()
+        result = SyncService(config, tmp_path).sync_rules(rules)
+
+        assert result.added == 1
+        assert (tmp_path / ".clinerules" / "first.rules.md").read_text() == "# first"
+
+    def test_dry_run_leaves_manifest_untouched(self, config, rules, tmp_path):
+        SyncService(config, tmp_path).sync_rules(rules, dry_run=True)
+
+        assert not (tmp_path / DEFAULT_MANIFEST_DIR).exists()
+
+    def test_status_reports_last_sync_and_changes(self, config, rules, tmp_path):
+        service = SyncService(config, tmp_path)
+        assert service.get_sync_status(rules)[".clinerules/"]["last_sync"] == "never"
+
+        service.sync_rules(rules)
+        status = service.get_sync_status(rules)[".clinerules/"]
+        assert status["last_sync"] != "never"
+        assert status["sync_state"] == "in_sync"
+
+        Path(rules[0].file_path).write_text("# first, edited")
+        assert service.get_sync_status(rules)[".clinerules/"]["sync_state"] == "out_of_sync"
+
+
+class TestSyncPlan:
+    """Test planning a sync across all agent folders at once."""
+
+    @pytest.fixture
+    def config(self, config):
+        """Sync to four agent folders."""
+        config.agent_folders = [
+            AgentFolder(path=f".agent{i}/rules/", description=f"Agent {i}")
+            for i in range(4)
+        ]
+        return config
+
+    def test_each_source_is_hashed_once(self, config, rules, tmp_path):
+        service = SyncService(config, tmp_path)
+        service.sync_rules(rules)
+        for rule in rules:
+            Path(rule.file_path).write_text(f"# {rule.title}, edited")
+
+        service = SyncService(config, tmp_path)
+        hashed = []
+        original = service.hash_cache.get_hash
+        with patch.object(service.hash_cache, 'get_hash', side_effect=lambda p: hashed.append(p) or original(p)):
+            plan = service.plan(rules)
+
+        sources = [Path(rule.file_path) for rule in rules]
+        assert sorted(p for p in hashed if p in sources) == sorted(sources)
+        assert len(plan.actions_of("update")) == 8
+
+    def test_plan_is_inspectable_without_writing(self, config, rules, tmp_path):
+        orphan_dir = tmp_path / ".agent0" / "rules"
+        orphan_dir.mkdir(parents=True)
+        (orphan_dir / "old.rules.md").write_text("# old")
+
+        plan = SyncService(config, tmp_path).plan(rules)
+
+        assert isinstance(plan, SyncPlan)
+        assert len(plan.actions_of("add")) == 8
+        assert [a.target.name for a in plan.actions_of("delete")] == ["old.rules.md"]
+        assert plan.source_hashes[Path(rules[0].file_path)] == hashlib.sha256(b"# first").hexdigest()
+        assert (orphan_dir / "old.rules.md").exists()
+        assert not (tmp_path / ".agent1").exists()
+        assert not (tmp_path / DEFAULT_MANIFEST_DIR).exists()
+
+    def test_dry_run_reports_the_plan(self, config, rules, tmp_path):
+        service = SyncService(config, tmp_path)
+
+        dry = service.sync_rules(rules, dry_run=True)
+        result = service.sync_rules(rules)
+
+        assert dry.added == result.added == 8
+        assert service.plan(rules).to_result().skipped == 8
+
+    def test_missing_source_is_reported_once(self, config, rules, tmp_path):
+        Path(rules[0].file_path).unlink()
+
+        result = SyncService(config, tmp_path).sync_rules(rules)
+
+        assert len(result.errors) == 1
+        assert rules[0].file_path in result.errors[0]
+        assert result.added == 4
+
+
+class TestLinkModes:
+    """Test placing synced files as clones or links."""
+
+    @pytest.fixture
+    def rules(self, rules):
+        """Only the first rule file."""
+        return rules[:1]
+
+    @pytest.fixture
+    def config_for(self, config):
+        """Copies of the config with another link mode."""
+        def config_for(link_mode):
+            copy = config.model_copy(deep=True)
+            copy.sync.link_mode = LinkMode(link_mode)
+            return copy
+        return config_for
+
+    def test_hardlink_shares_the_source_inode(self, config_for, rules, tmp_path):
+        service = SyncService(config_for("hardlink"), tmp_path)
+
+        assert service.sync_rules(rules).added == 1
+
+        source = Path(rules[0].file_path)
+        target = tmp_path / ".cursor" / "rules" / "first.rules.md"
+        assert target.stat().st_ino == source.stat().st_ino
+
+        # Editing the source in place edits the target too
+        source.write_text("# first, edited")
+        assert service.get_sync_status(rules)[".cursor/rules/"]["sync_state"] == "in_sync"
+        hashed = []
+        original = service.hash_cache.get_hash
+        with patch.object(service.hash_cache, 'get_hash', side_effect=lambda p: hashed.append(p) or original(p)):
+            result = service.sync_rules(rules)
+        assert result.skipped == 1
+        assert target not in hashed
+
+    def test_symlink_points_at_the_source(self, config_for, rules, tmp_path):
+        SyncService(config_for("symlink"), tmp_path).sync_rules(rules)
+
+        target = tmp_path / ".cursor" / "rules" / "first.rules.md"
+        assert target.is_symlink()
+        assert not os.path.isabs(os.readlink(target))
+        assert target.resolve() == Path(rules[0].file_path).resolve()
+
+        manifest = SyncManifest(tmp_path / DEFAULT_MANIFEST_DIR / ".cursor__rules.json")
+        manifest.load()
+        assert manifest.entries["first.rules.md"]["link"] == "symlink"
+
+    def test_reflink_copies_content(self, config_for, rules, tmp_path):
+        SyncService(config_for("reflink"), tmp_path).sync_rules(rules)
+
+        target = tmp_path / ".cursor" / "rules" / "first.rules.md"
+        assert not target.is_symlink()
+        assert target.read_text() == "# first"
+        assert target.stat().st_ino != Path(rules[0].file_path).stat().st_ino
+
+    def test_cross_device_hardlink_falls_back_to_copy(self, config_for, rules, tmp_path):
+        service = SyncService(config_for("hardlink"), tmp_path)
+
+        with patch('os.link', side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            assert service.sync_rules(rules).added == 1
+            # The fallback is remembered instead of retried on every sync
+            assert service.sync_rules(rules).skipped == 1
+
+        target = tmp_path / ".cursor" / "rules" / "first.rules.md"
+        assert target.read_text() == "# first"
+        assert target.stat().st_ino != Path(rules[0].file_path).stat().st_ino
+        assert not list(target.parent.glob("*.tmp"))
+
+    def test_changing_link_mode_replaces_targets(self, config_for, rules, tmp_path):
+        SyncService(config_for("symlink"), tmp_path).sync_rules(rules)
+
+        result = SyncService(config_for("copy"), tmp_path).sync_rules(rules)
+
+        target = tmp_path / ".cursor" / "rules" / "first.rules.md"
+        assert result.updated == 1
+        assert not target.is_symlink()
+        assert target.read_text() == "# first"
+
+        result = SyncService(config_for(LinkMode.HARDLINK), tmp_path).sync_rules(rules)
+        assert result.updated == 1
+        assert target.stat().st_ino == Path(rules[0].file_path).stat().st_ino
+
+
+class TestTieredComparison:
+    """Test settling comparisons at the cheapest possible tier."""
+
+    @pytest.fixture
+    def rules(self, rules):
+        """Only the first rule file."""
+        return rules[:1]
+
+    @pytest.fixture
+    def source(self, rules):
+        return Path(rules[0].file_path)
+
+    @staticmethod
+    def _age(*paths):
+        past = time.time() - 3600
+        for path in paths:
+            os.utime(path, (past, past))
+
+    def test_unchanged_resync_only_stats(self, config, rules, source, tmp_path):
+        target = tmp_path / ".cursor" / "rules" / source.name
+        self._age(source)
+        SyncService(config, tmp_path).sync_rules(rules)
+        self._age(target)
+        SyncService(config, tmp_path).sync_rules(rules)
+
+        service = SyncService(config, tmp_path)
+        with patch('company_os.domains.rules_service.src.sync._fingerprint',
+                   side_effect=AssertionError("file was read")), \
+             patch.object(service.hash_cache, 'get_hash', side_effect=AssertionError("file was read")):
+            result = service.sync_rules(rules)
+
+        assert result.skipped == 1
+        assert result.comparisons == {TIER_STAT: 1}
+
+    def test_size_change_needs_no_read(self, config, rules, source, tmp_path):
+        config.performance.use_checksums = False
+        service = SyncService(config, tmp_path)
+        service.sync_rules(rules)
+        source.write_text("# first, edited")
+
+        with patch('company_os.domains.rules_service.src.sync._fingerprint',
+                   side_effect=AssertionError("file was read")):
+            result = service.sync_rules(rules)
+
+        assert result.updated == 1
+        assert result.comparisons == {TIER_STAT: 1}
+
+    def test_same_size_edit_without_checksums(self, config, rules, source, tmp_path):
+        config.performance.use_checksums = False
+        service = SyncService(config, tmp_path)
+        service.sync_rules(rules)
+
+        source.write_text("# FIRST")
+        result = service.sync_rules(rules)
+
+        assert result.updated == 1
+        assert result.comparisons == {TIER_FINGERPRINT: 1}
+        assert (tmp_path / ".cursor" / "rules" / source.name).read_text() == "# FIRST"
+
+    def test_edit_between_fingerprint_blocks_needs_checksum(self, config, rules, source, tmp_path):
+        content = b"a" * (3 * FINGERPRINT_BLOCK_SIZE)
+        source.write_bytes(content)
+        config.performance.checksum_algorithm = "blake2b"
+        service = SyncService(config, tmp_path)
+        service.sync_rules(rules)
+
+        middle = len(content) // 2
+        source.write_bytes(content[:middle] + b"b" + content[middle + 1:])
+        result = service.sync_rules(rules)
+
+        assert result.updated == 1
+        assert result.comparisons == {TIER_CHECKSUM: 1}
+        target = tmp_path / ".cursor" / "rules" / source.name
+        assert target.read_bytes() == source.read_bytes()
+        assert service.sync_rules(rules, dry_run=True).skipped == 1
+
+    def test_merge_adds_comparisons(self):
+        result = SyncResult(comparisons={TIER_STAT: 2})
+        result.merge(SyncResult(comparisons={TIER_STAT: 1, TIER_CHECKSUM: 1}))
+
+        assert result.comparisons == {TIER_STAT: 3, TIER_CHECKSUM: 1}
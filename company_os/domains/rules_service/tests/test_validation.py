@@ -1,12 +1,15 @@
 """Unit tests for the validation module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 import pytest
+import yaml
 
 from company_os.domains.rules_service.src.validation import (
     RuleExtractor, ExtractedRule, RuleEngine, DocumentTypeDetector, DocumentType,
     ValidationIssue, ValidationResult, ValidationService, Severity, IssueCategory,
-    AutoFixer
+    AutoFixer, ParsedDocument
 )
 from company_os.domains.rules_service.src.models import RuleDocument
 
@@ -220,6 +223,44 @@ class TestRuleEngine:
         assert len(unknown_rules) == 1
         assert unknown_rules[0].rule_id == "universal_rule"
 
+    def test_rules_resolved_once_until_rules_added(self):
+        """Test that each document type's rules are memoized until add_rules."""
+        engine = RuleEngine()
+        engine.add_rules([
+            ExtractedRule(rule_id="decision_rule", rule_type="frontmatter",
+                          description="Decision-specific rule", applies_to=["decision"]),
+            ExtractedRule(rule_id="universal_rule", rule_type="content", description="Universal rule"),
+        ])
+
+        first = engine.rules_for_document("decision")
+        with patch.object(engine, '_resolve', side_effect=AssertionError("rule set rescanned")):
+            assert engine.rules_for_document("decision") is first
+            assert engine.get_rules_for_document("decision") == list(first)
+        assert isinstance(first, tuple)
+
+        engine.add_rules([
+            ExtractedRule(rule_id="late_rule", rule_type="section",
+                          description="Added later", applies_to=["decision"]),
+        ])
+        assert [r.rule_id for r in engine.rules_for_document("decision")] == [
+            "decision_rule", "late_rule", "universal_rule"
+        ]
+
+    def test_rule_counts_by_document_type(self):
+        """Test introspecting how many rules apply per document type."""
+        engine = RuleEngine()
+        engine.add_rules([
+            ExtractedRule(rule_id="decision_rule", rule_type="frontmatter",
+                          description="Decision rule", applies_to=["decision", "brief"]),
+            ExtractedRule(rule_id="brief_rule", rule_type="pattern",
+                          description="Brief rule", applies_to=["brief"]),
+            ExtractedRule(rule_id="universal_rule", rule_type="content", description="Universal rule"),
+        ])
+
+        assert engine.rule_counts_by_document_type() == {
+            "brief": 3, "decision": 2, DocumentType.UNKNOWN: 1
+        }
+
 
 class TestDocumentTypeDetector:
     """Test the DocumentTypeDetector functionality."""
@@ -298,6 +339,70 @@ class TestDocumentTypeDetector:
         detected = DocumentTypeDetector.detect_type(windows_path)
         assert detected == DocumentType.DECISION
 
+    def test_first_listed_path_pattern_wins(self):
+        """Test that path patterns keep their priority wherever they match."""
+        assert DocumentTypeDetector.detect_type("/rules/old/decisions/a.md") == DocumentType.DECISION
+        assert DocumentTypeDetector.detect_type("/processes/a.md") == DocumentType.WORKFLOW
+        assert DocumentTypeDetector.detect_type("/x/signals/briefs/a.md") == DocumentType.BRIEF
+
+    def test_detections_are_cached(self):
+        """Test that repeated paths are answered from the cache."""
+        path = Path("/work/domains/decisions/data/cached.md")
+        DocumentTypeDetector.detect_type(path)
+        hits = DocumentTypeDetector._detect_cached.cache_info().hits
+
+        assert DocumentTypeDetector.detect_type(path) == DocumentType.DECISION
+        assert DocumentTypeDetector._detect_cached.cache_info().hits == hits + 1
+
+    def test_user_defined_mappings(self):
+        """Test suffixes and path patterns configured by the user."""
+        try:
+            assert DocumentTypeDetector.detect_type("/docs/adr/0001-choice.md") == DocumentType.UNKNOWN
+
+            DocumentTypeDetector.configure(
+                suffixes={".ADR.md": DocumentType.DECISION, ".brief.md": "pitch"},
+                path_patterns={DocumentType.DECISION: ["/adr/"], "note": ["/decisions/"]},
+            )
+
+            assert DocumentTypeDetector.detect_type("/docs/adr/0001-choice.md") == DocumentType.DECISION
+            assert DocumentTypeDetector.detect_type("0002-other.adr.md") == DocumentType.DECISION
+            assert DocumentTypeDetector.detect_type("opportunity.brief.md") == "pitch"
+            assert DocumentTypeDetector.detect_type("/decisions/x.md") == "note"
+            assert DocumentTypeDetector.detect_type("service.charter.md") == DocumentType.CHARTER
+        finally:
+            DocumentTypeDetector.configure()
+
+        assert DocumentTypeDetector.detect_type("/docs/adr/0001-choice.md") == DocumentType.UNKNOWN
+        assert DocumentTypeDetector.detect_type("opportunity.brief.md") == DocumentType.BRIEF
+
+    def test_user_suffixes_override_longer_built_in_suffixes(self):
+        """Test that a user suffix wins even where a longer built-in suffix matches."""
+        try:
+            DocumentTypeDetector.configure(suffixes={".md": DocumentType.REFERENCE, "-decision.md": "note"})
+
+            assert DocumentTypeDetector.detect_type("choice.decision.md") == DocumentType.REFERENCE
+            assert DocumentTypeDetector.detect_type("old-decision.md") == "note"
+            assert DocumentTypeDetector.detect_type("service.charter.txt") == DocumentType.UNKNOWN
+        finally:
+            DocumentTypeDetector.configure()
+
+        assert DocumentTypeDetector.detect_type("choice.decision.md") == DocumentType.DECISION
+
+    def test_mappings_loaded_from_config(self, tmp_path):
+        """Test loading user-defined mappings from the configuration file."""
+        config_path = tmp_path / ".rules-service.yaml"
+        config_path.write_text(yaml.dump({
+            "version": "1.0",
+            "agent_folders": [],
+            "document_types": {"suffixes": {".adr.md": "decision"}},
+        }))
+        try:
+            DocumentTypeDetector.load_config(config_path)
+            assert DocumentTypeDetector.custom_mappings() == ({".adr.md": "decision"}, {})
+            assert DocumentTypeDetector.detect_type("0001-choice.adr.md") == DocumentType.DECISION
+        finally:
+            DocumentTypeDetector.configure()
+
     def test_get_type_info(self):
         """Test getting information about document types."""
         info = DocumentTypeDetector.get_type_info(DocumentType.DECISION)
@@ -670,6 +775,174 @@ title: Test Document
         assert all(issue.line_number is not None for issue in issues)
 
 
+class TestValidateBatch:
+    """Test validating many documents in one call."""
+
+    @pytest.fixture
+    def service(self):
+        engine = RuleEngine()
+        engine.add_rules([
+            ExtractedRule(rule_id="decision_id", rule_type="pattern", description="Must contain a decision ID",
+                          pattern=r"DEC-\d{3}", applies_to=[DocumentType.DECISION]),
+            ExtractedRule(rule_id="no_todo", rule_type="pattern", description="Must not contain TODO",
+                          pattern=r"TODO"),
+        ])
+        return ValidationService.from_rule_engine(engine)
+
+    DOCUMENTS = [
+        (Path("/repo-a/one.decision.md"), "DEC-001\nTODO"),
+        (Path("/repo-b/notes.md"), "TODO\nTODO"),
+        ("/repo-b/two.decision.md", "No id"),
+    ]
+
+    def test_matches_validate_document(self, service):
+        results = list(service.validate_batch(self.DOCUMENTS))
+
+        expected = [service.validate_document(Path(path), content) for path, content in self.DOCUMENTS]
+        assert [r.file_path for r in results] == [r.file_path for r in expected]
+        assert [[i.to_dict() for i in r.issues] for r in results] == \
+            [[i.to_dict() for i in r.issues] for r in expected]
+        assert [r.error_count for r in results] == [1, 2, 1]
+
+    def test_rules_resolved_once_per_type(self, service):
+        documents = self.DOCUMENTS * 10
+        with patch.object(service.rule_engine, 'rules_for_document',
+                          wraps=service.rule_engine.rules_for_document) as resolve:
+            results = list(service.validate_batch(documents))
+
+        assert len(results) == 30
+        assert sorted(call.args[0] for call in resolve.call_args_list) == \
+            sorted([DocumentType.DECISION, DocumentType.UNKNOWN])
+
+    def test_streams_lazily(self, service):
+        def documents():
+            yield self.DOCUMENTS[0]
+            raise AssertionError("consumed ahead of the caller")
+
+        results = service.validate_batch(documents())
+        assert next(results).file_path == "/repo-a/one.decision.md"
+
+    def test_executor_keeps_input_order(self, service):
+        documents = [(Path(f"/repo/{i}.decision.md"), f"DEC-{i:03d}") for i in range(50)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(service.validate_batch(documents, executor=executor))
+
+        assert [r.file_path for r in results] == [str(path) for path, _ in documents]
+        assert all(r.is_valid for r in results)
+
+
+class TestPatternCompilation:
+    """Test precompiled patterns and the combined line scanner."""
+
+    def test_pattern_compiled_at_construction(self):
+        """Test that pattern rules carry their compiled pattern."""
+        rule = ExtractedRule(
+            rule_id="p", rule_type="pattern", description="Must not contain TODO", pattern="TODO"
+        )
+        assert rule.compiled_pattern is not None
+        assert rule.compiled_pattern.pattern == "TODO"
+        assert rule.pattern_error is None
+
+    def test_invalid_pattern_reported_once(self):
+        """Test that invalid patterns become a diagnostic instead of per-document errors."""
+        service = ValidationService([])
+        service.rule_engine.add_rules([
+            ExtractedRule(
+                rule_id="bad", rule_type="pattern", description="Must not match", pattern="(unclosed",
+                source_file="bad.rules.md"
+            )
+        ])
+
+        diagnostics = service.rule_diagnostics
+        assert len(diagnostics) == 1
+        assert "bad" in diagnostics[0] and "bad.rules.md" in diagnostics[0]
+
+        result = service.validate_document(Path("/test.md"), "(unclosed")
+        assert result.issues == []
+
+    def test_combined_scan_matches_individual_rules(self):
+        """Test that the combined scan reports exactly what per-rule scans report."""
+        rules = [
+            ExtractedRule(rule_id="todo", rule_type="pattern", description="Must not contain TODO",
+                          pattern="TODO", severity="warning"),
+            ExtractedRule(rule_id="fixme", rule_type="pattern", description="Should not contain FIXME",
+                          pattern="FIX(ME)?"),
+            ExtractedRule(rule_id="repeat", rule_type="pattern", description="Must not repeat words",
+                          pattern=r"\b(\w+) \1\b"),
+            ExtractedRule(rule_id="flags", rule_type="pattern", description="Must not say hack",
+                          pattern="(?i)hack"),
+        ]
+        service = ValidationService([])
+        service.rule_engine.add_rules(rules)
+        content = "TODO and FIX\nthe the end\nclean line\nHACK TODO\n"
+
+        result = service.validate_document(Path("/test.md"), content)
+
+        expected = []
+        for rule in rules:
+            expected.extend(service._validate_pattern(rule, content, Path("/test.md")))
+        assert [(i.rule_id, i.line_number) for i in result.issues] == \
+            [(i.rule_id, i.line_number) for i in expected]
+        assert ("todo", 4) in [(i.rule_id, i.line_number) for i in result.issues]
+        assert ("repeat", 2) in [(i.rule_id, i.line_number) for i in result.issues]
+
+
+class TestParsedDocument:
+    """Test the shared per-document parsed view."""
+
+    CONTENT = """---
+title: Test Document
+status: active
+---
+
+# Heading One
+
+Some words here.
+
+## Heading Two
+"""
+
+    def test_derived_values(self):
+        """Test frontmatter, headers, word count and line lookup."""
+        document = ParsedDocument(self.CONTENT)
+
+        assert document.frontmatter == {'title': 'Test Document', 'status': 'active'}
+        assert document.headers == ['Heading One', 'Heading Two']
+        assert document.word_count == len(self.CONTENT.split())
+        assert document.lines == self.CONTENT.split('\n')
+
+        offset = self.CONTENT.index('Heading Two')
+        assert document.line_number_at(offset) == self.CONTENT[:offset].count('\n') + 1
+        assert document.line_number_at(0) == 1
+
+    def test_of_reuses_parsed_document(self):
+        """Test that ParsedDocument.of does not re-wrap a parsed document."""
+        document = ParsedDocument(self.CONTENT)
+        assert ParsedDocument.of(document) is document
+        assert ParsedDocument.of(self.CONTENT).content == self.CONTENT
+
+    def test_frontmatter_parsed_once_per_document(self):
+        """Test that many frontmatter rules share a single YAML parse."""
+        service = ValidationService([])
+        service.rule_engine.add_rules([
+            ExtractedRule(
+                rule_id=f"fm_rule_{i}",
+                rule_type="frontmatter",
+                description="Required fields",
+                required_fields=["title", f"field_{i}"],
+            )
+            for i in range(8)
+        ])
+
+        with patch('company_os.domains.rules_service.src.validation.yaml.safe_load',
+                   wraps=yaml.safe_load) as mock_load:
+            result = service.validate_document(Path("/test.md"), self.CONTENT)
+
+        assert mock_load.call_count == 1
+        assert len(result.issues) == 8
+
+
 class TestAutoFixer:
     """Test the AutoFixer functionality."""
 
@@ -0,0 +1,147 @@
+"""Unit tests for the file watcher used by validate --watch."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from company_os.domains.rules_service.src.watcher import FileWatcher
+
+
+def _bump(path, content):
+    """Rewrite a file with a later modification time."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+def make_watcher(request):
+    """Create watchers with either backend, closing them afterwards."""
+    watchers = []
+
+    def make(*roots, **kwargs):
+        watcher = FileWatcher(roots, poll_interval=0.02, use_inotify=request.param, **kwargs)
+        if request.param and watcher.backend != "inotify":
+            pytest.skip("inotify is not available on this platform")
+        watchers.append(watcher)
+        return watcher
+
+    yield make
+    for watcher in watchers:
+        watcher.close()
+
+
+class TestFileWatcher:
+    """Test change detection for both backends."""
+
+    def test_reports_modified_file(self, tmp_path, make_watcher):
+        doc = tmp_path / "doc.md"
+        doc.write_text("one")
+        watcher = make_watcher(tmp_path)
+
+        _bump(doc, "two")
+
+        assert watcher.wait(timeout=2) == {doc}
+
+    def test_reports_created_and_deleted_files(self, tmp_path, make_watcher):
+        old = tmp_path / "old.md"
+        old.write_text("old")
+        watcher = make_watcher(tmp_path)
+
+        new = tmp_path / "sub" / "new.md"
+        new.parent.mkdir()
+        new.write_text("new")
+        old.unlink()
+
+        changed = set()
+        deadline = time.monotonic() + 2
+        while changed != {old, new} and time.monotonic() < deadline:
+            changed |= watcher.wait(timeout=0.2)
+        assert changed == {old, new}
+        assert watcher.files == [new]
+
+    def test_unchanged_signature_is_not_reported(self, tmp_path, make_watcher):
+        doc = tmp_path / "doc.md"
+        doc.write_text("same")
+        watcher = make_watcher(tmp_path)
+
+        # Re-open and close without changing anything
+        with open(doc, "a"):
+            pass
+
+        assert watcher.wait(timeout=0.2) == set()
+
+    def test_include_filters_files(self, tmp_path, make_watcher):
+        watcher = make_watcher(tmp_path, include=lambda path: path.suffix == ".md")
+
+        (tmp_path / "notes.txt").write_text("ignored")
+        (tmp_path / "doc.md").write_text("watched")
+
+        assert watcher.wait(timeout=2) == {tmp_path / "doc.md"}
+
+    def test_hidden_directories_are_skipped(self, tmp_path, make_watcher):
+        hidden = tmp_path / ".cache"
+        hidden.mkdir()
+        watcher = make_watcher(tmp_path)
+
+        (hidden / "doc.md").write_text("ignored")
+
+        assert watcher.wait(timeout=0.2) == set()
+
+    def test_wait_blocks_until_change(self, tmp_path, make_watcher):
+        doc = tmp_path / "doc.md"
+        doc.write_text("one")
+        watcher = make_watcher(tmp_path)
+
+        timer = threading.Timer(0.1, _bump, args=(doc, "two"))
+        timer.start()
+        try:
+            assert watcher.wait(timeout=5) == {doc}
+        finally:
+            timer.cancel()
+
+    def test_single_files_are_watched_without_their_directory(self, tmp_path, make_watcher):
+        doc = tmp_path / "doc.md"
+        doc.write_text("one")
+        sibling = tmp_path / "sibling.md"
+        sibling.write_text("one")
+        (tmp_path / "sub").mkdir()
+        watcher = make_watcher(files=[doc])
+
+        _bump(sibling, "two")
+        (tmp_path / "sub" / "nested.md").write_text("new")
+        assert watcher.wait(timeout=0.2) == set()
+
+        _bump(doc, "two")
+        assert watcher.wait(timeout=2) == {doc}
+        assert watcher.files == [doc]
+
+    def test_single_file_may_be_created_later(self, tmp_path, make_watcher):
+        doc = tmp_path / "doc.txt"
+        watcher = make_watcher(files=[doc], include=lambda path: path.suffix == ".md")
+
+        doc.write_text("created")
+
+        assert watcher.wait(timeout=2) == {doc}
+
+    def test_accepted_changes_are_not_reported(self, tmp_path, make_watcher):
+        fixed = tmp_path / "fixed.md"
+        fixed.write_text("one")
+        edited = tmp_path / "edited.md"
+        edited.write_text("one")
+        watcher = make_watcher(tmp_path)
+
+        _bump(fixed, "fixed by us")
+        _bump(edited, "edited by someone else")
+        watcher.accept([fixed])
+
+        assert watcher.wait(timeout=2) == {edited}
+
+    def test_nested_roots_are_watched_once(self, tmp_path):
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        watcher = FileWatcher([nested, tmp_path, tmp_path], use_inotify=False)
+
+        assert watcher.roots == [tmp_path]
@@ -4,8 +4,9 @@ Source Truth Enforcement Service - CLI Implementation
 Command-line interface for checking source of truth consistency.
 """
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -19,6 +20,7 @@ from company_os.domains.source_truth_enforcement.src.models import (
     ScanStats,
 )
 from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+from company_os.domains.source_truth_enforcement.src.changes import get_changed_files
 
 
 app = typer.Typer(
@@ -28,6 +30,29 @@ app = typer.Typer(
 )
 console = Console()
 
+# Location of the registry within the repository
+REGISTRY_PATH = (
+    Path("company_os") / "domains" / "source_truth_enforcement" / "data" / "source_truth_registry.yaml"
+)
+
+
+def _repository_root() -> Path:
+    """Get the root of the working tree to check.
+
+    ``bazel run`` starts the command inside the runfiles tree, so the
+    workspace it was invoked from is used instead of the current directory.
+    """
+    return Path(os.environ.get("BUILD_WORKSPACE_DIRECTORY", "."))
+
+
+def _default_registry_path(repository_root: Path) -> Path:
+    """Get the registry of the working tree, falling back to the packaged copy."""
+    registry_path = repository_root / REGISTRY_PATH
+    if registry_path.exists():
+        return registry_path
+    service_dir = Path(__file__).parent.parent.parent
+    return service_dir / "data" / "source_truth_registry.yaml"
+
 
 @app.command()
 def check(
@@ -54,43 +79,81 @@ def check(
         "console", "--format", help="Output format (console, json)"
     ),
     strict: bool = typer.Option(False, "--strict", help="Treat warnings as errors"),
+    files: Optional[List[Path]] = typer.Option(
+        None, "--files", help="Only scan these files (repeatable)"
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only scan files changed since this git revision (e.g. HEAD)",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore and do not update the result cache"
+    ),
+    executor: str = typer.Option(
+        "thread", "--executor", help="Scan executor (thread, process, serial)"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Show per-phase and per-definition timings"
+    ),
 ):
     """Check source of truth consistency across the repository."""
 
+    incremental = files is not None or changed_since is not None
+
     # Determine which check to run
     if not any([all_definitions, python_version, dependencies, forbidden_files]):
-        console.print(
-            "❌ Please specify what to check (--all, --python-version, --dependencies, or --forbidden-files)"
-        )
-        raise typer.Exit(1)
+        if not incremental:
+            console.print(
+                "❌ Please specify what to check (--all, --python-version, --dependencies, or --forbidden-files)"
+            )
+            raise typer.Exit(1)
+        # Incremental runs check every definition against the selected files
+        all_definitions = True
 
-    # Default registry path
+    # Relative paths are given from the working tree, also under bazel run
+    repository_root = _repository_root()
     if registry_path is None:
-        service_dir = Path(__file__).parent.parent.parent
-        registry_path = service_dir / "data" / "source_truth_registry.yaml"
+        registry_path = _default_registry_path(repository_root)
+    else:
+        registry_path = repository_root / registry_path
+    if files is not None:
+        files = [repository_root / path for path in files]
 
     # Create configuration
     config = CheckerConfig(
         registry_path=str(registry_path),
-        repository_root=".",
+        repository_root=str(repository_root),
         verbose=verbose,
         debug=debug,
+        cache_enabled=not no_cache,
+        executor=executor,
     )
 
     try:
         # Initialize checker
         checker = SourceTruthChecker(config)
 
+        # Restrict the scan to the given or changed files
+        scan_files: Optional[List[Path]] = None
+        if incremental:
+            scan_files = list(files or [])
+            if changed_since is not None:
+                scan_files.extend(
+                    get_changed_files(Path(config.repository_root), changed_since)
+                )
+            console.print(f"📝 Limiting scan to {len(scan_files)} file(s)")
+
         # Run appropriate check
         if all_definitions:
             console.print("🔍 Checking all source of truth definitions...")
-            report = checker.check_all()
+            report = checker.check_all(files=scan_files)
         elif python_version:
             console.print("🐍 Checking Python version consistency...")
-            report = checker.check_definition("python_version")
+            report = checker.check_definition("python_version", files=scan_files)
         elif dependencies:
             console.print("📦 Checking dependency management...")
-            report = checker.check_definition("dependencies")
+            report = checker.check_definition("dependencies", files=scan_files)
         elif forbidden_files:
             console.print("🚫 Checking for forbidden files...")
             violations = checker.check_forbidden_files()
@@ -114,6 +177,8 @@ def check(
             console.print(report.model_dump_json(indent=2))
         else:
             _display_console_report(report)
+            if profile:
+                _display_profile(report)
 
         # Determine exit code
         exit_code = report.get_exit_code()
@@ -196,6 +261,83 @@ def _display_console_report(report: Report) -> None:
                 )
 
 
+def _display_profile(report: Report) -> None:
+    """Display per-phase, per-definition and per-file scan metrics."""
+    metrics = report.stats.metrics
+    if metrics is None:
+        console.print("\nNo profile data available for this check.")
+        return
+
+    console.print("\n")
+    phases_table = Table(title="Scan Profile (summed across workers)")
+    phases_table.add_column("Phase", style="cyan")
+    phases_table.add_column("Time", style="white", justify="right")
+    phases_table.add_column("Details", style="white")
+
+    phases_table.add_row(
+        "Walk", f"{metrics.walk_seconds:.3f}s", f"{metrics.files_enumerated} files enumerated"
+    )
+    phases_table.add_row(
+        "Read",
+        f"{metrics.read_seconds:.3f}s",
+        f"{metrics.files_read} files, {metrics.bytes_read / 1024:.1f} KiB"
+        f" ({metrics.files_cached} cached)",
+    )
+    phases_table.add_row("Match", f"{metrics.match_seconds:.3f}s", "")
+    phases_table.add_row("Ignore filter", f"{metrics.ignore_seconds:.3f}s", "")
+    console.print(phases_table)
+
+    definitions_table = Table(title="Definitions")
+    definitions_table.add_column("Definition", style="cyan")
+    definitions_table.add_column("Files", justify="right")
+    definitions_table.add_column("Matched", justify="right")
+    definitions_table.add_column("Matches", justify="right")
+    definitions_table.add_column("Violations", justify="right")
+    definitions_table.add_column("Ignored", justify="right")
+    definitions_table.add_column("Time", justify="right")
+
+    for name, definition_metrics in sorted(
+        metrics.definitions.items(), key=lambda item: item[1].match_seconds, reverse=True
+    ):
+        definitions_table.add_row(
+            name,
+            str(definition_metrics.files_scanned),
+            str(definition_metrics.files_matched),
+            str(definition_metrics.matches),
+            str(definition_metrics.violations),
+            str(definition_metrics.ignored),
+            f"{definition_metrics.match_seconds:.3f}s",
+        )
+    console.print(definitions_table)
+
+    patterns = [
+        (name, pattern, count)
+        for name, definition_metrics in metrics.definitions.items()
+        for pattern, count in definition_metrics.matches_by_pattern.items()
+    ]
+    if patterns:
+        patterns_table = Table(title="Matches per Pattern")
+        patterns_table.add_column("Definition", style="cyan")
+        patterns_table.add_column("Pattern", style="white")
+        patterns_table.add_column("Matches", justify="right")
+        for name, pattern, count in sorted(patterns, key=lambda p: p[2], reverse=True):
+            patterns_table.add_row(name, pattern, str(count))
+        console.print(patterns_table)
+
+    if metrics.slowest_files:
+        files_table = Table(title="Slowest Files")
+        files_table.add_column("File", style="white")
+        files_table.add_column("Size", justify="right")
+        files_table.add_column("Time", justify="right")
+        for timing in metrics.slowest_files:
+            files_table.add_row(
+                timing.file_path,
+                f"{timing.bytes_read / 1024:.1f} KiB",
+                f"{timing.seconds * 1000:.1f}ms",
+            )
+        console.print(files_table)
+
+
 @app.command()
 def info():
     """Show information about the source truth enforcement system."""
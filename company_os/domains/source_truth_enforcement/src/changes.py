@@ -0,0 +1,58 @@
+"""
+Source Truth Enforcement Service - Change Detection
+
+This module lists the files changed in a git working tree, for incremental checks.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import List
+
+
+def _git(repository_root: Path, *args: str) -> str:
+    """Run a git command in the repository and return its output."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=repository_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError:
+        raise ValueError("git is not available to detect changed files")
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {' '.join(args)} failed: {e.stderr.strip()}")
+    return result.stdout
+
+
+def get_changed_files(repository_root: Path, since: str) -> List[Path]:
+    """Get the files changed in the working tree since a git revision.
+
+    Includes committed, staged and unstaged changes relative to the
+    revision, as well as untracked files that are not ignored. Deleted files
+    are included so that deleting the registry or a source of truth still
+    triggers a full scan; the inventory skips paths that no longer exist.
+
+    Args:
+        repository_root: Directory inside the git repository
+        since: Revision to compare against (e.g. ``HEAD`` or ``origin/main``)
+
+    Returns:
+        Absolute paths of changed files
+
+    Raises:
+        ValueError: If git is unavailable or the revision is unknown
+    """
+    repository_root = Path(repository_root)
+    toplevel = Path(_git(repository_root, "rev-parse", "--show-toplevel").strip())
+
+    changed = _git(
+        repository_root, "diff", "--name-only", "-z", since, "--"
+    ).split("\0")
+    untracked = _git(
+        repository_root, "ls-files", "--others", "--exclude-standard", "-z", "--full-name"
+    ).split("\0")
+
+    paths = dict.fromkeys(name for name in changed + untracked if name)
+    return [toplevel / name for name in paths]
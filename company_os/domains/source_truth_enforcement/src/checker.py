@@ -4,12 +4,15 @@ Source Truth Enforcement Service - Main Checker
 This module contains the main consistency checker that orchestrates the validation process.
 """
 
+import os
 import re
 import time
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .models import (
     Violation,
@@ -19,9 +22,152 @@ from .models import (
     CheckerConfig,
     RegistryDefinition,
     IgnoreSummary,
+    IgnoredViolation,
+    DefinitionMetrics,
+    FileTiming,
+    ScanMetrics,
 )
 from .registry import SourceTruthRegistry
 from .ignore_parser import IgnoreParser
+from .file_inventory import FileInventory
+from .pattern_matcher import PatternMatcher, definition_patterns
+from .result_cache import (
+    DEFAULT_CACHE_PATH,
+    ResultCache,
+    definition_fingerprint,
+    hash_content,
+)
+
+
+class LineIndex:
+    """Line lookup index for a file's content, built lazily once per file.
+
+    Line numbers are resolved by bisecting the offsets of newline characters
+    instead of counting newlines before every match, which keeps scans of
+    large files with many matches linear.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self._offsets: Optional[List[int]] = None
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def offsets(self) -> List[int]:
+        """Start offset of every line."""
+        if self._offsets is None:
+            offsets = [0]
+            find = self.content.find
+            position = find("\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = find("\n", position + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def lines(self) -> List[str]:
+        """Content split into lines at the same newlines as ``offsets``.
+
+        Unlike ``str.splitlines()``, only ``\\n`` ends a line, so form feeds,
+        lone ``\\r`` or ``\\u2028`` in a file do not shift context lines
+        away from the reported line numbers. A ``\\r`` before the newline is
+        dropped.
+        """
+        if self._lines is None:
+            lines = self.content.split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            self._lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+        return self._lines
+
+    def line_number(self, offset: int) -> int:
+        """Get the 1-based line number of a character offset."""
+        return bisect_right(self.offsets, offset)
+
+
+@dataclass
+class FileScanResult:
+    """Violations found in one file, keyed by definition name."""
+
+    violations: Dict[str, List[Violation]] = field(default_factory=dict)
+    ignored: Dict[str, List[IgnoredViolation]] = field(default_factory=dict)
+    content_hash: Optional[str] = None
+    read: bool = False
+    scanned: List[str] = field(default_factory=list)
+
+    # Timing and match counts of a fresh scan
+    bytes_read: int = 0
+    read_seconds: float = 0.0
+    match_seconds: float = 0.0
+    ignore_seconds: float = 0.0
+    definition_seconds: Dict[str, float] = field(default_factory=dict)
+    pattern_matches: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent reading and checking the file."""
+        return self.read_seconds + self.match_seconds + self.ignore_seconds
+
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to plain data for returning from a worker process."""
+        record = {f.name: getattr(self, f.name) for f in fields(self)}
+        record["violations"] = {
+            name: [v.model_dump(mode="json") for v in violations]
+            for name, violations in self.violations.items()
+        }
+        record["ignored"] = {
+            name: [i.model_dump(mode="json") for i in ignored]
+            for name, ignored in self.ignored.items()
+        }
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "FileScanResult":
+        """Rebuild a result from plain data returned by a worker process."""
+        result = cls(**record)
+        result.violations = {
+            name: [Violation.model_validate(v) for v in violations]
+            for name, violations in record["violations"].items()
+        }
+        result.ignored = {
+            name: [IgnoredViolation.model_validate(i) for i in ignored]
+            for name, ignored in record["ignored"].items()
+        }
+        return result
+
+
+# (definition name, definition, source of truth value, definition fingerprint)
+# checked against a file
+DefinitionCheck = Tuple[str, RegistryDefinition, Optional[str], str]
+
+# (file path, names of the definitions to check, cache entry) handed to a worker
+ScanTask = Tuple[Path, List[str], Optional[Dict]]
+
+# Executor backends for scanning files
+EXECUTORS = ("thread", "process", "serial")
+
+# Number of slowest files listed in the scan metrics
+SLOWEST_FILES_REPORTED = 10
+
+# Per-process state of scan workers, set up once by _init_worker
+_worker_checker: Optional["SourceTruthChecker"] = None
+_worker_checks: Dict[str, DefinitionCheck] = {}
+
+
+def _init_worker(
+    checker: "SourceTruthChecker", checks_by_name: Dict[str, DefinitionCheck]
+) -> None:
+    """Receive the checker and definition checks once per worker process."""
+    global _worker_checker, _worker_checks
+    _worker_checker = checker
+    _worker_checks = checks_by_name
+
+
+def _scan_batch_in_worker(batch: List[ScanTask]) -> List[Dict[str, Any]]:
+    """Scan a batch of files in a worker process and return plain records."""
+    results = _worker_checker._scan_batch(batch, _worker_checks)
+    return [result.to_record() for result in results]
 
 
 class SourceTruthChecker:
@@ -37,28 +183,48 @@ class SourceTruthChecker:
         self.registry = SourceTruthRegistry(Path(config.registry_path))
         self.repository_root = Path(config.repository_root)
         self.ignore_summary = IgnoreSummary()
+        self._inventory: Optional[FileInventory] = None
+        self._matcher: Optional[PatternMatcher] = None
+        self.metrics = ScanMetrics()
+        self._files_scanned = 0
+        self.result_cache = self._create_result_cache()
+        # Content is only hashed for the result cache; kept for worker processes
+        self._hash_contents = self.result_cache is not None
+
+        if config.executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor '{config.executor}', expected one of: {', '.join(EXECUTORS)}"
+            )
 
         # Validate configuration
         self.registry.validate_registry()
 
-    def check_all(self) -> Report:
+    def check_all(self, files: Optional[Iterable[Path]] = None) -> Report:
         """Check all source of truth definitions.
 
+        Args:
+            files: Optional paths to restrict the scan to. The whole repository
+                is still scanned when one of them is the registry or the
+                source of truth file of a definition.
+
         Returns:
             Comprehensive report of violations found
         """
         start_time = time.time()
         all_violations = []
+        self._reset_metrics()
+        # Pick up registry edits made since the previous check
+        self.registry.reload()
+
+        # One repository walk shared by every definition in this run
+        self._inventory = self._build_inventory(
+            files, self.registry.list_definitions()
+        )
 
         if self.config.debug:
             print("🔍 Starting comprehensive source of truth check...")
 
-        for name, definition in self.registry.list_definitions().items():
-            if self.config.debug:
-                print(f"📋 Checking {name}...")
-
-            violations = self._check_definition(name, definition)
-            all_violations.extend(violations)
+        all_violations = self._check_definitions(self.registry.list_definitions())
 
         end_time = time.time()
 
@@ -75,21 +241,29 @@ class SourceTruthChecker:
             else None,
         )
 
-    def check_definition(self, definition_name: str) -> Report:
+    def check_definition(
+        self, definition_name: str, files: Optional[Iterable[Path]] = None
+    ) -> Report:
         """Check a specific source of truth definition.
 
         Args:
             definition_name: Name of the definition to check
+            files: Optional paths to restrict the scan to, as for check_all
 
         Returns:
             Report containing violations for this definition
         """
         start_time = time.time()
+        self.registry.reload()
 
         definition = self.registry.get_definition(definition_name)
         if not definition:
             raise ValueError(f"Definition '{definition_name}' not found in registry")
 
+        self._reset_metrics()
+        self._inventory = self._build_inventory(
+            files, {definition_name: definition}
+        )
         violations = self._check_definition(definition_name, definition)
         end_time = time.time()
 
@@ -106,102 +280,371 @@ class SourceTruthChecker:
         self, name: str, definition: RegistryDefinition
     ) -> List[Violation]:
         """Check a single definition and return violations."""
-        violations = []
+        return self._check_definitions({name: definition})
 
-        try:
-            # Get source of truth value
-            source_value = self.registry.get_source_value(name)
+    def _check_definitions(
+        self, definitions: Dict[str, RegistryDefinition]
+    ) -> List[Violation]:
+        """Check several definitions with a file-major pipeline.
 
-            # Get files to scan
-            files_to_scan = self._get_files_to_scan(definition)
+        Each file is read and ignore-parsed once and then checked against
+        every definition that scans it. Results are reassembled in
+        definition order so the report matches a definition-by-definition scan.
+        """
+        files_by_definition: Dict[str, List[Path]] = {}
+        system_errors: Dict[str, Violation] = {}
+        checks_by_file: Dict[Path, List[DefinitionCheck]] = {}
 
-            if self.config.parallel and len(files_to_scan) > 10:
-                violations = self._scan_files_parallel(
-                    name, definition, source_value, files_to_scan
-                )
-            else:
-                violations = self._scan_files_sequential(
-                    name, definition, source_value, files_to_scan
-                )
+        if self._inventory is None:
+            self._inventory = self._build_inventory()
 
-        except Exception as e:
+        # Enumerate files up front so the walk is timed on its own
+        walk_started = time.perf_counter()
+        self.metrics.files_enumerated = len(self._inventory.files)
+        self.metrics.walk_seconds += time.perf_counter() - walk_started
+
+        for name, definition in definitions.items():
             if self.config.debug:
-                print(f"❌ Error checking {name}: {e}")
-            violations.append(
-                Violation(
+                print(f"📋 Checking {name}...")
+
+            try:
+                # Get source of truth value
+                source_value = self.registry.get_source_value(name)
+
+                # Get files to scan
+                files_to_scan = self._get_files_to_scan(definition)
+
+            except Exception as e:
+                if self.config.debug:
+                    print(f"❌ Error checking {name}: {e}")
+                system_errors[name] = Violation(
                     definition=name,
                     file_path="system",
                     line_number=0,
                     message=f"System error: {e}",
                     severity=Severity.HIGH,
                 )
-            )
+                continue
 
-        return violations
-
-    def _scan_files_sequential(
-        self,
-        name: str,
-        definition: RegistryDefinition,
-        source_value: Optional[str],
-        files: List[Path],
-    ) -> List[Violation]:
-        """Scan files sequentially."""
-        violations = []
+            files_by_definition[name] = files_to_scan
+            fingerprint = definition_fingerprint(definition)
+            for file_path in dict.fromkeys(files_to_scan):
+                checks_by_file.setdefault(file_path, []).append(
+                    (name, definition, source_value, fingerprint)
+                )
 
-        for file_path in files:
-            if self.config.verbose:
-                print(f"   📄 Scanning {file_path}")
+        # Compile every content pattern once for the whole run
+        self._matcher = self.registry.get_pattern_matcher(definitions)
+        results = self._scan_files(checks_by_file)
+        self._files_scanned += len(checks_by_file)
+        self._record_metrics(files_by_definition, results)
 
-            file_violations = self._scan_file(name, definition, source_value, file_path)
-            violations.extend(file_violations)
+        violations: List[Violation] = []
+        for name in definitions:
+            if name in system_errors:
+                violations.append(system_errors[name])
+                continue
+
+            for file_path in files_by_definition[name]:
+                result = results[file_path]
+                violations.extend(result.violations.get(name, []))
+                for ignored in result.ignored.get(name, []):
+                    self.ignore_summary.add_ignored_violation(
+                        ignored.violation, ignored.reason, ignored.ignore_type
+                    )
 
         return violations
 
-    def _scan_files_parallel(
+    def _reset_metrics(self) -> None:
+        """Start collecting metrics for a new check."""
+        self.metrics = ScanMetrics()
+        self._files_scanned = 0
+
+    def _record_metrics(
         self,
-        name: str,
-        definition: RegistryDefinition,
-        source_value: Optional[str],
-        files: List[Path],
-    ) -> List[Violation]:
-        """Scan files in parallel."""
-        violations = []
-        max_workers = self.registry.global_config.performance.get("max_workers", 4)
+        files_by_definition: Dict[str, List[Path]],
+        results: Dict[Path, FileScanResult],
+    ) -> None:
+        """Aggregate per-file scan results into the run's metrics."""
+        metrics = self.metrics
+
+        for result in results.values():
+            if result.read:
+                metrics.files_read += 1
+                metrics.bytes_read += result.bytes_read
+            if not result.scanned:
+                metrics.files_cached += 1
+            metrics.read_seconds += result.read_seconds
+            metrics.match_seconds += result.match_seconds
+            metrics.ignore_seconds += result.ignore_seconds
+
+        for name, files in files_by_definition.items():
+            definition_metrics = metrics.definitions.setdefault(
+                name, DefinitionMetrics()
+            )
+            for file_path in dict.fromkeys(files):
+                result = results[file_path]
+                definition_metrics.files_scanned += 1
+                definition_metrics.violations += len(result.violations.get(name, []))
+                definition_metrics.ignored += len(result.ignored.get(name, []))
+                definition_metrics.match_seconds += result.definition_seconds.get(
+                    name, 0.0
+                )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {
-                executor.submit(
-                    self._scan_file, name, definition, source_value, file_path
-                ): file_path
-                for file_path in files
-            }
+                pattern_matches = result.pattern_matches.get(name, {})
+                if pattern_matches:
+                    definition_metrics.files_matched += 1
+                for pattern, count in pattern_matches.items():
+                    definition_metrics.matches += count
+                    definition_metrics.matches_by_pattern[pattern] = (
+                        definition_metrics.matches_by_pattern.get(pattern, 0) + count
+                    )
 
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+        timings = metrics.slowest_files + [
+            FileTiming(
+                file_path=str(file_path),
+                seconds=result.total_seconds,
+                bytes_read=result.bytes_read,
+            )
+            for file_path, result in results.items()
+            if result.scanned
+        ]
+        timings.sort(key=lambda timing: timing.seconds, reverse=True)
+        metrics.slowest_files = timings[:SLOWEST_FILES_REPORTED]
+
+    def _create_result_cache(self) -> Optional[ResultCache]:
+        """Create the persistent result cache if caching is enabled."""
+        performance = self.registry.global_config.performance
+        if not self.config.cache_enabled or not performance.get("cache_enabled", True):
+            return None
+
+        cache_path = (
+            Path(self.config.cache_path)
+            if self.config.cache_path
+            else self.repository_root / DEFAULT_CACHE_PATH
+        )
+        return ResultCache(cache_path, performance.get("cache_duration_hours"))
+
+    def _scan_files(
+        self, checks_by_file: Dict[Path, List[DefinitionCheck]]
+    ) -> Dict[Path, FileScanResult]:
+        """Scan files, reusing cached results and sharding the rest across threads."""
+        cache = self.result_cache
+        results: Dict[Path, FileScanResult] = {}
+        pending: Dict[Path, Optional[Dict]] = {}
+        stats: Dict[Path, os.stat_result] = {}
+
+        if cache is not None:
+            cache.load()
+
+        for file_path, checks in checks_by_file.items():
+            entry = None
+            if cache is not None:
                 try:
-                    file_violations = future.result()
-                    violations.extend(file_violations)
-                except Exception as e:
-                    if self.config.debug:
-                        print(f"⚠️ Error scanning {file_path}: {e}")
+                    stats[file_path] = file_path.stat()
+                except OSError:
+                    pass
+                else:
+                    entry = cache.get_entry(file_path)
+                    if entry is not None and ResultCache.matches_stat(
+                        entry, stats[file_path]
+                    ):
+                        cached = self._load_cached_results(entry, checks)
+                        if cached is not None:
+                            results[file_path] = cached
+                            cache.hits += 1
+                            continue
+            pending[file_path] = entry
+
+        files = list(pending)
+        checks_by_name = {
+            check[0]: check for checks in checks_by_file.values() for check in checks
+        }
+        tasks: List[ScanTask] = [
+            (
+                file_path,
+                [check[0] for check in checks_by_file[file_path]],
+                pending[file_path],
+            )
+            for file_path in files
+        ]
+        scanned = self._run_scan_tasks(tasks, checks_by_name)
+
+        for file_path, result in zip(files, scanned):
+            results[file_path] = result
+            if cache is not None and result.content_hash and file_path in stats:
+                self._store_results(file_path, stats[file_path], result, checks_by_file[file_path])
+
+        if cache is not None:
+            try:
+                cache.save()
+            except OSError as e:
+                if self.config.debug:
+                    print(f"⚠️ Could not write result cache {cache.cache_path}: {e}")
+
+        return results
+
+    def _run_scan_tasks(
+        self, tasks: List[ScanTask], checks_by_name: Dict[str, DefinitionCheck]
+    ) -> List[FileScanResult]:
+        """Scan files with the configured executor, keeping task order.
+
+        Files are handed to workers in batches. Process workers receive the
+        checker once when they start and return plain records, which are
+        turned back into results here.
+        """
+        executor_name = self.config.executor
+        if not self.config.parallel or len(tasks) <= 10:
+            executor_name = "serial"
 
-        return violations
+        if executor_name == "serial":
+            return self._scan_batch(tasks, checks_by_name)
+
+        max_workers = self.registry.global_config.performance.get("max_workers", 4)
+        batch_size = max(1, len(tasks) // (max_workers * 4))
+        batches = [
+            tasks[start : start + batch_size]
+            for start in range(0, len(tasks), batch_size)
+        ]
+
+        results: List[FileScanResult] = []
+        if executor_name == "process":
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self, checks_by_name),
+            ) as executor:
+                for records in executor.map(_scan_batch_in_worker, batches):
+                    results.extend(FileScanResult.from_record(r) for r in records)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for batch_results in executor.map(
+                    lambda batch: self._scan_batch(batch, checks_by_name), batches
+                ):
+                    results.extend(batch_results)
+
+        return results
+
+    def _scan_batch(
+        self, batch: List[ScanTask], checks_by_name: Dict[str, DefinitionCheck]
+    ) -> List[FileScanResult]:
+        """Scan a batch of files."""
+        return [
+            self._scan_file(
+                file_path, [checks_by_name[name] for name in names], cache_entry
+            )
+            for file_path, names, cache_entry in batch
+        ]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave out state that worker processes do not need."""
+        state = self.__dict__.copy()
+        state["result_cache"] = None
+        state["_inventory"] = None
+        state["ignore_summary"] = IgnoreSummary()
+        return state
+
+    def _load_cached_results(
+        self, entry: Optional[Dict], checks: List[DefinitionCheck]
+    ) -> Optional[FileScanResult]:
+        """Rebuild a file's results from a cache entry if every check is cached."""
+        result = FileScanResult()
+        for name, _definition, source_value, fingerprint in checks:
+            cached = ResultCache.cached_result(entry, name, fingerprint, source_value)
+            if cached is None:
+                return None
+            violations, ignored = cached
+            if violations:
+                result.violations[name] = violations
+            if ignored:
+                result.ignored[name] = ignored
+        return result
+
+    def _store_results(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        result: FileScanResult,
+        checks: List[DefinitionCheck],
+    ) -> None:
+        """Record freshly scanned results of a file in the result cache.
+
+        A file whose content still matched its entry, so that nothing had to
+        be scanned, only gets its stat data refreshed.
+        """
+        cache = self.result_cache
+        if not result.scanned:
+            cache.hits += 1
+            cache.refresh(file_path, stat, result.content_hash)
+            return
+
+        cache.misses += 1
+        for name, _definition, source_value, fingerprint in checks:
+            if name in result.scanned:
+                cache.store(
+                    file_path,
+                    stat,
+                    result.content_hash,
+                    name,
+                    fingerprint,
+                    source_value,
+                    result.violations.get(name, []),
+                    result.ignored.get(name, []),
+                )
 
     def _scan_file(
         self,
-        name: str,
-        definition: RegistryDefinition,
-        source_value: Optional[str],
         file_path: Path,
-    ) -> List[Violation]:
-        """Scan a single file for violations."""
-        violations = []
+        checks: List[DefinitionCheck],
+        cache_entry: Optional[Dict] = None,
+    ) -> FileScanResult:
+        """Read a file once and check it against every applicable definition.
+
+        Definitions whose results are cached for the file's current content
+        are taken from the cache entry instead of being scanned again.
+        """
+        result = FileScanResult()
 
+        if self.config.verbose:
+            print(f"   📄 Scanning {file_path}")
+
+        started = time.perf_counter()
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-
+                result.bytes_read = os.fstat(f.fileno()).st_size
+        except Exception as e:
+            if self.config.debug:
+                print(f"⚠️ Error reading {file_path}: {e}")
+            return result
+
+        result.read = True
+        if self._hash_contents:
+            result.content_hash = hash_content(content)
+        result.read_seconds = time.perf_counter() - started
+        if cache_entry is not None and cache_entry.get("sha256") != result.content_hash:
+            cache_entry = None
+
+        remaining: List[DefinitionCheck] = []
+        for check in checks:
+            name, _definition, source_value, fingerprint = check
+            cached = ResultCache.cached_result(cache_entry, name, fingerprint, source_value)
+            if cached is None:
+                remaining.append(check)
+                continue
+            violations, ignored = cached
+            if violations:
+                result.violations[name] = violations
+            if ignored:
+                result.ignored[name] = ignored
+
+        if not remaining:
+            return result
+
+        result.scanned = [name for name, _, _, _ in remaining]
+
+        started = time.perf_counter()
+        try:
             # Parse ignore directives from the file
             ignore_parser = IgnoreParser(debug=self.config.debug)
             ignore_context = ignore_parser.parse_file_for_ignores(
@@ -216,10 +659,55 @@ class SourceTruthChecker:
                 for error in block_errors:
                     print(f"⚠️ {file_path}: {error}")
 
-            # Get potential violations (before filtering by ignores)
-            potential_violations = self._get_violations_for_file(
-                name, definition, source_value, file_path, content
-            )
+        except Exception as e:
+            if self.config.debug:
+                print(f"⚠️ Error reading {file_path}: {e}")
+            result.scanned = []
+            return result
+        result.ignore_seconds = time.perf_counter() - started
+
+        # Nothing to check when no definition's pattern occurs in the file
+        started = time.perf_counter()
+        could_match = self._matcher is None or self._matcher.could_match(content)
+        result.match_seconds = time.perf_counter() - started
+        if not could_match:
+            return result
+
+        line_index = LineIndex(content)
+
+        for name, definition, source_value, _fingerprint in remaining:
+            started = time.perf_counter()
+            try:
+                matches = self._definition_matches(
+                    name, definition, source_value, content
+                )
+
+                # Get potential violations (before filtering by ignores)
+                potential_violations = self._get_violations_for_file(
+                    name,
+                    definition,
+                    source_value,
+                    file_path,
+                    content,
+                    line_index,
+                    matches,
+                )
+            except Exception as e:
+                if self.config.debug:
+                    print(f"⚠️ Error scanning {file_path} for {name}: {e}")
+                continue
+            finally:
+                elapsed = time.perf_counter() - started
+                result.definition_seconds[name] = elapsed
+                result.match_seconds += elapsed
+
+            pattern_matches: Dict[str, int] = {}
+            for pattern, _match in matches:
+                pattern_matches[pattern] = pattern_matches.get(pattern, 0) + 1
+            if pattern_matches:
+                result.pattern_matches[name] = pattern_matches
+
+            started = time.perf_counter()
 
             # Filter out ignored violations
             for violation in potential_violations:
@@ -229,23 +717,23 @@ class SourceTruthChecker:
 
                 if is_ignored:
                     # Track ignored violation
-                    self.ignore_summary.add_ignored_violation(
-                        violation,
-                        reason or "Unknown reason",
-                        "block" if reason else "file",
+                    result.ignored.setdefault(name, []).append(
+                        IgnoredViolation(
+                            violation=violation,
+                            reason=reason or "Unknown reason",
+                            ignore_type="block" if reason else "file",
+                        )
                     )
                     if self.config.debug:
                         print(
                             f"  🚫 Ignored violation at {file_path}:{violation.line_number} - {reason}"
                         )
                 else:
-                    violations.append(violation)
+                    result.violations.setdefault(name, []).append(violation)
 
-        except Exception as e:
-            if self.config.debug:
-                print(f"⚠️ Error reading {file_path}: {e}")
+            result.ignore_seconds += time.perf_counter() - started
 
-        return violations
+        return result
 
     def _get_violations_for_file(
         self,
@@ -254,32 +742,37 @@ class SourceTruthChecker:
         source_value: Optional[str],
         file_path: Path,
         content: str,
+        line_index: Optional[LineIndex] = None,
+        matches: Optional[List[Tuple[str, re.Match]]] = None,
     ) -> List[Violation]:
         """Get all potential violations for a file (before applying ignores)."""
         violations: List[Violation] = []
+        line_index = line_index or LineIndex(content)
 
         # Check different types of violations based on definition type
         if definition.type == "exact_version":
             violations.extend(
                 self._check_exact_version(
-                    name, definition, source_value, file_path, content
+                    name, definition, source_value, file_path, content, line_index, matches
                 )
             )
         elif definition.type == "file_existence_and_workflow":
             violations.extend(
                 self._check_file_existence_and_workflow(
-                    name, definition, file_path, content
+                    name, definition, file_path, content, line_index, matches
                 )
             )
         elif definition.type == "minimum_version":
             violations.extend(
                 self._check_minimum_version(
-                    name, definition, source_value, file_path, content
+                    name, definition, source_value, file_path, content, line_index, matches
                 )
             )
         else:
             violations.extend(
-                self._check_generic_patterns(name, definition, file_path, content)
+                self._check_generic_patterns(
+                    name, definition, file_path, content, line_index, matches
+                )
             )
 
         return violations
@@ -291,66 +784,76 @@ class SourceTruthChecker:
         source_value: Optional[str],
         file_path: Path,
         content: str,
+        line_index: Optional[LineIndex] = None,
+        matches: Optional[List[Tuple[str, re.Match]]] = None,
     ) -> List[Violation]:
         """Check exact version violations (e.g., Python version)."""
         violations: List[Violation] = []
+        line_index = line_index or LineIndex(content)
 
         if not source_value:
             return violations
 
-        scan_patterns = definition.scan_patterns or []
+        if matches is None:
+            matches = self._find_matches(name, definition, content)
 
-        for pattern in scan_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_number = content[: match.start()].count("\n") + 1
-                matched_text = match.group(0)
+        for _pattern, match in matches:
+            line_number = line_index.line_number(match.start())
+            matched_text = match.group(0)
 
-                # Check if the matched version matches the source
-                if source_value not in matched_text:
-                    suggestion = f"Use '{source_value}' instead of '{matched_text}'"
+            # Check if the matched version matches the source
+            if source_value not in matched_text:
+                suggestion = f"Use '{source_value}' instead of '{matched_text}'"
 
-                    violations.append(
-                        Violation(
-                            definition=name,
-                            file_path=str(file_path),
-                            line_number=line_number,
-                            message=f"Version mismatch: found '{matched_text}', expected '{source_value}'",
-                            severity=definition.severity,
-                            suggestion=suggestion,
-                            context=self._get_line_context(content, line_number),
-                        )
+                violations.append(
+                    Violation(
+                        definition=name,
+                        file_path=str(file_path),
+                        line_number=line_number,
+                        message=f"Version mismatch: found '{matched_text}', expected '{source_value}'",
+                        severity=definition.severity,
+                        suggestion=suggestion,
+                        context=self._get_line_context(line_index, line_number),
                     )
+                )
 
         return violations
 
     def _check_file_existence_and_workflow(
-        self, name: str, definition: RegistryDefinition, file_path: Path, content: str
+        self,
+        name: str,
+        definition: RegistryDefinition,
+        file_path: Path,
+        content: str,
+        line_index: Optional[LineIndex] = None,
+        matches: Optional[List[Tuple[str, re.Match]]] = None,
     ) -> List[Violation]:
         """Check for forbidden files and workflow patterns."""
         violations: List[Violation] = []
+        line_index = line_index or LineIndex(content)
 
         # Check for forbidden file references in content
-        forbidden_patterns = definition.forbidden_patterns or []
+        if matches is None:
+            matches = self._find_matches(name, definition, content)
 
-        for pattern in forbidden_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_number = content[: match.start()].count("\n") + 1
-                matched_text = match.group(0)
+        for _pattern, match in matches:
+            line_number = line_index.line_number(match.start())
+            matched_text = match.group(0)
 
-                # Try to suggest correct pattern
-                suggestion = self._get_workflow_suggestion(matched_text, definition)
+            # Try to suggest correct pattern
+            suggestion = self._get_workflow_suggestion(matched_text, definition)
 
-                violations.append(
-                    Violation(
-                        definition=name,
-                        file_path=str(file_path),
-                        line_number=line_number,
-                        message=f"Forbidden pattern: '{matched_text}'",
-                        severity=definition.severity,
-                        suggestion=suggestion,
-                        context=self._get_line_context(content, line_number),
-                    )
+            violations.append(
+                Violation(
+                    definition=name,
+                    file_path=str(file_path),
+                    line_number=line_number,
+                    message=f"Forbidden pattern: '{matched_text}'",
+                    severity=definition.severity,
+                    suggestion=suggestion,
+                    context=self._get_line_context(line_index, line_number),
                 )
+            )
 
         return violations
 
@@ -361,77 +864,127 @@ class SourceTruthChecker:
         source_value: Optional[str],
         file_path: Path,
         content: str,
+        line_index: Optional[LineIndex] = None,
+        matches: Optional[List[Tuple[str, re.Match]]] = None,
     ) -> List[Violation]:
         """Check minimum version requirements."""
         # This would implement version comparison logic
         # For now, treat as generic pattern matching
-        return self._check_generic_patterns(name, definition, file_path, content)
+        return self._check_generic_patterns(
+            name, definition, file_path, content, line_index, matches
+        )
 
     def _check_generic_patterns(
-        self, name: str, definition: RegistryDefinition, file_path: Path, content: str
+        self,
+        name: str,
+        definition: RegistryDefinition,
+        file_path: Path,
+        content: str,
+        line_index: Optional[LineIndex] = None,
+        matches: Optional[List[Tuple[str, re.Match]]] = None,
     ) -> List[Violation]:
         """Check generic forbidden patterns."""
         violations: List[Violation] = []
+        line_index = line_index or LineIndex(content)
 
-        forbidden_patterns = definition.forbidden_patterns or []
+        if matches is None:
+            matches = self._find_matches(name, definition, content)
 
-        for pattern in forbidden_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                line_number = content[: match.start()].count("\n") + 1
-                matched_text = match.group(0)
+        for _pattern, match in matches:
+            line_number = line_index.line_number(match.start())
+            matched_text = match.group(0)
 
-                violations.append(
-                    Violation(
-                        definition=name,
-                        file_path=str(file_path),
-                        line_number=line_number,
-                        message=f"Forbidden pattern found: '{matched_text}'",
-                        severity=definition.severity,
-                        context=self._get_line_context(content, line_number),
-                    )
+            violations.append(
+                Violation(
+                    definition=name,
+                    file_path=str(file_path),
+                    line_number=line_number,
+                    message=f"Forbidden pattern found: '{matched_text}'",
+                    severity=definition.severity,
+                    context=self._get_line_context(line_index, line_number),
                 )
+            )
 
         return violations
 
-    def _get_files_to_scan(self, definition: RegistryDefinition) -> List[Path]:
-        """Get list of files to scan based on definition configuration."""
-        scan_file_types = (
-            definition.scan_file_types or self.registry.global_config.default_scan_types
-        )
-        excluded_dirs = set(
-            self.registry.global_config.global_exclusions.get("directories", [])
-        )
-        excluded_patterns = set(
-            self.registry.global_config.global_exclusions.get("file_patterns", [])
+    def _definition_matches(
+        self,
+        name: str,
+        definition: RegistryDefinition,
+        source_value: Optional[str],
+        content: str,
+    ) -> List[Tuple[str, re.Match]]:
+        """Find the matches a definition's check will use."""
+        if definition.type == "exact_version" and not source_value:
+            # Exact versions cannot be compared without a source value
+            return []
+        return self._find_matches(name, definition, content)
+
+    def _find_matches(
+        self, name: str, definition: RegistryDefinition, content: str
+    ) -> List[Tuple[str, re.Match]]:
+        """Find all matches of a definition's content patterns."""
+        matcher = self._matcher
+        if matcher is None or name not in matcher:
+            matcher = PatternMatcher({name: definition_patterns(definition)})
+        return matcher.matches_for(name, content)
+
+    def _build_inventory(
+        self,
+        files: Optional[Iterable[Path]] = None,
+        definitions: Optional[Dict[str, RegistryDefinition]] = None,
+    ) -> FileInventory:
+        """Create the file inventory for the repository using global exclusions.
+
+        Args:
+            files: Optional paths to inventory instead of walking the repository
+            definitions: Definitions whose source files force a full scan
+                when they are among the given paths
+        """
+        global_config = self.registry.global_config
+        max_size = global_config.performance.get("max_file_size_mb", 10) * 1024 * 1024
+
+        if files is not None:
+            files = list(files)
+            if self._requires_full_scan(files, definitions or {}):
+                if self.config.debug:
+                    print("🔁 Registry or source of truth changed, scanning everything")
+                files = None
+
+        return FileInventory(
+            self.repository_root,
+            excluded_dirs=global_config.global_exclusions.get("directories", []),
+            excluded_patterns=global_config.global_exclusions.get("file_patterns", []),
+            max_file_size=max_size,
+            paths=files,
         )
 
-        files_to_scan = []
+    def _requires_full_scan(
+        self, files: List[Path], definitions: Dict[str, RegistryDefinition]
+    ) -> bool:
+        """Check whether the given paths include the registry or a source file."""
+        changed = {Path(os.path.abspath(path)) for path in files}
 
-        for pattern in scan_file_types:
-            # Convert glob pattern to pathlib glob
-            for file_path in self.repository_root.rglob(pattern):
-                # Skip if in excluded directory
-                if any(
-                    excluded_dir in file_path.parts for excluded_dir in excluded_dirs
-                ):
-                    continue
+        trigger_paths = [self.registry.registry_path]
+        for name, definition in definitions.items():
+            source_path = self.registry.get_source_path(name)
+            if source_path is not None:
+                trigger_paths.append(source_path)
+            if definition.source and not Path(definition.source).is_absolute():
+                trigger_paths.append(self.repository_root / definition.source)
 
-                # Skip if matches excluded pattern
-                if any(file_path.match(ex_pattern) for ex_pattern in excluded_patterns):
-                    continue
+        return any(Path(os.path.abspath(path)) in changed for path in trigger_paths)
 
-                # Skip if too large
-                max_size = (
-                    self.registry.global_config.performance.get("max_file_size_mb", 10)
-                    * 1024
-                    * 1024
-                )
-                if file_path.stat().st_size > max_size:
-                    continue
+    def _get_files_to_scan(self, definition: RegistryDefinition) -> List[Path]:
+        """Get list of files to scan based on definition configuration."""
+        scan_file_types = (
+            definition.scan_file_types or self.registry.global_config.default_scan_types
+        )
 
-                files_to_scan.append(file_path)
+        if self._inventory is None:
+            self._inventory = self._build_inventory()
 
-        return files_to_scan
+        return list(self._inventory.files_matching(scan_file_types))
 
     def _get_workflow_suggestion(
         self, matched_text: str, definition: RegistryDefinition
@@ -449,10 +1002,10 @@ class SourceTruthChecker:
         return None
 
     def _get_line_context(
-        self, content: str, line_number: int, context_lines: int = 2
+        self, line_index: LineIndex, line_number: int, context_lines: int = 2
     ) -> str:
         """Get surrounding lines for context."""
-        lines = content.splitlines()
+        lines = line_index.lines
         start = max(0, line_number - context_lines - 1)
         end = min(len(lines), line_number + context_lines)
 
@@ -472,13 +1025,14 @@ class SourceTruthChecker:
         low_count = len([v for v in violations if v.severity == Severity.LOW])
 
         return ScanStats(
-            files_scanned=0,  # TODO: Track this properly
+            files_scanned=self._files_scanned,
             violations_found=len(violations),
             high_severity_count=high_count,
             medium_severity_count=medium_count,
             low_severity_count=low_count,
             scan_duration_seconds=end_time - start_time,
             timestamp=datetime.now().isoformat(),
+            metrics=self.metrics,
         )
 
     def check_forbidden_files(self) -> List[Violation]:
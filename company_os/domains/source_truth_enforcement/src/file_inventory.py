@@ -0,0 +1,168 @@
+"""
+Source Truth Enforcement Service - File Inventory
+
+This module walks the repository once and answers file pattern queries for all
+registry definitions from the resulting inventory.
+"""
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _has_glob_chars(pattern: str) -> bool:
+    """Check whether a pattern contains shell-style wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+class FileInventory:
+    """Inventory of scannable repository files built from a single pruned walk.
+
+    Excluded directories are pruned while walking, so they are never descended
+    into. Matching files for each scan pattern are computed once and shared by
+    every definition that uses the pattern.
+
+    When explicit paths are given, the inventory is built from those paths
+    instead of walking the repository, applying the same exclusions.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        excluded_dirs: Iterable[str] = (),
+        excluded_patterns: Iterable[str] = (),
+        max_file_size: Optional[int] = None,
+        paths: Optional[Iterable[Path]] = None,
+    ):
+        """Initialize the inventory.
+
+        Args:
+            root: Repository root to walk
+            excluded_dirs: Directory names to prune (may contain wildcards)
+            excluded_patterns: File patterns to leave out of the inventory
+            max_file_size: Files larger than this many bytes are left out
+            paths: Optional files to inventory instead of walking the root
+        """
+        self.root = Path(root)
+        excluded_dirs = list(excluded_dirs)
+        self._excluded_dir_names = {d for d in excluded_dirs if not _has_glob_chars(d)}
+        self._excluded_dir_globs = [d for d in excluded_dirs if _has_glob_chars(d)]
+        self._excluded_patterns = list(excluded_patterns)
+        self.max_file_size = max_file_size
+        self._paths = list(paths) if paths is not None else None
+
+        self._files: Optional[List[Path]] = None
+        self._files_by_pattern: Dict[str, List[Path]] = {}
+        self._files_by_patterns: Dict[Tuple[str, ...], List[Path]] = {}
+
+    @property
+    def files(self) -> List[Path]:
+        """All scannable files, in walk order."""
+        if self._files is None:
+            if self._paths is not None:
+                self._files = self._collect(self._paths)
+            else:
+                self._files = self._walk()
+        return self._files
+
+    def files_matching(self, patterns: Iterable[str]) -> List[Path]:
+        """Get the files matching any of the given scan patterns.
+
+        Files are grouped by pattern in the order the patterns are given,
+        mirroring one recursive glob per pattern.
+
+        Args:
+            patterns: File patterns such as ``*.md``
+
+        Returns:
+            List of matching file paths
+        """
+        key = tuple(patterns)
+        if key not in self._files_by_patterns:
+            matched: List[Path] = []
+            for pattern in key:
+                matched.extend(self._match_pattern(pattern))
+            self._files_by_patterns[key] = matched
+        return self._files_by_patterns[key]
+
+    def _match_pattern(self, pattern: str) -> List[Path]:
+        """Get the files matching a single scan pattern."""
+        if pattern not in self._files_by_pattern:
+            if "/" in pattern:
+                matched = [path for path in self.files if path.match(pattern)]
+            else:
+                matched = [path for path in self.files if fnmatchcase(path.name, pattern)]
+            self._files_by_pattern[pattern] = matched
+        return self._files_by_pattern[pattern]
+
+    def _is_excluded_dir(self, name: str) -> bool:
+        """Check whether a directory name is excluded."""
+        if name in self._excluded_dir_names:
+            return True
+        return any(fnmatchcase(name, pattern) for pattern in self._excluded_dir_globs)
+
+    def _is_excluded_file(self, path: Path) -> bool:
+        """Check whether a file is excluded by name or pattern."""
+        if self._is_excluded_dir(path.name):
+            return True
+        return any(PurePath.match(path, pattern) for pattern in self._excluded_patterns)
+
+    def _walk(self) -> List[Path]:
+        """Walk the repository once, pruning excluded directories."""
+        files: List[Path] = []
+
+        if self._is_excluded_root():
+            return files
+
+        for dirpath, dirnames, filenames in os.walk(self.root, followlinks=False):
+            dirnames[:] = sorted(d for d in dirnames if not self._is_excluded_dir(d))
+            directory = Path(dirpath)
+
+            for filename in sorted(filenames):
+                file_path = directory / filename
+                if self._is_excluded_file(file_path):
+                    continue
+
+                if self._is_within_size_limit(file_path):
+                    files.append(file_path)
+
+        return files
+
+    def _collect(self, paths: Iterable[Path]) -> List[Path]:
+        """Inventory explicit paths, keeping only files inside the root."""
+        files: List[Path] = []
+        root = os.path.abspath(self.root)
+        seen = set()
+
+        for path in paths:
+            relative = os.path.relpath(os.path.abspath(path), root)
+            if relative in (os.curdir, os.pardir) or relative.startswith(os.pardir + os.sep):
+                continue
+            if relative in seen:
+                continue
+            seen.add(relative)
+
+            # Express paths the same way the walk does
+            file_path = self.root / relative
+            if any(self._is_excluded_dir(part) for part in Path(relative).parts[:-1]):
+                continue
+            if self._is_excluded_file(file_path) or not file_path.is_file():
+                continue
+
+            if self._is_within_size_limit(file_path):
+                files.append(file_path)
+
+        return files
+
+    def _is_within_size_limit(self, file_path: Path) -> bool:
+        """Check that a file can be stat'ed and is not larger than the limit."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return self.max_file_size is None or stat.st_size <= self.max_file_size
+
+    def _is_excluded_root(self) -> bool:
+        """Check whether the walk root itself lies inside an excluded directory."""
+        return any(self._is_excluded_dir(part) for part in self.root.parts)
@@ -4,11 +4,17 @@ Source Truth Enforcement Service - Ignore Parser
 This module handles parsing of ESLint-style ignore comments for suppressing violations.
 """
 
+import heapq
 import re
-from typing import Dict, List, Tuple, Optional, Set
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from .models import IgnoreDirective, IgnoreContext
 
 
+# Token shared by every ignore directive, used to skip lines without one
+IGNORE_TOKEN = "source-truth-ignore"
+
+
 class IgnoreRange:
     """Represents a range of lines to ignore."""
 
@@ -22,6 +28,72 @@ class IgnoreRange:
         return self.start_line < line_number < self.end_line
 
 
+class IgnoreIntervals:
+    """Sorted, disjoint line intervals ignored for one rule.
+
+    Overlapping ignores are flattened into disjoint intervals, each carrying
+    the reason of the highest-priority ignore covering it, and adjacent
+    intervals with the same reason are merged. Lookups bisect the interval
+    starts, so checking a line costs O(log n) regardless of how many ignore
+    blocks the file has.
+    """
+
+    def __init__(self, ranges: List[Tuple[int, int, str]]):
+        """Build the intervals.
+
+        Args:
+            ranges: Inclusive (first_line, last_line, reason) ranges in
+                priority order; earlier ranges win where they overlap
+        """
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.reasons: List[str] = []
+
+        events = sorted(
+            (first, priority)
+            for priority, (first, last, _) in enumerate(ranges)
+            if first <= last
+        )
+        boundaries = sorted(
+            {first for first, last, _ in ranges if first <= last}
+            | {last + 1 for first, last, _ in ranges if first <= last}
+        )
+
+        active: List[Tuple[int, int]] = []  # heap of (priority, last_line)
+        next_event = 0
+        for position, start in enumerate(boundaries[:-1]):
+            end = boundaries[position + 1] - 1
+
+            while next_event < len(events) and events[next_event][0] <= start:
+                priority = events[next_event][1]
+                heapq.heappush(active, (priority, ranges[priority][1]))
+                next_event += 1
+            while active and active[0][1] < start:
+                heapq.heappop(active)
+
+            if active:
+                self._append(start, end, ranges[active[0][0]][2])
+
+    def _append(self, start: int, end: int, reason: str) -> None:
+        """Add an interval after the existing ones, merging when contiguous."""
+        if self.ends and self.ends[-1] + 1 == start and self.reasons[-1] == reason:
+            self.ends[-1] = end
+        else:
+            self.starts.append(start)
+            self.ends.append(end)
+            self.reasons.append(reason)
+
+    def find(self, line_number: int) -> Optional[str]:
+        """Get the reason a line is ignored, or None if it is not."""
+        index = bisect_right(self.starts, line_number) - 1
+        if index >= 0 and line_number <= self.ends[index]:
+            return self.reasons[index]
+        return None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
 class IgnoreParser:
     """Parses source-truth-ignore comments."""
 
@@ -43,6 +115,32 @@ class IgnoreParser:
         r"<!--\s*source-truth-ignore-file\s+(\S+)\s+--\s+(.+)\s*-->"
     )
 
+    # Directive patterns in priority order: the first one found in a line wins
+    DIRECTIVE_PATTERNS = [
+        (IGNORE_NEXT_LINE_PATTERN, "next-line"),
+        (IGNORE_START_PATTERN, "start"),
+        (IGNORE_END_PATTERN, "end"),
+        (IGNORE_FILE_PATTERN, "file"),
+        (HTML_IGNORE_NEXT_LINE_PATTERN, "next-line"),
+        (HTML_IGNORE_START_PATTERN, "start"),
+        (HTML_IGNORE_END_PATTERN, "end"),
+        (HTML_IGNORE_FILE_PATTERN, "file"),
+    ]
+
+    # All directive patterns as one regex. Each alternative is tried in
+    # priority order and searches the whole line, so a match is identical to
+    # trying the patterns one by one with re.search.
+    _DIRECTIVE_REGEX = re.compile(
+        "^(?:"
+        + "|".join(
+            f".*?(?P<d{index}>{pattern})"
+            for index, (pattern, _) in enumerate(DIRECTIVE_PATTERNS)
+        )
+        + ")",
+        re.IGNORECASE,
+    )
+    _TOKEN_REGEX = re.compile(re.escape(IGNORE_TOKEN), re.IGNORECASE)
+
     def __init__(self, debug: bool = False):
         """Initialize the ignore parser.
 
@@ -64,18 +162,15 @@ class IgnoreParser:
             IgnoreContext with all parsed ignore directives
         """
         context = IgnoreContext()
-        lines = content.splitlines()
 
         # First pass: collect all directives
         all_directives = []
-        for line_number, line in enumerate(lines, 1):
-            directive = self._parse_line_for_ignore(line, line_number)
-            if directive:
-                all_directives.append(directive)
-                if self.debug:
-                    print(
-                        f"  📝 {file_path}:{directive.line_number} - Found {directive.type} ignore for {directive.rule_name}: {directive.reason}"
-                    )
+        for directive in self._iter_directives(content):
+            all_directives.append(directive)
+            if self.debug:
+                print(
+                    f"  📝 {file_path}:{directive.line_number} - Found {directive.type} ignore for {directive.rule_name}: {directive.reason}"
+                )
 
         # Second pass: build complete ignore ranges
         ignore_ranges: Dict[
@@ -90,7 +185,9 @@ class IgnoreParser:
                 context.file_ignores[directive.rule_name] = directive.reason
 
             elif directive.type == "next-line":
-                context.next_line_ignores[directive.rule_name] = directive.reason
+                context.next_line_ignores.setdefault(directive.rule_name, {})[
+                    directive.line_number + 1
+                ] = directive.reason
 
             elif directive.type == "start":
                 if directive.rule_name in active_starts:
@@ -126,6 +223,12 @@ class IgnoreParser:
         # Store completed ranges in context
         context.ignore_ranges = ignore_ranges
 
+        # Index next-line and block ignores for fast lookups
+        for rule_name in set(context.next_line_ignores) | set(ignore_ranges):
+            context.ignore_intervals[rule_name] = self._build_intervals(
+                rule_name, context
+            )
+
         # Store any unclosed blocks as well (for validation)
         context.block_ignores = active_starts
 
@@ -143,60 +246,46 @@ class IgnoreParser:
         Returns:
             IgnoreDirective if found, None otherwise
         """
-        line = line.strip()
-
-        # Try hash comment patterns first
-        patterns = [
-            (self.IGNORE_NEXT_LINE_PATTERN, "next-line"),
-            (self.IGNORE_START_PATTERN, "start"),
-            (self.IGNORE_END_PATTERN, "end"),
-            (self.IGNORE_FILE_PATTERN, "file"),
-        ]
-
-        for pattern, directive_type in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                if directive_type == "end":
-                    # End directive doesn't have a reason
-                    rule_name = match.group(1)
-                    reason = ""
-                else:
-                    rule_name = match.group(1)
-                    reason = match.group(2).strip()
-
-                return IgnoreDirective(
-                    type=directive_type,
-                    rule_name=rule_name,
-                    reason=reason,
-                    line_number=line_number,
-                )
-
-        # Try HTML comment patterns for markdown/html files
-        html_patterns = [
-            (self.HTML_IGNORE_NEXT_LINE_PATTERN, "next-line"),
-            (self.HTML_IGNORE_START_PATTERN, "start"),
-            (self.HTML_IGNORE_END_PATTERN, "end"),
-            (self.HTML_IGNORE_FILE_PATTERN, "file"),
-        ]
+        match = self._DIRECTIVE_REGEX.match(line.strip())
+        if not match:
+            return None
+
+        # The alternative that matched, and the position of its own groups
+        group_name = match.lastgroup
+        index = int(group_name[1:])
+        group = self._DIRECTIVE_REGEX.groupindex[group_name]
+        directive_type = self.DIRECTIVE_PATTERNS[index][1]
+
+        rule_name = match.group(group + 1)
+        if directive_type == "end":
+            # End directive doesn't have a reason
+            reason = ""
+        else:
+            reason = match.group(group + 2).strip()
+
+        return IgnoreDirective(
+            type=directive_type,
+            rule_name=rule_name,
+            reason=reason,
+            line_number=line_number,
+        )
+
+    def _iter_directives(self, content: str) -> Iterator[IgnoreDirective]:
+        """Yield the ignore directives in file content.
+
+        Content without the ignore token is skipped with a single search, and
+        only lines containing the token are matched against the directive
+        patterns.
+        """
+        if not self._TOKEN_REGEX.search(content):
+            return
 
-        for pattern, directive_type in html_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                if directive_type == "end":
-                    rule_name = match.group(1)
-                    reason = ""
-                else:
-                    rule_name = match.group(1)
-                    reason = match.group(2).strip()
-
-                return IgnoreDirective(
-                    type=directive_type,
-                    rule_name=rule_name,
-                    reason=reason,
-                    line_number=line_number,
-                )
-
-        return None
+        # Lines end at "\n" only, numbered like the checker's violations
+        for line_number, line in enumerate(content.split("\n"), 1):
+            if self._TOKEN_REGEX.search(line):
+                directive = self._parse_line_for_ignore(line, line_number)
+                if directive:
+                    yield directive
 
     def _apply_directive(
         self, directive: IgnoreDirective, context: IgnoreContext, file_path: str
@@ -217,7 +306,10 @@ class IgnoreParser:
             context.file_ignores[directive.rule_name] = directive.reason
 
         elif directive.type == "next-line":
-            context.next_line_ignores[directive.rule_name] = directive.reason
+            context.next_line_ignores.setdefault(directive.rule_name, {})[
+                directive.line_number + 1
+            ] = directive.reason
+            context.ignore_intervals.pop(directive.rule_name, None)
 
         elif directive.type == "start":
             if directive.rule_name in context.block_ignores:
@@ -255,21 +347,41 @@ class IgnoreParser:
         if rule_name in context.file_ignores:
             return True, context.file_ignores[rule_name]
 
-        # Check next-line ignores (for the previous line)
-        if rule_name in context.next_line_ignores:
-            reason = context.next_line_ignores[rule_name]
-            # Clear the next-line ignore after using it
-            del context.next_line_ignores[rule_name]
+        # Check next-line and block ignores
+        intervals = context.ignore_intervals.get(rule_name)
+        if intervals is None:
+            if (
+                rule_name not in context.next_line_ignores
+                and rule_name not in context.ignore_ranges
+            ):
+                return False, None
+            intervals = self._build_intervals(rule_name, context)
+            context.ignore_intervals[rule_name] = intervals
+
+        reason = intervals.find(line_number)
+        if reason is not None:
             return True, reason
 
-        # Check ignore ranges
-        if hasattr(context, "ignore_ranges") and rule_name in context.ignore_ranges:
-            for ignore_range in context.ignore_ranges[rule_name]:
-                if ignore_range.contains(line_number):
-                    return True, ignore_range.reason
-
         return False, None
 
+    def _build_intervals(self, rule_name: str, context: IgnoreContext) -> IgnoreIntervals:
+        """Index a rule's next-line and block ignores.
+
+        Next-line ignores take precedence over blocks, and earlier blocks
+        over later ones, matching the order in which ignores are reported.
+        """
+        ranges: List[Tuple[int, int, str]] = [
+            (line_number, line_number, reason)
+            for line_number, reason in sorted(
+                context.next_line_ignores.get(rule_name, {}).items()
+            )
+        ]
+        ranges.extend(
+            (ignore_range.start_line + 1, ignore_range.end_line - 1, ignore_range.reason)
+            for ignore_range in context.ignore_ranges.get(rule_name, [])
+        )
+        return IgnoreIntervals(ranges)
+
     def validate_ignore_blocks(
         self, context: IgnoreContext, file_path: str = ""
     ) -> List[str]:
@@ -328,12 +440,4 @@ class IgnoreParser:
         Returns:
             List of all ignore directives found
         """
-        directives = []
-        lines = content.splitlines()
-
-        for line_number, line in enumerate(lines, 1):
-            directive = self._parse_line_for_ignore(line, line_number)
-            if directive:
-                directives.append(directive)
-
-        return directives
+        return list(self._iter_directives(content))
@@ -37,10 +37,57 @@ class Violation(BaseModel):
         return f"{self.severity.upper()}: {self.file_path}:{self.line_number} - {self.message}"
 
 
+class DefinitionMetrics(BaseModel):
+    """Scan metrics for a single source of truth definition."""
+
+    files_scanned: int = Field(0, description="Files checked against the definition")
+    files_matched: int = Field(0, description="Files with at least one pattern match")
+    matches: int = Field(0, description="Total pattern matches")
+    violations: int = Field(0, description="Violations reported")
+    ignored: int = Field(0, description="Violations suppressed by ignore comments")
+    match_seconds: float = Field(
+        0.0, description="Time spent matching and building violations"
+    )
+    matches_by_pattern: Dict[str, int] = Field(
+        default_factory=dict, description="Match count per pattern"
+    )
+
+
+class FileTiming(BaseModel):
+    """Time spent scanning a single file."""
+
+    file_path: str = Field(..., description="Path to the file")
+    seconds: float = Field(..., description="Time spent reading and checking the file")
+    bytes_read: int = Field(0, description="Size of the file content in bytes")
+
+
+class ScanMetrics(BaseModel):
+    """Per-phase and per-definition metrics of a consistency scan."""
+
+    files_enumerated: int = Field(0, description="Files found by the repository walk")
+    files_read: int = Field(0, description="Files read from disk")
+    files_cached: int = Field(0, description="Files answered from the result cache")
+    bytes_read: int = Field(0, description="Bytes of file content read")
+    walk_seconds: float = Field(0.0, description="Time spent enumerating files")
+    read_seconds: float = Field(0.0, description="Time spent reading files")
+    match_seconds: float = Field(0.0, description="Time spent matching patterns")
+    ignore_seconds: float = Field(
+        0.0, description="Time spent parsing and applying ignore comments"
+    )
+    definitions: Dict[str, DefinitionMetrics] = Field(
+        default_factory=dict, description="Metrics per definition"
+    )
+    slowest_files: List[FileTiming] = Field(
+        default_factory=list, description="Files that took the longest to scan"
+    )
+
+
 class ScanStats(BaseModel):
     """Statistics from a consistency scan."""
 
-    files_scanned: int = Field(0, description="Number of files scanned")
+    files_scanned: int = Field(
+        0, description="Number of files checked, including those answered from the result cache"
+    )
     violations_found: int = Field(0, description="Total number of violations found")
     high_severity_count: int = Field(
         0, description="Number of high severity violations"
@@ -53,6 +100,9 @@ class ScanStats(BaseModel):
         0.0, description="Duration of the scan in seconds"
     )
     timestamp: str = Field(..., description="ISO timestamp when the scan was performed")
+    metrics: Optional[ScanMetrics] = Field(
+        None, description="Detailed per-phase and per-definition metrics"
+    )
 
 
 class Report(BaseModel):
@@ -141,7 +191,14 @@ class CheckerConfig(BaseModel):
     verbose: bool = Field(False, description="Enable verbose output")
     debug: bool = Field(False, description="Enable debug output")
     parallel: bool = Field(True, description="Enable parallel processing")
+    executor: str = Field(
+        "thread", description="Executor for parallel scans: thread, process or serial"
+    )
     cache_enabled: bool = Field(True, description="Enable result caching")
+    cache_path: Optional[str] = Field(
+        None,
+        description="Path of the result cache (defaults to .cache/ under the repository root)",
+    )
 
 
 class IgnoreDirective(BaseModel):
@@ -162,12 +219,15 @@ class IgnoreContext(BaseModel):
     block_ignores: Dict[str, Tuple[int, str]] = Field(
         default_factory=dict, description="rule -> (start_line, reason)"
     )
-    next_line_ignores: Dict[str, str] = Field(
-        default_factory=dict, description="rule -> reason"
+    next_line_ignores: Dict[str, Dict[int, str]] = Field(
+        default_factory=dict, description="rule -> {ignored line: reason}"
     )
     ignore_ranges: Dict[str, List[Any]] = Field(
         default_factory=dict, description="rule -> List[IgnoreRange]"
     )
+    ignore_intervals: Dict[str, Any] = Field(
+        default_factory=dict, description="rule -> IgnoreIntervals for lookups"
+    )
 
 
 class IgnoredViolation(BaseModel):
@@ -0,0 +1,113 @@
+"""
+Source Truth Enforcement Service - Pattern Matcher
+
+This module compiles the scan and forbidden patterns of all registry definitions
+once and matches them against file content.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+from .models import RegistryDefinition
+
+
+# Backreferences depend on group numbering and cannot be combined safely
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# A compiled pattern, or the error raised while compiling it
+CompiledPattern = Union[Pattern[str], re.error]
+
+
+def definition_patterns(definition: RegistryDefinition) -> List[str]:
+    """Get the patterns a definition searches file content for."""
+    if definition.type == "exact_version":
+        return definition.scan_patterns or []
+    return definition.forbidden_patterns or []
+
+
+class PatternMatcher:
+    """Matches the patterns of many definitions against file content.
+
+    Every pattern is compiled once. All valid patterns are also combined into
+    a single alternation used as a prefilter: when it finds nothing in a file,
+    no individual pattern can match, so the file costs one pass no matter how
+    many definitions the registry holds. Files that pass the prefilter are
+    confirmed with the individual patterns, which preserves overlapping
+    matches between patterns.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]], flags: int = re.IGNORECASE):
+        """Initialize the matcher.
+
+        Args:
+            patterns: Patterns to match, keyed by definition name
+            flags: Regex flags applied to every pattern
+        """
+        self._compiled: Dict[str, List[Tuple[str, CompiledPattern]]] = {}
+        combinable: List[str] = []
+        has_uncombinable = False
+
+        for name, definition_pattern_list in patterns.items():
+            compiled: List[Tuple[str, CompiledPattern]] = []
+            for pattern in definition_pattern_list:
+                try:
+                    compiled.append((pattern, re.compile(pattern, flags)))
+                except re.error as e:
+                    compiled.append((pattern, e))
+                    continue
+
+                if _BACKREFERENCE.search(pattern):
+                    has_uncombinable = True
+                else:
+                    combinable.append(pattern)
+            self._compiled[name] = compiled
+
+        self._prefilter: Optional[Pattern[str]] = None
+        if combinable and not has_uncombinable:
+            try:
+                self._prefilter = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in combinable), flags
+                )
+            except re.error:
+                self._prefilter = None
+
+    @classmethod
+    def for_definitions(
+        cls, definitions: Dict[str, RegistryDefinition]
+    ) -> "PatternMatcher":
+        """Create a matcher for the content patterns of registry definitions."""
+        return cls(
+            {
+                name: definition_patterns(definition)
+                for name, definition in definitions.items()
+            }
+        )
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether the matcher holds a definition's patterns."""
+        return name in self._compiled
+
+    def could_match(self, content: str) -> bool:
+        """Check whether any pattern might match the content.
+
+        Returns False only when no pattern can match; True means the
+        individual patterns have to be consulted.
+        """
+        if self._prefilter is None:
+            return True
+        return self._prefilter.search(content) is not None
+
+    def matches_for(self, name: str, content: str) -> List[Tuple[str, re.Match]]:
+        """Find all matches of one definition's patterns in the content.
+
+        Matches are returned in pattern order, then in position order.
+
+        Raises:
+            re.error: If one of the definition's patterns is invalid
+        """
+        matches: List[Tuple[str, re.Match]] = []
+        for pattern, compiled in self._compiled.get(name, []):
+            if isinstance(compiled, re.error):
+                raise compiled
+            matches.extend((pattern, match) for match in compiled.finditer(content))
+        return matches
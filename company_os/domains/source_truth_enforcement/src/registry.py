@@ -4,10 +4,45 @@ Source Truth Enforcement Service - Registry Loader
 This module handles loading and parsing the source truth registry file.
 """
 
+import copy
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from .models import RegistryDefinition, RegistryConfig, Severity
+from .pattern_matcher import PatternMatcher
+
+
+# (mtime_ns, size) of a file, used to detect changes without reading it
+FileSignature = Tuple[int, int]
+
+# Raw data, definitions and global config of a parsed registry
+ParsedRegistry = Tuple[Dict[str, Any], Dict[str, RegistryDefinition], RegistryConfig]
+
+# Parsed registries shared by all SourceTruthRegistry instances in the process,
+# keyed by resolved path: (signature, parsed registry). Instances only ever
+# get copies, so changes made through one instance do not leak into others.
+_parsed_registries: Dict[str, Tuple[FileSignature, ParsedRegistry]] = {}
+_parsed_registries_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Optional[FileSignature]:
+    """Get the stat signature of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy_parsed(parsed: ParsedRegistry) -> ParsedRegistry:
+    """Copy a parsed registry so that the copy can be modified safely."""
+    raw_data, definitions, global_config = parsed
+    return (
+        copy.deepcopy(raw_data),
+        {name: definition.model_copy(deep=True) for name, definition in definitions.items()},
+        global_config.model_copy(deep=True),
+    )
 
 
 class SourceTruthRegistry:
@@ -23,9 +58,38 @@ class SourceTruthRegistry:
             registry_path = self._find_default_registry_path()
 
         self.registry_path = Path(registry_path)
-        self.raw_data = self._load_registry()
-        self.definitions = self._parse_definitions()
-        self.global_config = self._parse_global_config()
+        self._signature: Optional[FileSignature] = None
+        self._source_values: Dict[str, Tuple[Path, Optional[FileSignature], Optional[str]]] = {}
+        self._matchers: Dict[Tuple[str, ...], PatternMatcher] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load the registry, reusing a parse of the unchanged file if possible.
+
+        Parsed registries are shared between instances in the same process
+        and keyed by the file's stat signature, so constructing a registry
+        for an unchanged file does not read or parse it again. Each instance
+        works on its own copy of the shared parse.
+        """
+        key = str(self.registry_path.resolve())
+        signature = _file_signature(self.registry_path)
+
+        with _parsed_registries_lock:
+            cached = _parsed_registries.get(key)
+        if signature is not None and cached is not None and cached[0] == signature:
+            self.raw_data, self.definitions, self.global_config = _copy_parsed(cached[1])
+        else:
+            self.raw_data = self._load_registry()
+            self.definitions = self._parse_definitions()
+            self.global_config = self._parse_global_config()
+            if signature is not None:
+                parsed = _copy_parsed((self.raw_data, self.definitions, self.global_config))
+                with _parsed_registries_lock:
+                    _parsed_registries[key] = (signature, parsed)
+
+        self._signature = signature
+        self._source_values.clear()
+        self._matchers.clear()
 
     def _find_default_registry_path(self) -> Path:
         """Find the default registry path, handling both Bazel runfiles and normal execution."""
@@ -131,8 +195,8 @@ class SourceTruthRegistry:
         except Exception as e:
             raise ValueError(f"Registry validation failed: {e}")
 
-    def get_source_value(self, definition_name: str) -> Optional[str]:
-        """Get the source of truth value for a definition."""
+    def get_source_path(self, definition_name: str) -> Optional[Path]:
+        """Get the path of the source of truth file for a definition."""
         definition = self.get_definition(definition_name)
         if not definition or not definition.source:
             return None
@@ -143,6 +207,29 @@ class SourceTruthRegistry:
             repo_root = self.registry_path.parent.parent.parent.parent
             source_path = repo_root / source_path
 
+        return source_path
+
+    def get_source_value(self, definition_name: str) -> Optional[str]:
+        """Get the source of truth value for a definition.
+
+        Values are cached and only read again when the source file's stat
+        signature changes.
+        """
+        source_path = self.get_source_path(definition_name)
+        if source_path is None:
+            return None
+
+        signature = _file_signature(source_path)
+        cached = self._source_values.get(definition_name)
+        if cached is not None and cached[0] == source_path and cached[1] == signature:
+            return cached[2]
+
+        value = self._read_source_value(source_path)
+        self._source_values[definition_name] = (source_path, signature, value)
+        return value
+
+    def _read_source_value(self, source_path: Path) -> Optional[str]:
+        """Read a source of truth value from disk."""
         if not source_path.exists():
             return None
 
@@ -152,8 +239,39 @@ class SourceTruthRegistry:
         except Exception:
             return None
 
-    def reload(self) -> None:
-        """Reload the registry from disk."""
-        self.raw_data = self._load_registry()
-        self.definitions = self._parse_definitions()
-        self.global_config = self._parse_global_config()
+    def get_pattern_matcher(self, names: Optional[Iterable[str]] = None) -> PatternMatcher:
+        """Get a matcher with the compiled content patterns of definitions.
+
+        Matchers are cached per set of definitions until the registry changes.
+
+        Args:
+            names: Definitions to include, defaults to all of them
+        """
+        key = tuple(self.definitions if names is None else names)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = PatternMatcher.for_definitions(
+                {name: self.definitions[name] for name in key if name in self.definitions}
+            )
+            self._matchers[key] = matcher
+        return matcher
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the registry from disk if it changed.
+
+        Args:
+            force: Re-parse even if the file's stat signature is unchanged
+
+        Returns:
+            True if the registry was re-parsed, False if the cached parse was kept
+        """
+        if not force and self._signature is not None:
+            if _file_signature(self.registry_path) == self._signature:
+                return False
+
+        if force:
+            with _parsed_registries_lock:
+                _parsed_registries.pop(str(self.registry_path.resolve()), None)
+
+        self._load()
+        return True
@@ -0,0 +1,200 @@
+"""
+Source Truth Enforcement Service - Result Cache
+
+This module persists per-file scan results between runs so that only files whose
+content or relevant definition changed are scanned again.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import IgnoredViolation, RegistryDefinition, Violation
+
+
+# Bump whenever the checker would produce different results for the same
+# content and definition, so that existing cache entries are discarded.
+RESULT_CACHE_VERSION = 2
+
+# Default location of the cache, relative to the repository root
+DEFAULT_CACHE_PATH = Path(".cache") / "source-truth-results.json"
+
+# Files modified this close to being checked may change again without their
+# mtime moving, so their recorded stat data is not trusted on its own
+RACY_WINDOW_NS = 2_000_000_000
+
+# Violations and ignored violations found for one definition in one file
+CachedResult = Tuple[List[Violation], List[IgnoredViolation]]
+
+
+def hash_content(content: str) -> str:
+    """Hash file content for cache validation."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def definition_fingerprint(definition: RegistryDefinition) -> str:
+    """Hash the configuration of a definition that affects scan results."""
+    payload = json.dumps(definition.model_dump(mode="json"), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Persistent cache of scan results per file and definition.
+
+    Entries are keyed by file path and hold the file's stat data and content
+    hash; the stat data alone only vouches for files that had not been
+    modified shortly before they were checked. Each entry stores, per definition, the definition fingerprint and
+    source of truth value the results were computed with. A result is only
+    reused when the content, the definition and the source value all match.
+    """
+
+    def __init__(self, cache_path: Path, max_age_hours: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_path: Where the cache is stored
+            max_age_hours: Entries checked longer ago than this are discarded
+        """
+        self.cache_path = Path(cache_path)
+        self.max_age_seconds = max_age_hours * 3600 if max_age_hours else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """Load the cache from disk, discarding it if missing or incompatible."""
+        self._entries = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == RESULT_CACHE_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get_entry(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Get the cache entry for a file, unless it has expired."""
+        entry = self._entries.get(str(file_path))
+        if entry is None or self._is_expired(entry):
+            return None
+        return entry
+
+    @staticmethod
+    def matches_stat(entry: Dict[str, Any], stat: os.stat_result) -> bool:
+        """Check whether an entry was recorded for the file's current stat data.
+
+        A file modified within the racy window of its check never matches, so
+        that its content hash is compared instead.
+        """
+        if entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            return False
+        checked_ns = int(entry.get("checked_at", 0) * 1_000_000_000)
+        return stat.st_mtime_ns < checked_ns - RACY_WINDOW_NS
+
+    @staticmethod
+    def cached_result(
+        entry: Optional[Dict[str, Any]],
+        name: str,
+        fingerprint: str,
+        source_value: Optional[str],
+    ) -> Optional[CachedResult]:
+        """Get the stored results of one definition from an entry, if still valid."""
+        if entry is None:
+            return None
+
+        stored = entry.get("definitions", {}).get(name)
+        if (
+            stored is None
+            or stored.get("fingerprint") != fingerprint
+            or stored.get("source_value") != source_value
+        ):
+            return None
+
+        try:
+            violations = [Violation.model_validate(v) for v in stored["violations"]]
+            ignored = [IgnoredViolation.model_validate(i) for i in stored["ignored"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+        return violations, ignored
+
+    def store(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        content_hash: str,
+        name: str,
+        fingerprint: str,
+        source_value: Optional[str],
+        violations: List[Violation],
+        ignored: List[IgnoredViolation],
+    ) -> None:
+        """Record the results of one definition for a file."""
+        key = str(file_path)
+        entry = self._entries.get(key)
+        if entry is None or entry.get("sha256") != content_hash:
+            entry = {"sha256": content_hash, "definitions": {}}
+            self._entries[key] = entry
+
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        entry["checked_at"] = time.time()
+        entry["definitions"][name] = {
+            "fingerprint": fingerprint,
+            "source_value": source_value,
+            "violations": [v.model_dump(mode="json") for v in violations],
+            "ignored": [i.model_dump(mode="json") for i in ignored],
+        }
+        self._dirty = True
+
+    def refresh(self, file_path: Path, stat: os.stat_result, content_hash: str) -> None:
+        """Record new stat data for a file whose content still matches its entry."""
+        entry = self._entries.get(str(file_path))
+        if entry is None or entry.get("sha256") != content_hash:
+            return
+
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        entry["checked_at"] = time.time()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk, dropping expired entries and deleted files."""
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if self._is_expired(entry) or not os.path.exists(key)
+        ]
+        for key in stale:
+            del self._entries[key]
+
+        if not self._dirty and not stale:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": RESULT_CACHE_VERSION, "entries": self._entries}, f)
+            temp_path.replace(self.cache_path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+        self._dirty = False
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is older than the maximum age."""
+        if self.max_age_seconds is None:
+            return False
+        return time.time() - entry.get("checked_at", 0) > self.max_age_seconds
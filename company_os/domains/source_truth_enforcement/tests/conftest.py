@@ -0,0 +1,53 @@
+"""Shared fixtures for the source truth enforcement tests."""
+
+from pathlib import Path
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.models import CheckerConfig
+
+
+REGISTRY = """\
+version: "1.0"
+registry:
+  python_version:
+    description: "Canonical Python version"
+    source: ".python-version"
+    type: "exact_version"
+    severity: "high"
+    scan_patterns:
+      - "Python 3\\\\.\\\\d+(\\\\.\\\\d+)?"
+    scan_file_types:
+      - "*.md"
+global_config:
+  global_exclusions:
+    directories:
+      - ".git"
+      - ".cache"
+  performance:
+    max_workers: 2
+"""
+
+# Sources of truth resolve against the directory four levels above the registry
+REGISTRY_PATH = Path("domains") / "source_truth_enforcement" / "data" / "registry.yaml"
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository with a registry, a source of truth and one stale document."""
+    registry_path = tmp_path / REGISTRY_PATH
+    registry_path.parent.mkdir(parents=True)
+    registry_path.write_text(REGISTRY)
+    (tmp_path / ".python-version").write_text("3.12.0\n")
+    (tmp_path / "README.md").write_text("# Project\n\nRequires Python 3.11.2\n")
+    return tmp_path
+
+
+@pytest.fixture
+def config(repo):
+    """Checker configuration for the test repository."""
+    return CheckerConfig(
+        registry_path=str(repo / REGISTRY_PATH),
+        repository_root=str(repo),
+        cache_path=str(repo / ".cache" / "results.json"),
+    )
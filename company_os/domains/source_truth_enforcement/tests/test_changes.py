@@ -0,0 +1,113 @@
+"""Tests for incremental checks of changed files."""
+
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from company_os.domains.source_truth_enforcement.adapters.cli.source_truth_cli import app
+from company_os.domains.source_truth_enforcement.src.changes import get_changed_files
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+
+from conftest import REGISTRY_PATH
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(repo):
+    """The test repository committed to git."""
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "Dev")
+    (repo / ".gitignore").write_text(".cache/\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+    return repo
+
+
+class TestGetChangedFiles:
+    """Test listing changed files with git."""
+
+    def test_clean_tree_has_no_changes(self, git_repo):
+        """Nothing is reported for a clean working tree."""
+        assert get_changed_files(git_repo, "HEAD") == []
+
+    def test_modified_untracked_and_deleted_files(self, git_repo):
+        """Modified, untracked and deleted files are all reported."""
+        (git_repo / "README.md").write_text("Python 3.12.0\n")
+        (git_repo / "NOTES.md").write_text("Python 3.10.4\n")
+        (git_repo / ".python-version").unlink()
+
+        changed = get_changed_files(git_repo, "HEAD")
+
+        toplevel = git_repo.resolve()
+        assert sorted(changed) == sorted(
+            [toplevel / "README.md", toplevel / "NOTES.md", toplevel / ".python-version"]
+        )
+
+    def test_paths_are_relative_to_toplevel(self, git_repo):
+        """Paths are absolute even when asked from a subdirectory."""
+        (git_repo / "README.md").write_text("Python 3.12.0\n")
+        subdirectory = git_repo / "domains"
+
+        assert get_changed_files(subdirectory, "HEAD") == [git_repo.resolve() / "README.md"]
+
+    def test_unknown_revision(self, git_repo):
+        """An unknown revision is reported as a ValueError."""
+        with pytest.raises(ValueError, match="failed"):
+            get_changed_files(git_repo, "no-such-revision")
+
+
+class TestRequiresFullScan:
+    """Test when an incremental check falls back to a full scan."""
+
+    def test_document_changes_stay_incremental(self, config, repo):
+        """Changing a document only scans that document."""
+        checker = SourceTruthChecker(config)
+        definitions = checker.registry.list_definitions()
+        assert not checker._requires_full_scan([repo / "README.md"], definitions)
+
+    def test_registry_change_requires_full_scan(self, config, repo):
+        """Changing the registry scans every file."""
+        checker = SourceTruthChecker(config)
+        definitions = checker.registry.list_definitions()
+        assert checker._requires_full_scan([repo / REGISTRY_PATH], definitions)
+
+    def test_source_change_requires_full_scan(self, config, repo):
+        """Changing or deleting a source of truth scans every file."""
+        checker = SourceTruthChecker(config)
+        definitions = checker.registry.list_definitions()
+        assert checker._requires_full_scan([repo / ".python-version"], definitions)
+
+    def test_deleted_source_scans_every_file(self, config, git_repo):
+        """A deleted source of truth from git still triggers a full scan."""
+        (git_repo / "NOTES.md").write_text("Python 3.10.4\n")
+        (git_repo / ".python-version").unlink()
+
+        checker = SourceTruthChecker(config)
+        checker.check_all(files=get_changed_files(git_repo, "HEAD"))
+
+        assert {path.name for path in checker._inventory.files} >= {"README.md", "NOTES.md"}
+
+
+class TestChangedSinceCli:
+    """Test the --changed-since option of the CLI."""
+
+    def test_uses_bazel_workspace_directory(self, git_repo, tmp_path_factory, monkeypatch):
+        """Under bazel run, git and relative paths use the invoking workspace."""
+        monkeypatch.chdir(tmp_path_factory.mktemp("runfiles"))
+        monkeypatch.setenv("BUILD_WORKSPACE_DIRECTORY", str(git_repo))
+        (git_repo / "NOTES.md").write_text("Python 3.10.4\n")
+
+        result = CliRunner().invoke(
+            app,
+            ["check", "--changed-since", "HEAD", "--registry", str(REGISTRY_PATH), "--no-cache"],
+        )
+
+        assert "Limiting scan to 1 file(s)" in result.output
+        assert "NOTES.md" in result.output
+        assert "README.md" not in result.output
+        assert result.exit_code == 2
@@ -0,0 +1,44 @@
+"""Tests for scanning with the different executors."""
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.checker import EXECUTORS, SourceTruthChecker
+
+
+# More files than the checker scans serially regardless of the executor
+DOCUMENT_COUNT = 40
+
+
+@pytest.fixture
+def documents(repo):
+    """Documents with violations, ignored violations and clean content."""
+    for index in range(DOCUMENT_COUNT):
+        lines = [f"# Document {index}", ""]
+        if index % 2:
+            lines.append(f"Requires Python 3.{index % 12}.0")
+        if index % 3 == 0:
+            lines.append("<!-- source-truth-ignore-next-line python_version -- Historical note -->")
+            lines.append("Was tested on Python 3.9.1")
+        if index % 5 == 0:
+            lines.append("Uses Python 3.12.0 as pinned")
+        (repo / f"doc_{index:02d}.md").write_text("\n".join(lines) + "\n")
+    return repo
+
+
+def _check(config, executor):
+    config = config.model_copy(update={"executor": executor, "cache_enabled": False})
+    checker = SourceTruthChecker(config)
+    return checker.check_all()
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_executors_give_identical_results(config, documents, executor):
+    """Thread, process and serial scans report the same violations and ignores."""
+    expected = _check(config, "serial")
+    report = _check(config, executor)
+
+    assert expected.violations
+    assert expected.ignore_summary.total_ignored == 14
+    assert report.violations == expected.violations
+    assert report.ignore_summary == expected.ignore_summary
+    assert report.stats.files_scanned == expected.stats.files_scanned == DOCUMENT_COUNT + 1
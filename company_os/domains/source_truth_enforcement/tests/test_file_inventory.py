@@ -0,0 +1,114 @@
+"""Tests for the shared repository file inventory."""
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.file_inventory import FileInventory
+
+
+EXCLUDED_DIRS = [".git", "node_modules", "__pycache__", ".cache"]
+EXCLUDED_PATTERNS = ["*.min.js", "docs/generated/*.md"]
+MAX_FILE_SIZE = 1024
+
+# Scan patterns of several definitions, as the checker would ask for them
+SCAN_PATTERNS = [
+    ["*.md", "*.py", "*.yaml"],
+    ["*.md", "*.txt"],
+    ["*.js", "*.bazel"],
+    ["BUILD.bazel", "config/*.yaml"],
+]
+
+
+def _legacy_files(root, patterns):
+    """The per-definition walk the checker used before the inventory."""
+    files = []
+    for pattern in patterns:
+        for file_path in root.rglob(pattern):
+            if any(excluded in file_path.parts for excluded in EXCLUDED_DIRS):
+                continue
+            if any(file_path.match(excluded) for excluded in EXCLUDED_PATTERNS):
+                continue
+            if file_path.stat().st_size > MAX_FILE_SIZE:
+                continue
+            files.append(file_path)
+    return files
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A repository with excluded directories, excluded files and large files."""
+    files = {
+        "README.md": "readme",
+        "notes.txt": "notes",
+        "BUILD.bazel": "build",
+        "src/app.py": "print()",
+        "src/BUILD.bazel": "build",
+        "src/app.min.js": "minified",
+        "src/app.js": "script",
+        "src/__pycache__/app.md": "cached",
+        "config/settings.yaml": "a: 1",
+        "config/nested/deep.yaml": "b: 2",
+        "docs/guide.md": "guide",
+        "docs/generated/api.md": "generated",
+        "docs/big.md": "x" * (MAX_FILE_SIZE + 1),
+        "docs/limit.md": "x" * MAX_FILE_SIZE,
+        "web/node_modules/lib/readme.md": "vendored",
+        "web/node_modules/lib/index.js": "vendored",
+        ".git/description.txt": "git",
+        ".cache/results.yaml": "cache",
+        "node_modules.md": "a file, not the excluded directory",
+    }
+    for relative, content in files.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def _inventory(root, **kwargs):
+    return FileInventory(
+        root,
+        excluded_dirs=EXCLUDED_DIRS,
+        excluded_patterns=EXCLUDED_PATTERNS,
+        max_file_size=MAX_FILE_SIZE,
+        **kwargs,
+    )
+
+
+class TestFileInventory:
+    """Test that one pruned walk matches walking once per definition."""
+
+    @pytest.mark.parametrize("patterns", SCAN_PATTERNS)
+    def test_matches_per_definition_walk(self, tree, patterns):
+        inventory = _inventory(tree)
+        assert sorted(set(inventory.files_matching(patterns))) == sorted(
+            set(_legacy_files(tree, patterns))
+        )
+
+    def test_exclusions_and_size_limit(self, tree):
+        names = {path.relative_to(tree).as_posix() for path in _inventory(tree).files}
+        assert "docs/limit.md" in names
+        assert "node_modules.md" in names
+        assert not names & {
+            "docs/big.md",
+            "docs/generated/api.md",
+            "src/app.min.js",
+            "src/__pycache__/app.md",
+            "web/node_modules/lib/readme.md",
+            ".git/description.txt",
+            ".cache/results.yaml",
+        }
+
+    def test_directory_globs_are_pruned(self, tree):
+        (tree / "bazel-out").mkdir()
+        (tree / "bazel-out" / "README.md").write_text("output")
+        inventory = FileInventory(tree, excluded_dirs=["bazel-*"])
+        assert tree / "bazel-out" / "README.md" not in inventory.files
+        assert tree / "README.md" in inventory.files
+
+    def test_explicit_paths_apply_the_same_exclusions(self, tree):
+        paths = [path for path in tree.rglob("*") if path.is_file()]
+        paths.append(tree / "deleted.md")
+        paths.append(tree.parent / "outside.md")
+
+        explicit = _inventory(tree, paths=paths)
+        assert sorted(explicit.files) == sorted(_inventory(tree).files)
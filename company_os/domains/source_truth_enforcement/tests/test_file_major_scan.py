@@ -0,0 +1,107 @@
+"""Tests for checking several definitions with one pass over the files."""
+
+from collections import Counter
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src import checker as checker_module
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+from company_os.domains.source_truth_enforcement.src.ignore_parser import IgnoreParser
+
+from conftest import REGISTRY_PATH
+
+
+# Two definitions whose patterns both match the same documents
+REGISTRY = """\
+version: "1.0"
+registry:
+  python_version:
+    description: "Canonical Python version"
+    source: ".python-version"
+    type: "exact_version"
+    severity: "high"
+    scan_patterns:
+      - "Python 3\\\\.\\\\d+(\\\\.\\\\d+)?"
+    scan_file_types:
+      - "*.md"
+  python_requirement:
+    description: "Python version stated as a requirement"
+    source: ".python-version"
+    type: "exact_version"
+    severity: "medium"
+    scan_patterns:
+      - "Requires Python 3\\\\.\\\\d+(\\\\.\\\\d+)?"
+    scan_file_types:
+      - "*.md"
+global_config:
+  global_exclusions:
+    directories:
+      - ".git"
+      - ".cache"
+"""
+
+DOCUMENTS = ["README.md", "NOTES.md"]
+
+
+@pytest.fixture
+def documents(repo):
+    """Two documents, each violating both definitions."""
+    (repo / REGISTRY_PATH).write_text(REGISTRY)
+    (repo / "NOTES.md").write_text("# Notes\n\nRequires Python 3.10.1\n")
+    return repo
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    """Count file reads and ignore parses per file during a scan."""
+    reads = Counter()
+    parses = Counter()
+
+    def counting_open(file, *args, **kwargs):
+        reads[str(file)] += 1
+        return open(file, *args, **kwargs)
+
+    parse_file_for_ignores = IgnoreParser.parse_file_for_ignores
+
+    def counting_parse(self, content, file_path=""):
+        parses[str(file_path)] += 1
+        return parse_file_for_ignores(self, content, file_path)
+
+    monkeypatch.setattr(checker_module, "open", counting_open, raising=False)
+    monkeypatch.setattr(IgnoreParser, "parse_file_for_ignores", counting_parse)
+    return reads, parses
+
+
+def _checker(config):
+    return SourceTruthChecker(
+        config.model_copy(update={"executor": "serial", "cache_enabled": False})
+    )
+
+
+def test_each_file_is_read_and_parsed_once(config, documents, counters):
+    """Both definitions are checked from a single read and ignore parse."""
+    reads, parses = counters
+
+    report = _checker(config).check_all()
+
+    assert len(report.violations) == 4
+    paths = [str(documents / name) for name in DOCUMENTS]
+    assert {path: reads[path] for path in paths} == {path: 1 for path in paths}
+    assert {path: parses[path] for path in paths} == {path: 1 for path in paths}
+
+
+def test_violations_are_grouped_by_definition(config, documents):
+    """The report lists violations definition by definition, as separate checks would."""
+    checker = _checker(config)
+
+    report = checker.check_all()
+
+    assert [v.definition for v in report.violations] == [
+        "python_version", "python_version", "python_requirement", "python_requirement",
+    ]
+    separately = [
+        violation
+        for name in ("python_version", "python_requirement")
+        for violation in checker.check_definition(name).violations
+    ]
+    assert report.violations == separately
@@ -0,0 +1,242 @@
+"""Tests for parsing and looking up ignore comments."""
+
+import re
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.ignore_parser import (
+    IgnoreIntervals,
+    IgnoreParser,
+)
+
+
+def _search_patterns(line):
+    """Find a directive by trying the patterns one by one, as a reference."""
+    for pattern, directive_type in IgnoreParser.DIRECTIVE_PATTERNS:
+        match = re.search(pattern, line.strip(), re.IGNORECASE)
+        if match:
+            reason = "" if directive_type == "end" else match.group(2).strip()
+            return directive_type, match.group(1), reason
+    return None
+
+
+def _parse(line):
+    """Parse one line into (type, rule name, reason), or None."""
+    directive = IgnoreParser()._parse_line_for_ignore(line, 1)
+    if directive is None:
+        return None
+    return directive.type, directive.rule_name, directive.reason
+
+
+def _ignored_lines(parser, context, rule_name, line_count):
+    """Map every ignored line of a rule to its reason."""
+    lines = {}
+    for line_number in range(1, line_count + 1):
+        ignored, reason = parser.is_line_ignored(line_number, rule_name, context)
+        if ignored:
+            lines[line_number] = reason
+    return lines
+
+
+class TestIgnoreIntervals:
+    """Test flattening ignore ranges into disjoint intervals."""
+
+    def test_disjoint_ranges(self):
+        intervals = IgnoreIntervals([(2, 3, "a"), (7, 9, "b")])
+        assert intervals.starts == [2, 7]
+        assert intervals.ends == [3, 9]
+        assert [intervals.find(line) for line in (1, 2, 3, 4, 7, 9, 10)] == [
+            None, "a", "a", None, "b", "b", None
+        ]
+
+    def test_overlap_keeps_reason_of_earlier_range(self):
+        """Where ranges overlap, the range given first wins."""
+        intervals = IgnoreIntervals([(4, 6, "inner"), (2, 10, "outer")])
+        assert [intervals.find(line) for line in range(1, 12)] == [
+            None, "outer", "outer", "inner", "inner", "inner",
+            "outer", "outer", "outer", "outer", None,
+        ]
+        assert len(intervals) == 3
+
+    def test_contiguous_ranges_with_same_reason_are_merged(self):
+        intervals = IgnoreIntervals([(2, 4, "same"), (5, 6, "same"), (3, 5, "same")])
+        assert len(intervals) == 1
+        assert (intervals.starts, intervals.ends) == ([2], [6])
+
+    def test_empty_ranges_are_skipped(self):
+        """Blocks without lines between start and end ignore nothing."""
+        intervals = IgnoreIntervals([(5, 4, "empty")])
+        assert len(intervals) == 0
+        assert intervals.find(4) is None
+        assert intervals.find(5) is None
+
+
+class TestIgnoreParser:
+    """Test ignore lookups on parsed file content."""
+
+    def test_next_line_ignores_only_the_following_line(self):
+        content = "\n".join([
+            "# source-truth-ignore-next-line dependencies -- Legacy",
+            "pip install -r requirements.txt",
+            "pip install -r requirements.txt",
+        ])
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert _ignored_lines(parser, context, "dependencies", 3) == {2: "Legacy"}
+
+    def test_next_line_ignores_are_independent_of_lookup_order(self):
+        """Checking other lines first does not use up a next-line ignore."""
+        content = "\n".join([
+            "requirements.txt",
+            "<!-- source-truth-ignore-next-line dependencies -- Example -->",
+            "requirements.txt",
+        ])
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert parser.is_line_ignored(1, "dependencies", context) == (False, None)
+        assert parser.is_line_ignored(3, "dependencies", context) == (True, "Example")
+        assert parser.is_line_ignored(3, "dependencies", context) == (True, "Example")
+
+    def test_overlapping_blocks_and_next_line(self):
+        """Next-line ignores win over blocks, and earlier blocks over later ones."""
+        content = "\n".join([
+            "# source-truth-ignore-start dependencies -- Outer",           # 1
+            "requirements.txt",                                             # 2
+            "# source-truth-ignore-next-line dependencies -- Single line",  # 3
+            "requirements.txt",                                             # 4
+            "# source-truth-ignore-end dependencies",                       # 5
+            "requirements.txt",                                             # 6
+            "# source-truth-ignore-start dependencies -- Second",           # 7
+            "requirements.txt",                                             # 8
+            "# source-truth-ignore-end dependencies",                       # 9
+        ])
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert _ignored_lines(parser, context, "dependencies", 9) == {
+            2: "Outer", 3: "Outer", 4: "Single line", 8: "Second",
+        }
+
+    def test_lines_only_end_at_newlines(self):
+        """Directive lines are numbered like violations, ignoring form feeds."""
+        content = "\n".join([
+            "intro\x0cpage",
+            "<!-- source-truth-ignore-next-line dependencies -- Example -->",
+            "requirements.txt",
+        ])
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert _ignored_lines(parser, context, "dependencies", 4) == {3: "Example"}
+
+    def test_intervals_are_per_rule(self):
+        content = "\n".join([
+            "# source-truth-ignore-start dependencies -- Dependency examples",
+            "Python 3.8 with requirements.txt",
+            "# source-truth-ignore-end dependencies",
+            "# source-truth-ignore-next-line python_version -- Old version",
+            "Python 3.8 with requirements.txt",
+        ])
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert set(context.ignore_intervals) == {"dependencies", "python_version"}
+        assert _ignored_lines(parser, context, "dependencies", 5) == {2: "Dependency examples"}
+        assert _ignored_lines(parser, context, "python_version", 5) == {5: "Old version"}
+        assert _ignored_lines(parser, context, "bazel_version", 5) == {}
+
+    def test_file_ignore_covers_every_line(self):
+        content = "<!-- source-truth-ignore-file dependencies -- Generated file -->\nrequirements.txt"
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert parser.is_line_ignored(2, "dependencies", context) == (True, "Generated file")
+
+    def test_unclosed_block_is_reported(self):
+        content = "# source-truth-ignore-start dependencies -- Never closed\nrequirements.txt"
+        parser = IgnoreParser()
+        context = parser.parse_file_for_ignores(content)
+
+        assert parser.is_line_ignored(2, "dependencies", context) == (False, None)
+        assert parser.validate_ignore_blocks(context) == [
+            "Unclosed ignore block for rule 'dependencies' started at line 1"
+        ]
+
+
+class TestDirectiveParsing:
+    """Test recognizing directives with the combined directive regex."""
+
+    @pytest.mark.parametrize("line, expected", [
+        ("# source-truth-ignore-next-line dependencies -- Legacy docs",
+         ("next-line", "dependencies", "Legacy docs")),
+        ("# source-truth-ignore-start dependencies -- Examples",
+         ("start", "dependencies", "Examples")),
+        ("# source-truth-ignore-end dependencies", ("end", "dependencies", "")),
+        ("# source-truth-ignore-file python_version -- Generated",
+         ("file", "python_version", "Generated")),
+        ("<!-- source-truth-ignore-next-line dependencies -- Legacy docs -->",
+         ("next-line", "dependencies", "Legacy docs")),
+        ("<!-- source-truth-ignore-start dependencies -- Examples -->",
+         ("start", "dependencies", "Examples")),
+        ("<!-- source-truth-ignore-end dependencies -->", ("end", "dependencies", "")),
+        ("<!-- source-truth-ignore-file python_version -- Generated -->",
+         ("file", "python_version", "Generated")),
+    ])
+    def test_directive_forms(self, line, expected):
+        """Every hash and HTML form yields its type, rule name and reason."""
+        assert _parse(line) == expected
+        assert _parse(f"  {line}  ") == expected
+        assert _parse(line) == _search_patterns(line)
+
+    @pytest.mark.parametrize("line, expected", [
+        ("# SOURCE-TRUTH-IGNORE-NEXT-LINE dependencies -- Shouting",
+         ("next-line", "dependencies", "Shouting")),
+        ("<!-- Source-Truth-Ignore-End dependencies -->", ("end", "dependencies", "")),
+        ("<!-- source-truth-ignore-FILE dependencies -- Mixed -->",
+         ("file", "dependencies", "Mixed")),
+    ])
+    def test_directives_are_case_insensitive(self, line, expected):
+        assert _parse(line) == expected
+        assert _parse(line) == _search_patterns(line)
+
+    @pytest.mark.parametrize("line, expected", [
+        # Hash patterns come before HTML ones, wherever they appear in the line
+        ("<!-- source-truth-ignore-start python_version -- Html --> "
+         "# source-truth-ignore-next-line dependencies -- Hash",
+         ("next-line", "dependencies", "Hash")),
+        # Among hash patterns, start is tried before file
+        ("# source-truth-ignore-file a -- x # source-truth-ignore-start b -- y",
+         ("start", "b", "y")),
+        # Among HTML patterns, next-line is tried before end
+        ("<!-- source-truth-ignore-end a --> <!-- source-truth-ignore-next-line b -- z -->",
+         ("next-line", "b", "z")),
+    ])
+    def test_two_directives_in_one_line(self, line, expected):
+        """The directive whose pattern is listed first wins."""
+        assert _parse(line) == expected
+        assert _parse(line) == _search_patterns(line)
+
+    @pytest.mark.parametrize("line", [
+        "source-truth-ignore directives are described below",
+        "# source-truth-ignore-next-line dependencies",
+        "<!-- source-truth-ignore-start dependencies -->",
+    ])
+    def test_incomplete_directives_are_not_recognized(self, line):
+        assert _parse(line) is None
+        assert _search_patterns(line) is None
+
+    def test_content_without_token_has_no_directives(self):
+        content = "# Ignore nothing\n\n# ignore-next-line dependencies -- No token\n"
+        assert list(IgnoreParser()._iter_directives(content)) == []
+
+    def test_directives_keep_their_line_numbers(self):
+        content = "\n".join([
+            "intro",
+            "<!-- source-truth-ignore-start dependencies -- Examples -->",
+            "requirements.txt",
+            "<!-- source-truth-ignore-end dependencies -->",
+        ])
+        directives = list(IgnoreParser()._iter_directives(content))
+        assert [(d.type, d.line_number) for d in directives] == [("start", 2), ("end", 4)]
@@ -0,0 +1,84 @@
+"""Tests for resolving match offsets to lines."""
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.checker import LineIndex, SourceTruthChecker
+
+
+class TestLineIndex:
+    """Test line numbers and lines of the index."""
+
+    @pytest.mark.parametrize("offset, expected", [
+        (0, 1),   # first character
+        (5, 1),   # newline ending the first line
+        (6, 2),   # first character after it
+        (11, 2),  # newline ending the second line
+        (12, 3),  # last line, without a trailing newline
+        (16, 3),  # last character
+    ])
+    def test_line_number(self, offset, expected):
+        index = LineIndex("first\nsecnd\nthird")
+        assert index.line_number(offset) == expected
+
+    def test_line_number_matches_counting_newlines(self):
+        content = "a\n\nbb\nccc\n\nd\n"
+        index = LineIndex(content)
+        for offset in range(len(content)):
+            assert index.line_number(offset) == content[:offset].count("\n") + 1
+
+    @pytest.mark.parametrize("content, lines", [
+        ("", []),
+        ("one", ["one"]),
+        ("one\ntwo\n", ["one", "two"]),
+        ("one\n\ntwo", ["one", "", "two"]),
+        ("one\r\ntwo\r\n", ["one", "two"]),
+    ])
+    def test_lines(self, content, lines):
+        assert LineIndex(content).lines == lines
+
+    def test_lines_only_end_at_newlines(self):
+        """Characters splitlines() also splits on stay inside their line."""
+        content = "page\x0cbreak\nlone\rreturn\nseparator\u2028here\nPython 3.11.2\n"
+        index = LineIndex(content)
+
+        line_number = index.line_number(content.index("Python"))
+        assert line_number == 4
+        assert index.lines[line_number - 1] == "Python 3.11.2"
+        assert len(index.lines) == len(index.offsets) - 1
+
+
+class TestLineContext:
+    """Test the context shown around a violation."""
+
+    @pytest.fixture
+    def checker(self, config, repo):
+        return SourceTruthChecker(config)
+
+    def test_context_around_line(self, checker):
+        index = LineIndex("\n".join(f"line {n}" for n in range(1, 8)))
+
+        assert checker._get_line_context(index, 4).splitlines() == [
+            "       2: line 2",
+            "       3: line 3",
+            ">>>    4: line 4",
+            "       5: line 5",
+            "       6: line 6",
+        ]
+
+    def test_context_is_clipped_at_file_edges(self, checker):
+        index = LineIndex("first\nsecond\nlast")
+
+        assert checker._get_line_context(index, 1).splitlines() == [
+            ">>>    1: first",
+            "       2: second",
+            "       3: last",
+        ]
+        assert checker._get_line_context(index, 3).splitlines()[-1] == ">>>    3: last"
+
+    def test_context_matches_line_numbers_with_form_feeds(self, checker):
+        content = "intro\x0cpage\nPython 3.11.2\nend"
+        index = LineIndex(content)
+        line_number = index.line_number(content.index("Python"))
+
+        context = checker._get_line_context(index, line_number, context_lines=0)
+        assert context == ">>>    2: Python 3.11.2"
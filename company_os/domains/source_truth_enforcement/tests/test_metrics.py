@@ -0,0 +1,128 @@
+"""Tests for scan metrics and the --profile output."""
+
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from company_os.domains.source_truth_enforcement.adapters.cli import source_truth_cli
+from company_os.domains.source_truth_enforcement.adapters.cli.source_truth_cli import app
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+
+from conftest import REGISTRY_PATH
+
+
+PATTERN = r"Python 3\.\d+(\.\d+)?"
+
+# The registry, the source of truth and the two documents
+FILES_ENUMERATED = 4
+
+NOTES = """\
+# Notes
+
+Pinned to Python 3.12.0
+
+<!-- source-truth-ignore-next-line python_version -- Historical note -->
+Was tested on Python 3.9.1
+"""
+
+
+@pytest.fixture
+def documents(repo):
+    """The stale README plus notes with a matching and an ignored version."""
+    (repo / "NOTES.md").write_text(NOTES)
+    # Keep the documents out of the result cache's racy window
+    for name in ("README.md", "NOTES.md"):
+        stat = (repo / name).stat()
+        os.utime(repo / name, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 * 10**9))
+    return repo
+
+
+def _document_bytes(repo):
+    return sum((repo / name).stat().st_size for name in ("README.md", "NOTES.md"))
+
+
+class TestScanMetrics:
+    """Test the metrics collected by the checker."""
+
+    def test_first_scan_reads_every_file(self, config, documents):
+        """A cold scan reads each document once and counts its matches."""
+        report = SourceTruthChecker(config).check_all()
+        metrics = report.stats.metrics
+
+        assert metrics.files_enumerated == FILES_ENUMERATED
+        assert metrics.files_read == 2
+        assert metrics.files_cached == 0
+        assert metrics.bytes_read == _document_bytes(documents)
+        assert report.stats.files_scanned == 2
+
+        definition = metrics.definitions["python_version"]
+        assert definition.files_scanned == 2
+        assert definition.files_matched == 2
+        assert definition.matches == 3
+        assert definition.matches_by_pattern == {PATTERN: 3}
+        assert definition.violations == 1
+        assert definition.ignored == 1
+
+        slowest = {timing.file_path: timing.bytes_read for timing in metrics.slowest_files}
+        assert slowest == {
+            str(documents / name): (documents / name).stat().st_size
+            for name in ("README.md", "NOTES.md")
+        }
+
+    def test_cached_scan_reads_nothing(self, config, documents):
+        """A warm scan answers every document from the result cache."""
+        SourceTruthChecker(config).check_all()
+
+        report = SourceTruthChecker(config).check_all()
+        metrics = report.stats.metrics
+
+        assert metrics.files_read == 0
+        assert metrics.files_cached == 2
+        assert metrics.bytes_read == 0
+        assert metrics.slowest_files == []
+        assert metrics.definitions["python_version"].violations == 1
+        # Files answered from the cache still count as scanned
+        assert report.stats.files_scanned == 2
+
+
+class TestProfileCli:
+    """Test the metrics in the CLI output."""
+
+    def test_json_output_includes_metrics(self, documents, monkeypatch):
+        """The JSON report carries the metrics of the scan."""
+        monkeypatch.chdir(documents)
+        # Keep the console from wrapping long JSON lines at the terminal width
+        monkeypatch.setattr(source_truth_cli.console, "soft_wrap", True)
+
+        result = CliRunner().invoke(
+            app,
+            ["check", "--all", "--registry", str(REGISTRY_PATH), "--no-cache", "--format", "json"],
+        )
+
+        assert result.exit_code == 2
+        report = json.loads(result.output[result.output.index("{"):])
+        metrics = report["stats"]["metrics"]
+        assert metrics["files_enumerated"] == FILES_ENUMERATED
+        assert metrics["files_read"] == 2
+        assert metrics["files_cached"] == 0
+        assert metrics["bytes_read"] == _document_bytes(documents)
+        assert metrics["definitions"]["python_version"]["matches_by_pattern"] == {PATTERN: 3}
+        assert len(metrics["slowest_files"]) == 2
+
+    def test_profile_shows_metric_tables(self, documents, monkeypatch):
+        """--profile prints the phase, definition, pattern and file tables."""
+        monkeypatch.chdir(documents)
+
+        result = CliRunner().invoke(
+            app,
+            ["check", "--all", "--registry", str(REGISTRY_PATH), "--no-cache", "--profile"],
+        )
+
+        assert result.exit_code == 2
+        for title in ("Scan Profile", "Definitions", "Matches per Pattern", "Slowest Files"):
+            assert title in result.output
+        assert f"{FILES_ENUMERATED} files enumerated" in result.output
+        assert "2 files, " in result.output
+        assert "(0 cached)" in result.output
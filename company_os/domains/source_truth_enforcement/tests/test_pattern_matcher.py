@@ -0,0 +1,102 @@
+"""Tests for the combined prefilter and per-definition pattern matching."""
+
+import re
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+from company_os.domains.source_truth_enforcement.src.pattern_matcher import PatternMatcher
+
+
+PATTERNS = {
+    "python_version": [r"Python 3\.\d+(\.\d+)?", r"python3\.\d+"],
+    "dependencies": [r"requirements\.txt", r"pip install -r requirements\.txt"],
+}
+
+
+def _matched(matches):
+    return [(pattern, match.group(0)) for pattern, match in matches]
+
+
+class TestPrefilter:
+    """Test the combined alternation that rules out files."""
+
+    def test_content_without_any_pattern_is_ruled_out(self):
+        matcher = PatternMatcher(PATTERNS)
+        assert not matcher.could_match("# Nothing to see here\n")
+
+    def test_content_with_any_pattern_passes(self):
+        matcher = PatternMatcher(PATTERNS)
+        assert matcher.could_match("Run python3.12 -m pytest")
+        assert matcher.could_match("See REQUIREMENTS.TXT")
+
+    def test_prefilter_agrees_with_individual_patterns(self):
+        matcher = PatternMatcher(PATTERNS)
+        samples = ["", "Python 3", "Python 3.12", "pip install", "requirements.txt", "py312"]
+        for content in samples:
+            has_match = any(matcher.matches_for(name, content) for name in PATTERNS)
+            assert matcher.could_match(content) == has_match, content
+
+    def test_backreferences_disable_the_prefilter(self):
+        """Patterns with backreferences cannot be combined, so every file is confirmed."""
+        matcher = PatternMatcher({"quoted": [r"(['\"])3\.\d+\1"]})
+        assert matcher.could_match("nothing")
+        assert _matched(matcher.matches_for("quoted", "version '3.12'")) == [
+            (r"(['\"])3\.\d+\1", "'3.12'")
+        ]
+
+    def test_invalid_pattern_is_left_out_of_the_prefilter(self):
+        matcher = PatternMatcher({"broken": ["(unclosed"], "dependencies": [r"requirements\.txt"]})
+        assert not matcher.could_match("clean content")
+        assert matcher.could_match("requirements.txt")
+        with pytest.raises(re.error):
+            matcher.matches_for("broken", "requirements.txt")
+
+
+class TestConfirm:
+    """Test confirming matches with the individual patterns."""
+
+    def test_overlapping_matches_of_different_patterns_are_kept(self):
+        """A combined alternation would report the overlapping text only once."""
+        matcher = PatternMatcher(PATTERNS)
+        content = "pip install -r requirements.txt"
+        assert _matched(matcher.matches_for("dependencies", content)) == [
+            (r"requirements\.txt", "requirements.txt"),
+            (r"pip install -r requirements\.txt", "pip install -r requirements.txt"),
+        ]
+
+    def test_matches_are_per_definition(self):
+        matcher = PatternMatcher(PATTERNS)
+        content = "Python 3.11.2 and requirements.txt"
+        assert _matched(matcher.matches_for("python_version", content)) == [
+            (r"Python 3\.\d+(\.\d+)?", "Python 3.11.2")
+        ]
+        assert matcher.matches_for("unknown", content) == []
+        assert "python_version" in matcher
+        assert "unknown" not in matcher
+
+    def test_flags_apply_to_every_pattern(self):
+        matcher = PatternMatcher(PATTERNS)
+        assert _matched(matcher.matches_for("python_version", "PYTHON 3.12")) == [
+            (r"Python 3\.\d+(\.\d+)?", "PYTHON 3.12")
+        ]
+
+
+class TestCheckerPrefilter:
+    """Test how the checker uses the prefilter."""
+
+    def test_files_ruled_out_are_not_checked(self, config, repo, monkeypatch):
+        (repo / "CHANGELOG.md").write_text("# Changes\n\nNothing relevant.\n")
+        checked = []
+        original = SourceTruthChecker._definition_matches
+
+        def record(self, name, definition, source_value, content):
+            checked.append(content)
+            return original(self, name, definition, source_value, content)
+
+        monkeypatch.setattr(SourceTruthChecker, "_definition_matches", record)
+        config.cache_enabled = False
+        report = SourceTruthChecker(config).check_all()
+
+        assert len(report.violations) == 1
+        assert checked == [(repo / "README.md").read_text()]
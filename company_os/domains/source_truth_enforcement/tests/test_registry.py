@@ -0,0 +1,111 @@
+"""Tests for loading and caching the source truth registry."""
+
+import os
+
+import pytest
+
+from company_os.domains.source_truth_enforcement.src import registry as registry_module
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+from company_os.domains.source_truth_enforcement.src.registry import SourceTruthRegistry
+
+from conftest import REGISTRY_PATH
+
+
+@pytest.fixture
+def registry_path(repo):
+    return repo / REGISTRY_PATH
+
+
+def _edit(path, old, new):
+    """Replace text in a file and move its mtime so the edit is always detected."""
+    stat = path.stat()
+    path.write_text(path.read_text().replace(old, new))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestRegistryCache:
+    """Test sharing parsed registries within the process."""
+
+    def test_unchanged_registry_is_parsed_once(self, registry_path, monkeypatch):
+        SourceTruthRegistry(registry_path)
+
+        def fail(self):
+            raise AssertionError("registry was parsed again")
+
+        monkeypatch.setattr(SourceTruthRegistry, "_load_registry", fail)
+        second = SourceTruthRegistry(registry_path)
+        assert list(second.definitions) == ["python_version"]
+
+    def test_instances_do_not_share_parsed_objects(self, registry_path):
+        """Changes through one instance do not affect others."""
+        first = SourceTruthRegistry(registry_path)
+        first.definitions["python_version"].scan_file_types.append("*.py")
+        first.definitions.pop("python_version")
+        first.global_config.global_exclusions["directories"].append("docs")
+        first.raw_data["registry"].clear()
+
+        second = SourceTruthRegistry(registry_path)
+        assert second.definitions["python_version"].scan_file_types == ["*.md"]
+        assert second.global_config.global_exclusions["directories"] == [".git", ".cache"]
+        assert list(second.raw_data["registry"]) == ["python_version"]
+
+    def test_changed_registry_is_parsed_again(self, registry_path):
+        SourceTruthRegistry(registry_path)
+        _edit(registry_path, '"*.md"', '"*.txt"')
+
+        registry = SourceTruthRegistry(registry_path)
+        assert registry.definitions["python_version"].scan_file_types == ["*.txt"]
+
+
+class TestReload:
+    """Test reloading a registry instance."""
+
+    def test_unchanged_registry_is_kept(self, registry_path):
+        registry = SourceTruthRegistry(registry_path)
+        assert registry.reload() is False
+
+    def test_changed_registry_is_reloaded(self, registry_path):
+        registry = SourceTruthRegistry(registry_path)
+        _edit(registry_path, '"high"', '"low"')
+
+        assert registry.reload() is True
+        assert registry.definitions["python_version"].severity == "low"
+
+    def test_force_reparses_and_drops_shared_parse(self, registry_path, monkeypatch):
+        registry = SourceTruthRegistry(registry_path)
+        loads = []
+        original = SourceTruthRegistry._load_registry
+        monkeypatch.setattr(
+            SourceTruthRegistry,
+            "_load_registry",
+            lambda self: loads.append(self.registry_path) or original(self),
+        )
+
+        assert registry.reload(force=True) is True
+        assert loads == [registry_path]
+        key = str(registry_path.resolve())
+        assert registry_module._parsed_registries[key][0] == registry._signature
+
+    def test_reload_clears_source_values(self, registry_path, repo):
+        registry = SourceTruthRegistry(registry_path)
+        assert registry.get_source_value("python_version") == "3.12.0"
+
+        _edit(registry_path, '".python-version"', '".tool-version"')
+        (repo / ".tool-version").write_text("3.13.1\n")
+        registry.reload()
+        assert registry.get_source_value("python_version") == "3.13.1"
+
+    def test_source_value_follows_source_file(self, registry_path, repo):
+        registry = SourceTruthRegistry(registry_path)
+        assert registry.get_source_value("python_version") == "3.12.0"
+
+        _edit(repo / ".python-version", "3.12.0", "3.12.1")
+        assert registry.get_source_value("python_version") == "3.12.1"
+
+    def test_checker_picks_up_registry_edits(self, config, registry_path):
+        """A long-lived checker uses the current registry on every check."""
+        checker = SourceTruthChecker(config)
+        assert len(checker.check_all().violations) == 1
+
+        _edit(registry_path, '"*.md"', '"*.txt"')
+        assert checker.check_all().violations == []
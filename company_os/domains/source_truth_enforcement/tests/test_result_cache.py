@@ -0,0 +1,195 @@
+"""Tests for the persistent scan result cache."""
+
+import json
+import os
+
+from company_os.domains.source_truth_enforcement.src.checker import SourceTruthChecker
+from company_os.domains.source_truth_enforcement.src.models import (
+    IgnoredViolation,
+    Severity,
+    Violation,
+)
+from company_os.domains.source_truth_enforcement.src.result_cache import (
+    RESULT_CACHE_VERSION,
+    ResultCache,
+    hash_content,
+)
+
+
+def _violation(file_path):
+    return Violation(
+        definition="python_version",
+        file_path=str(file_path),
+        line_number=3,
+        message="Found 3.11.2 but source of truth is 3.12.0",
+        severity=Severity.HIGH,
+    )
+
+
+def _backdate(file_path, seconds=10):
+    """Move a file's mtime into the past, out of the racy window."""
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+    return file_path.stat()
+
+
+def _ignored(file_path):
+    return IgnoredViolation(
+        violation=_violation(file_path),
+        reason="Historical note",
+        ignore_type="next-line",
+    )
+
+
+class TestResultCache:
+    """Test storing and reusing results."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored results are returned after saving and loading the cache."""
+        document = tmp_path / "README.md"
+        document.write_text("Python 3.11.2\n")
+        _backdate(document)
+        cache_path = tmp_path / ".cache" / "results.json"
+
+        cache = ResultCache(cache_path)
+        cache.store(
+            document, document.stat(), hash_content("Python 3.11.2\n"),
+            "python_version", "fingerprint", "3.12.0",
+            [_violation(document)], [_ignored(document)],
+        )
+        cache.save()
+
+        loaded = ResultCache(cache_path)
+        loaded.load()
+        entry = loaded.get_entry(document)
+        assert ResultCache.matches_stat(entry, document.stat())
+        violations, ignored = ResultCache.cached_result(
+            entry, "python_version", "fingerprint", "3.12.0"
+        )
+        assert violations == [_violation(document)]
+        assert ignored == [_ignored(document)]
+
+    def test_changed_fingerprint_or_source_value_invalidates(self, tmp_path):
+        """Results are only reused for the definition and value they were computed with."""
+        document = tmp_path / "README.md"
+        document.write_text("Python 3.11.2\n")
+        cache = ResultCache(tmp_path / "results.json")
+        cache.store(
+            document, document.stat(), hash_content("Python 3.11.2\n"),
+            "python_version", "fingerprint", "3.12.0", [_violation(document)], [],
+        )
+        entry = cache.get_entry(document)
+
+        assert ResultCache.cached_result(entry, "python_version", "fingerprint", "3.12.0")
+        assert ResultCache.cached_result(entry, "python_version", "changed", "3.12.0") is None
+        assert ResultCache.cached_result(entry, "python_version", "fingerprint", "3.13.0") is None
+        assert ResultCache.cached_result(entry, "dependencies", "fingerprint", "3.12.0") is None
+
+    def test_other_version_is_discarded(self, tmp_path):
+        """A cache written by another version of the checker is not used."""
+        document = tmp_path / "README.md"
+        document.write_text("Python 3.11.2\n")
+        cache_path = tmp_path / "results.json"
+        cache = ResultCache(cache_path)
+        cache.store(
+            document, document.stat(), hash_content("Python 3.11.2\n"),
+            "python_version", "fingerprint", "3.12.0", [], [],
+        )
+        cache.save()
+
+        data = json.loads(cache_path.read_text())
+        data["version"] = RESULT_CACHE_VERSION - 1
+        cache_path.write_text(json.dumps(data))
+
+        cache.load()
+        assert cache.get_entry(document) is None
+
+    def test_refresh_only_updates_matching_content(self, tmp_path):
+        """Stat data is refreshed for an entry whose content hash still matches."""
+        document = tmp_path / "README.md"
+        document.write_text("Python 3.11.2\n")
+        old_stat = document.stat()
+        cache = ResultCache(tmp_path / "results.json")
+        cache.store(
+            document, old_stat, hash_content("Python 3.11.2\n"),
+            "python_version", "fingerprint", "3.12.0", [], [],
+        )
+
+        new_stat = _backdate(document)
+
+        cache.refresh(document, new_stat, hash_content("Python 3.13.0\n"))
+        assert not ResultCache.matches_stat(cache.get_entry(document), new_stat)
+
+        cache.refresh(document, new_stat, hash_content("Python 3.11.2\n"))
+        assert ResultCache.matches_stat(cache.get_entry(document), new_stat)
+
+    def test_recently_modified_file_is_racy(self, tmp_path):
+        """Stat data recorded within the racy window of a write is not trusted."""
+        document = tmp_path / "README.md"
+        document.write_text("Python 3.11.2\n")
+        cache = ResultCache(tmp_path / "results.json")
+        cache.store(
+            document, document.stat(), hash_content("Python 3.11.2\n"),
+            "python_version", "fingerprint", "3.12.0", [], [],
+        )
+
+        assert not ResultCache.matches_stat(cache.get_entry(document), document.stat())
+
+
+class TestCheckerResultCache:
+    """Test how the checker uses the result cache."""
+
+    def test_touched_file_refreshes_entry(self, config, repo):
+        """A touched but unchanged file is served from the cache and re-stamped."""
+        readme = repo / "README.md"
+        first = SourceTruthChecker(config).check_all()
+        assert len(first.violations) == 1
+
+        _backdate(readme)
+
+        checker = SourceTruthChecker(config)
+        second = checker.check_all()
+        assert second.violations == first.violations
+        assert checker.result_cache.hits == 1
+        assert checker.result_cache.misses == 0
+
+        cache = ResultCache(checker.result_cache.cache_path)
+        cache.load()
+        assert ResultCache.matches_stat(cache.get_entry(readme), readme.stat())
+
+    def test_changed_file_is_a_miss(self, config, repo):
+        """Edited content is scanned again and counted as a miss."""
+        readme = repo / "README.md"
+        SourceTruthChecker(config).check_all()
+        readme.write_text("# Project\n\nRequires Python 3.12.0 or Python 3.10.1\n")
+
+        checker = SourceTruthChecker(config)
+        report = checker.check_all()
+        assert [v.line_number for v in report.violations] == [3]
+        assert "3.10.1" in report.violations[0].message
+        assert checker.result_cache.misses == 1
+
+    def test_same_size_edit_in_same_tick_is_rescanned(self, config, repo):
+        """An edit that keeps both size and mtime is caught by the content hash."""
+        readme = repo / "README.md"
+        first = SourceTruthChecker(config).check_all()
+        assert "3.11.2" in first.violations[0].message
+
+        stat = readme.stat()
+        readme.write_text("# Project\n\nRequires Python 3.10.2\n")
+        os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert readme.stat().st_size == stat.st_size
+
+        checker = SourceTruthChecker(config)
+        second = checker.check_all()
+        assert "3.10.2" in second.violations[0].message
+        assert checker.result_cache.misses == 1
+
+    def test_disabled_cache_skips_hashing(self, config, repo):
+        """Without a cache the checker does not hash file contents."""
+        config.cache_enabled = False
+        checker = SourceTruthChecker(config)
+        report = checker.check_all()
+        assert checker.result_cache is None
+        assert len(report.violations) == 1
+        assert not (repo / ".cache").exists()